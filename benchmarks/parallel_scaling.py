@@ -0,0 +1,51 @@
+"""Benchmark of the scaling of parallel analyses with the number of processes.
+
+Run it with ``python benchmarks/parallel_scaling.py [n_words]``. It prints
+the time taken by Analyzer.run_all_analyses and the speedup over a single
+process for 1 up to the number of CPU cores.
+"""
+
+import os
+import random
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from wdiff.analyzer import Analyzer
+
+LETTERS = "aábcdeéfghiíjklmnñoópqrstuúüvwxyz"
+
+
+def make_words(n_words, seed=0):
+    """Create random Spanish-like words."""
+    rng = random.Random(seed)
+    return ["".join(rng.choices(LETTERS, k=rng.randint(2, 12))) for _ in range(n_words)]
+
+
+def time_analyses(words, engine, jobs):
+    """Time run_all_analyses with a pool of jobs processes already started."""
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        # warm up the pool so the start up time of the processes is excluded
+        list(executor.map(abs, range(jobs)))
+        analyzer = Analyzer(words, engine=engine)
+        start = time.perf_counter()
+        analyzer.run_all_analyses(jobs=jobs, executor=executor)
+        return time.perf_counter() - start
+
+
+def main():
+    """Print the time and speedup for each number of processes."""
+    n_words = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    words = make_words(n_words)
+    print(f"{n_words} words, {os.cpu_count()} cores")
+    print("engine  jobs  seconds  speedup")
+    for engine in ["word", "numpy"]:
+        serial_time = None
+        for jobs in range(1, os.cpu_count() + 1):
+            elapsed = time_analyses(words, engine, jobs)
+            serial_time = serial_time or elapsed
+            print(f"{engine:6}  {jobs:4}  {elapsed:7.2f}  {serial_time / elapsed:7.2f}")
+
+
+if __name__ == "__main__":
+    main()
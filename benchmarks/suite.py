@@ -0,0 +1,285 @@
+"""Benchmark suite of the Word and Analyzer classes.
+
+Run it with ``python benchmarks/suite.py [--sizes 1000 100000 ...]``, or
+with ``inv benchmarks`` or ``nox -s benchmarks``. It measures the time, the
+throughput and the peak memory of creating words, computing their
+properties, running all analyses with each engine, accessing the results
+and saving them, plus the time it takes to import wdiff.
+
+The words are sampled from a synthetic Spanish-like vocabulary with a Zipf
+distribution, so larger corpora repeat words like real texts do.
+
+The measurements are saved as JSON in benchmarks/results, one file per
+version of wdiff. Use ``--compare`` with the file of a previous version to
+see the regressions.
+"""
+
+import argparse
+import json
+import platform
+import random
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime, timezone
+from pathlib import Path
+
+import wdiff
+from wdiff.analyzer import ENGINES, FEATURES, Analyzer
+from wdiff.word import Word
+
+RESULTS_DIR = Path(__file__).parent / "results"
+DEFAULT_SIZES = [1_000, 10_000, 100_000]
+VOCABULARY_SIZE = 50_000
+# creating more word objects than this takes too much memory
+WORD_OBJECTS_LIMIT = 1_000_000
+# ratio of the time or memory of two versions considered a regression
+REGRESSION_THRESHOLD = 1.1
+
+# syllables are built from weighted onsets, vowels and codas
+ONSETS = {
+    "": 10, "b": 4, "c": 6, "ch": 1, "d": 6, "f": 2, "g": 2, "gu": 1,
+    "h": 2, "j": 2, "l": 5, "ll": 1, "m": 5, "n": 4, "ñ": 1, "p": 5,
+    "qu": 2, "r": 6, "s": 7, "t": 6, "v": 3, "y": 1, "z": 1, "br": 1,
+    "tr": 2, "pl": 1, "cr": 1, "gr": 1,
+}  # fmt: skip
+VOWELS = {
+    "a": 12, "e": 12, "i": 6, "o": 8, "u": 4, "á": 1, "é": 1, "í": 1,
+    "ó": 1, "ú": 1, "ue": 2, "ie": 2, "io": 1,
+}  # fmt: skip
+CODAS = {"": 30, "n": 5, "s": 6, "r": 4, "l": 3, "d": 1, "z": 1, "y": 1}
+
+
+def make_vocabulary(n_words, rng):
+    """Create distinct Spanish-like words of 1 to 4 syllables."""
+    vocabulary = set()
+    while len(vocabulary) < n_words:
+        syllables = rng.choices([1, 2, 3, 4], weights=[2, 5, 4, 2])[0]
+        parts = []
+        for _ in range(syllables):
+            parts += rng.choices(list(ONSETS), weights=list(ONSETS.values()))
+            parts += rng.choices(list(VOWELS), weights=list(VOWELS.values()))
+            parts += rng.choices(list(CODAS), weights=list(CODAS.values()))
+        vocabulary.add("".join(parts))
+    return sorted(vocabulary)
+
+
+def make_corpus(n_words, seed=0):
+    """Sample the words of a corpus from a vocabulary with Zipf's law."""
+    rng = random.Random(seed)
+    vocabulary = make_vocabulary(min(n_words, VOCABULARY_SIZE), rng)
+    rng.shuffle(vocabulary)
+    weights = [1 / rank for rank in range(1, len(vocabulary) + 1)]
+    return rng.choices(vocabulary, weights=weights, k=n_words)
+
+
+def _create_words(texts):
+    return [Word(text) for text in texts]
+
+
+def _create_words_with_features(texts):
+    words = _create_words(texts)
+    for word in words:
+        for feature in FEATURES:
+            getattr(word, feature)
+    return words
+
+
+def _get_property(name):
+    def get_property(words):
+        for word in words:
+            getattr(word, name)
+
+    return get_property
+
+
+def _run_all_analyses(engine):
+    def setup(texts):
+        return Analyzer(texts, engine=engine)
+
+    return setup, Analyzer.run_all_analyses
+
+
+def _analyzed(texts):
+    analyzer = Analyzer(texts, engine="numpy")
+    analyzer.run_all_analyses()
+    return analyzer
+
+
+def _save_results(format):  # noqa: A002
+    def save_results(analyzer):
+        with tempfile.TemporaryDirectory() as directory:
+            analyzer.save_results(f"{directory}/results", format=format)
+
+    return save_results
+
+
+# benchmarks by name: setup(texts) -> state, which is not measured, and
+# run(state), which is measured
+BENCHMARKS = {
+    "Word()": (list, _create_words),
+    **{
+        f"Word.{name}": (_create_words, _get_property(name))
+        for name in ["length", "silent_letters", "shared_phonemes"]
+    },
+    # the total difficulty is the sum of the other properties
+    "Word.total_difficulty": (
+        _create_words_with_features,
+        _get_property("total_difficulty"),
+    ),
+    **{f"run_all_analyses[{engine}]": _run_all_analyses(engine) for engine in ENGINES},
+    "results": (_analyzed, lambda analyzer: analyzer.results),
+    "save_results[csv]": (_analyzed, _save_results("csv")),
+    "save_results[parquet]": (_analyzed, _save_results("parquet")),
+}
+# benchmarks that create a word object for each word
+WORD_OBJECT_BENCHMARKS = {
+    name for name in BENCHMARKS if name.startswith("Word") or "[word]" in name
+}
+
+
+def measure(setup, run, texts, repeat):
+    """Measure the best time of run and its peak memory in bytes."""
+    times = []
+    for _ in range(repeat):
+        state = setup(texts)
+        start = time.perf_counter()
+        run(state)
+        times.append(time.perf_counter() - start)
+
+    # measured apart because tracing the allocations slows everything down
+    state = setup(texts)
+    tracemalloc.start()
+    run(state)
+    _, peak_memory = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return min(times), peak_memory
+
+
+def measure_import_time(module="wdiff.analyzer", repeat=5):
+    """Measure the best cumulative import time of a module in seconds."""
+    import_times = []
+    for _ in range(repeat):
+        process = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        for line in process.stderr.splitlines():
+            _, cumulative, name = line.split("|")
+            if name.strip() == module:
+                import_times.append(int(cumulative) / 1e6)
+    return min(import_times)
+
+
+def run_benchmarks(sizes, selected, repeat):
+    """Run the selected benchmarks for each corpus size and print them."""
+    results = []
+    print(
+        f"{'benchmark':28} {'words':>10} {'seconds':>9} {'words/s':>12} {'peak MB':>9}"
+    )
+
+    seconds = measure_import_time()
+    results.append({"benchmark": "import wdiff.analyzer", "seconds": seconds})
+    print(f"{'import wdiff.analyzer':28} {'':>10} {seconds:9.4f}")
+
+    for size in sizes:
+        texts = make_corpus(size)
+        for name in selected:
+            if name in WORD_OBJECT_BENCHMARKS and size > WORD_OBJECTS_LIMIT:
+                continue
+            try:
+                seconds, peak_memory = measure(*BENCHMARKS[name], texts, repeat)
+            except ImportError as error:
+                print(f"{name:28} skipped: {error}")
+                continue
+            result = {
+                "benchmark": name,
+                "words": size,
+                "seconds": seconds,
+                "words_per_second": size / seconds,
+                "peak_memory": peak_memory,
+            }
+            results.append(result)
+            print(
+                f"{name:28} {size:10} {seconds:9.4f} "
+                f"{result['words_per_second']:12.0f} {peak_memory / 2**20:9.1f}"
+            )
+
+    return results
+
+
+def compare(results, baseline_results):
+    """Print the ratio of time and memory over a baseline."""
+    baseline = {
+        (result["benchmark"], result.get("words")): result
+        for result in baseline_results
+    }
+    print(f"\n{'benchmark':28} {'words':>10} {'time ratio':>11} {'memory ratio':>13}")
+    for result in results:
+        key = (result["benchmark"], result.get("words"))
+        if key not in baseline:
+            continue
+        ratios = [result["seconds"] / baseline[key]["seconds"]]
+        if "peak_memory" in result:
+            ratios.append(result["peak_memory"] / max(baseline[key]["peak_memory"], 1))
+        regression = any(ratio > REGRESSION_THRESHOLD for ratio in ratios)
+        columns = "".join(f" {ratio:12.2f}" for ratio in ratios)
+        print(f"{key[0]:28} {key[1] or '':>10}{columns}{'  <-' if regression else ''}")
+
+
+def main():
+    """Run the benchmarks, save them and compare them with a baseline."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--sizes",
+        type=lambda size: int(float(size)),
+        nargs="+",
+        default=DEFAULT_SIZES,
+        help="Number of words of each corpus, e.g. 1e3 1e7.",
+    )
+    parser.add_argument(
+        "--benchmarks",
+        nargs="+",
+        choices=list(BENCHMARKS),
+        default=list(BENCHMARKS),
+        metavar="BENCHMARK",
+        help=f"Benchmarks to run: {', '.join(BENCHMARKS)}.",
+    )
+    parser.add_argument("--repeat", type=int, default=3, help="Runs timed.")
+    parser.add_argument(
+        "--output",
+        type=Path,
+        default=RESULTS_DIR / f"{wdiff.__version__}.json",
+        help="JSON file where the results are saved.",
+    )
+    parser.add_argument(
+        "--compare", type=Path, help="JSON file of a previous version to compare."
+    )
+    args = parser.parse_args()
+
+    results = run_benchmarks(args.sizes, args.benchmarks, args.repeat)
+
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    metadata = {
+        "version": wdiff.__version__,
+        "date": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "processor": platform.processor(),
+    }
+    with open(args.output, "w") as file:
+        json.dump({"metadata": metadata, "results": results}, file, indent=2)
+    print(f"\nResults saved to {args.output}")
+
+    if args.compare:
+        with open(args.compare) as file:
+            compare(results, json.load(file)["results"])
+
+
+if __name__ == "__main__":
+    main()
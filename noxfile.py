@@ -77,6 +77,14 @@ def mypy(session: Session) -> None:
     session.run("inv", "mypy")
 
 
+@nox.session(python="3.9")
+def benchmarks(session: Session) -> None:
+    """Run the benchmark suite."""
+    session.install(".[arrow]")
+    install_with_constraints(session, "invoke")
+    session.run("inv", "benchmarks", *session.posargs)
+
+
 @nox.session(python="3.9")
 def safety(session: Session) -> None:
     """Scan dependencies for insecure packages."""
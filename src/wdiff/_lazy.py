@@ -0,0 +1,50 @@
+"""Module that defines how heavy dependencies are imported lazily.
+
+Importing pandas and numpy takes hundreds of milliseconds, which is paid by
+every script that imports wdiff even if it never analyzes a word. Modules
+imported lazily are only loaded when one of their attributes is first used.
+"""
+
+import importlib.util
+import sys
+
+
+def lazy_import(name):
+    """Import a module that is loaded when it is first used.
+
+    Parameters
+    ----------
+    name : str
+        Absolute name of the module.
+
+    Returns
+    -------
+    module
+        The module if it was already imported, or a module that is loaded
+        when one of its attributes is accessed.
+
+    Raises
+    ------
+    ModuleNotFoundError
+        If the module can't be found.
+    """
+
+    if name in sys.modules:
+        return sys.modules[name]
+
+    spec = importlib.util.find_spec(name)
+    if spec is None:
+        raise ModuleNotFoundError(f"No module named '{name}'", name=name)
+
+    loader = importlib.util.LazyLoader(spec.loader)
+    spec.loader = loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    loader.exec_module(module)
+
+    # submodules are bound to their package, as the import statement does
+    parent, _, child = name.rpartition(".")
+    if parent:
+        setattr(sys.modules[parent], child, module)
+
+    return module
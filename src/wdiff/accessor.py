@@ -0,0 +1,194 @@
+"""Module that defines the pandas accessors of wdiff.
+
+Importing it registers the ``wdiff`` accessor of Series and DataFrames, so
+the features of a column of words can be computed where the words already
+are (e.g., ``df["word"].wdiff.features()``) instead of copying them to an
+Analyzer and joining its results back. The rules are applied to each
+distinct word once with a vectorized engine, without creating Word objects.
+"""
+
+import numpy as np
+import pandas as pd
+
+from . import kernel, vectorized
+from .analyzer import ANALYSES
+
+_ENGINES = {"pandas": vectorized, "numpy": kernel}
+ERRORS = ("raise", "skip")
+
+
+def _check_analyses(analyses):
+    """Check the analyses and sort them in the order they must run.
+
+    Parameters
+    ----------
+    analyses : iterable of str or None
+        Names of the analyses. All analyses if None.
+
+    Returns
+    -------
+    list of str
+        Names of the analyses in the order of ANALYSES.
+
+    Raises
+    ------
+    ValueError
+        If an analysis is not valid, or if total_difficulty is the only
+        analysis.
+    """
+
+    if analyses is None:
+        return list(ANALYSES)
+
+    analyses = set(analyses)
+    invalid_analyses = analyses.difference(ANALYSES)
+    if invalid_analyses:
+        raise ValueError(f"{sorted(invalid_analyses)} are not valid analyses")
+    if analyses == {"total_difficulty"}:
+        raise ValueError(
+            "total_dificulty cannot be calculated because no analysis "
+            "has been conducted"
+        )
+
+    return [analysis for analysis in ANALYSES if analysis in analyses]
+
+
+@pd.api.extensions.register_series_accessor("wdiff")
+class WordsAccessor(object):
+    """Computes the features of a Series of words.
+
+    It is available as the ``wdiff`` attribute of every Series once
+    wdiff.accessor is imported.
+    """
+
+    def __init__(self, words):
+        """
+        Parameters
+        ----------
+        words : pandas.Series
+            Words to be analyzed.
+        """
+
+        self._words = words
+
+    def features(self, analyses=None, engine="numpy", errors="raise"):
+        """Compute the features of the words.
+
+        Parameters
+        ----------
+        analyses : iterable of str, optional
+            Names of the analyses to run (see Analyzer.run_analyses). All
+            analyses are run by default.
+        engine : {"numpy", "pandas"}, default="numpy"
+            Vectorized engine used to apply the rules.
+        errors : {"raise", "skip"}, default="raise"
+            What to do with invalid or missing words. "raise" raises a
+            ValueError with the first invalid word. "skip" leaves their
+            features missing (pandas.NA).
+
+        Returns
+        -------
+        pandas.DataFrame
+            Features of each word, with the index of the words. They are
+            int64, or Int64 if some words were skipped.
+
+        Raises
+        ------
+        ValueError
+            If the analyses, engine or errors are not valid, or if a word is
+            invalid and errors is "raise".
+        """
+
+        analyses = _check_analyses(analyses)
+        if engine not in _ENGINES:
+            raise ValueError(f"'{engine}' is not a valid engine")
+        if errors not in ERRORS:
+            raise ValueError(f"'{errors}' is not a valid option for errors")
+
+        # the rules are applied once to each distinct word
+        codes, unique_words = pd.factorize(self._words)
+        texts = vectorized.normalize_texts(unique_words)
+        is_invalid = vectorized.find_invalid_texts(texts).to_numpy()
+        is_missing = codes < 0
+        if errors == "raise":
+            vectorized.validate_texts(texts)
+            if is_missing.any():
+                raise ValueError("missing words can't be analyzed")
+        texts = texts[~is_invalid]
+
+        # the texts are encoded once for all the features
+        features = [analysis for analysis in analyses if analysis != "total_difficulty"]
+        computed_features = _ENGINES[engine].compute_features(texts, features)
+        unique_features = {}
+        for analysis in analyses:
+            values = np.zeros(len(unique_words), dtype=np.int64)
+            if analysis == "total_difficulty":
+                values = sum(unique_features.values())
+            else:
+                values[~is_invalid] = computed_features[analysis].to_numpy()
+            unique_features[analysis] = values
+
+        is_skipped = is_missing | is_invalid[codes]
+        features = pd.DataFrame(index=self._words.index)
+        for analysis, values in unique_features.items():
+            values = values[codes]
+            if is_skipped.any():
+                values = pd.array(values, dtype="Int64")
+                values[is_skipped] = pd.NA
+            features[analysis] = values
+
+        return features
+
+
+@pd.api.extensions.register_dataframe_accessor("wdiff")
+class WordsFrameAccessor(object):
+    """Adds the features of a column of words to a DataFrame in place.
+
+    It is available as the ``wdiff`` attribute of every DataFrame once
+    wdiff.accessor is imported.
+    """
+
+    def __init__(self, frame):
+        """
+        Parameters
+        ----------
+        frame : pandas.DataFrame
+            Frame with a column of words.
+        """
+
+        self._frame = frame
+
+    def analyze(self, column, analyses=None, engine="numpy", errors="raise"):
+        """Add the features of the words in a column to the frame in place.
+
+        The features are inserted as new columns, so the other columns of
+        the frame are not copied. Use WordsAccessor.features (e.g.,
+        ``frame[column].wdiff.features()``) and join them to keep the frame
+        unchanged.
+
+        Parameters
+        ----------
+        column : hashable
+            Column of the words to be analyzed.
+        analyses : iterable of str, optional
+            Names of the analyses to run. All analyses are run by default.
+        engine : {"numpy", "pandas"}, default="numpy"
+            Vectorized engine used to apply the rules.
+        errors : {"raise", "skip"}, default="raise"
+            What to do with invalid or missing words. See
+            WordsAccessor.features.
+
+        Returns
+        -------
+        None
+
+        Raises
+        ------
+        ValueError
+            See WordsAccessor.features.
+        """
+
+        features = self._frame[column].wdiff.features(analyses, engine, errors)
+        # existing columns with the name of a feature are replaced
+        for feature in features:
+            self._frame[feature] = features[feature]
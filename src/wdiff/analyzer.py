@@ -1,10 +1,301 @@
 """Module that defines the api."""
 
-import pandas as pd
+import heapq
+import os
+from functools import wraps
+from itertools import chain, islice
 
-from .docsprocessor import _COMMON_SECTIONS, docstrings
+from ._lazy import lazy_import
+from .stats import Stats
 from .word import Word
 
+# heavy dependencies are only loaded when the first words are analyzed
+futures = lazy_import("concurrent.futures")
+np = lazy_import("numpy")
+pd = lazy_import("pandas")
+kernel = lazy_import("wdiff.kernel")
+lexicon = lazy_import("wdiff.lexicon")
+result_cache = lazy_import("wdiff.cache")
+vectorized = lazy_import("wdiff.vectorized")
+writers = lazy_import("wdiff.writers")
+
+_ENGINES = {"word": None, "pandas": vectorized, "numpy": kernel}
+ENGINES = tuple(_ENGINES)
+ERRORS = ("raise", "skip", "collect")
+# features that are weighed to determine the total difficulty
+FEATURES = ("length", "silent_letters", "shared_phonemes")
+# dtypes tried, in order, to store the features of compact results, and the
+# total difficulty with negative weights
+_COMPACT_FEATURE_DTYPES = ("uint8", "uint16", "uint32")
+_COMPACT_SIGNED_DTYPES = ("int8", "int16", "int32")
+
+# analyses by name and the methods that run them, in the order they must run
+ANALYSES = {
+    "length": "check_length_difficulty",
+    "silent_letters": "check_silent_letter_difficulty",
+    "shared_phonemes": "check_shared_phonemes_difficulty",
+    "total_difficulty": "determine_total_difficulty",
+}
+
+
+def _chunk(words, chunksize):
+    """Split the words into lists of at most chunksize words.
+
+    Parameters
+    ----------
+    words : iterable
+        Words to be split.
+    chunksize : int
+        Maximum number of words of each chunk.
+
+    Yields
+    ------
+    chunk : list
+        Next words.
+    """
+
+    words = iter(words)
+    chunk = list(islice(words, chunksize))
+    while chunk:
+        yield chunk
+        chunk = list(islice(words, chunksize))
+
+
+def _check_jobs(jobs):
+    """Check the number of processes used to run the analyses.
+
+    Parameters
+    ----------
+    jobs : int or None
+        Number of processes.
+
+    Returns
+    -------
+    None
+
+    Raises
+    ------
+    ValueError
+        If jobs is not None, -1 or a positive integer.
+    """
+
+    if jobs is not None and jobs != -1 and jobs < 1:
+        raise ValueError("jobs must be -1 or a positive integer")
+
+
+def _has_negative_weights(weights):
+    """Check whether the total difficulty can be negative with the weights.
+
+    Parameters
+    ----------
+    weights : dict
+        Weight of each feature.
+
+    Returns
+    -------
+    bool
+        Whether any weight is negative.
+    """
+
+    return any(weight < 0 for weight in weights.values())
+
+
+def _total_difficulty_dtype(weights):
+    """Get the dtype of the total difficulty in parquet and Arrow IPC files.
+
+    It depends on the weights instead of the values, so all the chunks of a
+    file have the same dtype.
+
+    Parameters
+    ----------
+    weights : dict
+        Weight of each feature. The features that are not given weigh 1.
+
+    Returns
+    -------
+    str
+        "float64" if any weight is not an integer, "int32" if any weight is
+        negative, "uint32" if any weight is larger than 1, and "uint16"
+        otherwise.
+    """
+
+    weight_values = weights.values()
+    if any(weight != int(weight) for weight in weight_values):
+        return "float64"
+    if _has_negative_weights(weights):
+        return "int32"
+    if any(weight > 1 for weight in weight_values):
+        return "uint32"
+
+    return "uint16"
+
+
+def _compact_column(column, values, signed=False):
+    """Convert a column of the results to its most compact dtype.
+
+    The text is stored as categorical, so each distinct text is stored
+    once, and the features as the smallest integer dtype that fits their
+    values. Features that are not integers (e.g., a total difficulty with
+    fractional weights) are kept as they are.
+
+    Parameters
+    ----------
+    column : str
+        Name of the column.
+    values : pandas.Series
+        Values of the column.
+    signed : bool, default=False
+        Whether the values can be negative (e.g., a total difficulty with
+        negative weights), so they are stored with a signed dtype.
+
+    Returns
+    -------
+    pandas.Series
+        Values with the compact dtype.
+    """
+
+    if column == "text":
+        return values.astype("category")
+    if not pd.api.types.is_integer_dtype(values):
+        return values
+
+    min_value = values.min() if len(values) else 0
+    max_value = values.max() if len(values) else 0
+    for dtype in _COMPACT_SIGNED_DTYPES if signed else _COMPACT_FEATURE_DTYPES:
+        dtype_info = np.iinfo(dtype)
+        if dtype_info.min <= min_value and max_value <= dtype_info.max:
+            return values.astype(dtype)
+
+    return values
+
+
+def _check_weighed_features(features):
+    """Check that only features are weighed.
+
+    Parameters
+    ----------
+    features : iterable of str
+        Names of the weighed features.
+
+    Returns
+    -------
+    None
+
+    Raises
+    ------
+    ValueError
+        If a name is not one of FEATURES.
+    """
+
+    invalid_features = set(features).difference(FEATURES)
+    if invalid_features:
+        raise ValueError(f"{sorted(invalid_features)} are not valid features")
+
+
+def _as_weightings(weights):
+    """Put one or many weightings of the features in a DataFrame.
+
+    Parameters
+    ----------
+    weights : dict or pandas.DataFrame
+        Weight of each feature, or a DataFrame with a row per weighting and
+        a column per feature.
+
+    Returns
+    -------
+    pandas.DataFrame
+        A row per weighting and a column per feature.
+
+    Raises
+    ------
+    ValueError
+        If a weight is given for something that is not a feature.
+    """
+
+    if not isinstance(weights, pd.DataFrame):
+        weights = pd.DataFrame([weights])
+    _check_weighed_features(weights.columns)
+
+    return weights
+
+
+def _count_results(analyzer, result):
+    """Count the rows of the results of an analyzer."""
+    return len(analyzer._results)
+
+
+def _measured(stage, count_rows=_count_results):
+    """Measure a method of Analyzer as a stage if its stats are enabled.
+
+    Parameters
+    ----------
+    stage : str
+        Name of the stage.
+    count_rows : callable, default=_count_results
+        Function that counts the rows processed by the stage from the
+        analyzer and the value returned by the method. The rows of the
+        results are counted by default.
+
+    Returns
+    -------
+    callable
+        Decorator of the method.
+    """
+
+    def decorator(method):
+        @wraps(method)
+        def measured_method(self, *args, **kwargs):
+            if self._stats is None:
+                return method(self, *args, **kwargs)
+
+            with self._stats.measure(stage) as record:
+                result = method(self, *args, **kwargs)
+                record["rows"] = count_rows(self, result)
+
+            return result
+
+        return measured_method
+
+    return decorator
+
+
+def _analyze_shard(shard, engine, features):
+    """Compute features for a shard of texts.
+
+    This function is run by the worker processes during parallel analyses.
+
+    Parameters
+    ----------
+    shard : str
+        Normalized texts joined by new lines, which is much cheaper to send
+        to another process than a list of texts or word objects.
+    engine : str
+        Engine used to compute the features.
+    features : list of str
+        Features to be computed.
+
+    Returns
+    -------
+    shard_features : dict
+        numpy.ndarray with each feature of the texts.
+    """
+
+    texts = shard.split("\n")
+    if engine == "word":
+        words = [Word(text) for text in texts]
+        shard_features = {
+            feature: np.array([getattr(word, feature) for word in words])
+            for feature in features
+        }
+    else:
+        texts = pd.Series(texts)
+        computed_features = _ENGINES[engine].compute_features(texts, features)
+        shard_features = {
+            feature: values.to_numpy() for feature, values in computed_features.items()
+        }
+
+    return shard_features
+
 
 class Analyzer(object):
     """This class exposes wdiff's API.
@@ -13,19 +304,302 @@ class Analyzer(object):
     results, and saving results to a file.
     """
 
-    def __init__(self, words):
+    def __init__(
+        self,
+        words,
+        engine="word",
+        deduplicate=False,
+        jobs=None,
+        executor=None,
+        errors="raise",
+        stats=None,
+        index=None,
+        cache=None,
+        compact=False,
+        weights=None,
+    ):
         """
         Parameters
         ----------
         words : iterable, list-like object
-            Contains the words to be analyzed.
+            Contains the words to be analyzed. They are not read until the
+            first analysis is run or the results are requested, so creating
+            an analyzer is cheap and invalid words are reported then.
+        engine : {"word", "pandas", "numpy"}, default="word"
+            Engine used to run the analyses. "word" creates a Word object
+            for each word. "pandas" applies the same rules to the whole
+            text column at once using pandas string methods. "numpy"
+            encodes the texts as a matrix of character codes and applies
+            the rules as array comparisons. Both are much faster than
+            "word" for large numbers of words.
+        deduplicate : bool, default=False
+            Whether to run the analyses only once for each distinct word.
+            The results are broadcast back to every occurrence, so they
+            keep the original order of the words. This is much faster
+            when the words are repeated many times (e.g., corpus tokens).
+        jobs : int, optional
+            Number of processes used to run the analyses. -1 uses all the
+            CPU cores. The analyses are run in the current process by
+            default.
+        executor : concurrent.futures.Executor, optional
+            Executor used to run parallel analyses, so a pool of processes
+            can be reused across analyzers. A ProcessPoolExecutor with jobs
+            processes is created for each run by default.
+        errors : {"raise", "skip", "collect"}, default="raise"
+            What to do with invalid words (e.g., empty or with characters
+            that are not Spanish letters). "raise" raises a ValueError with
+            the first invalid word. "skip" leaves them out of the results.
+            "collect" also leaves them out, but records them in
+            invalid_words.
+        stats : bool or Stats, optional
+            Whether to record the wall time, rows, rows per second and peak
+            memory of each stage (preparing the words, each analysis and
+            saving the results) in stats. A Stats object can be given to
+            receive each record in a callback, to not track the memory or
+            to share it between analyzers.
+        index : LexiconIndex or path-like, optional
+            Index of a lexicon, or the directory where it was saved with
+            wdiff.lexicon.build_index. The features of the words in the
+            index are looked up instead of computed, and only the other
+            words are analyzed with the engine (in the current process).
+        cache : ResultCache or path-like, optional
+            Persistent cache of features, or its SQLite database file. The
+            features of the cached words (that are not in the index) are
+            read from it, and the features of the other words are written
+            to it once they are analyzed with the engine (in the current
+            process).
+        compact : bool, default=False
+            Whether to store the results with compact dtypes: the text as
+            categorical and the features as the smallest unsigned integer
+            dtype that fits them (uint8 for most words). The results have
+            the same values, but take several times less memory when there
+            are many words.
+        weights : dict, optional
+            Weight of each feature (length, silent_letters and
+            shared_phonemes) in the total difficulty. The features that are
+            not given weigh 1, so the total difficulty is the sum of the
+            features by default.
+
+        Raises
+        ------
+        ValueError
+            If the engine or errors are not supported, if jobs is not -1 or
+            a positive integer, if the index is outdated, or if a weight is
+            given for something that is not a feature.
         """
 
+        if engine not in _ENGINES:
+            raise ValueError(f"'{engine}' is not a valid engine")
+        _check_jobs(jobs)
+        if errors not in ERRORS:
+            raise ValueError(f"'{errors}' is not a valid option for errors")
+
+        self._engine = engine
+        self._compact = compact
+        self._weights = dict(weights or {})
+        _check_weighed_features(self._weights)
+        self._stats = Stats() if stats is True else stats or None
+        if index is not None and not isinstance(index, lexicon.LexiconIndex):
+            index = lexicon.LexiconIndex(index)
+        self._index = index
+        if cache is not None and not isinstance(cache, result_cache.ResultCache):
+            cache = result_cache.ResultCache(cache)
+        self._cache = cache
+        # position of each word in the index, found when first needed
+        self._index_positions = None
+        self._jobs = jobs
+        self._executor = executor
         self._results = pd.DataFrame()
-        word_objs = self._create_word_objs(words)
-        self._results["word_objs"] = word_objs
-        self._add_words_text_to_results()
+        self._formatted_results = None
+        # features that have been determined, as a matrix with a column per
+        # feature, built when the first weighting is computed
+        self._feature_matrix = None
+        self._codes = None
+        self._precomputed_features = {}
+        self._deduplicate = deduplicate
+        self._errors = errors
+        self._n_input_words = 0
+        self._invalid_words = pd.DataFrame(columns=["position", "word", "reason"])
+        # the words are only prepared when they are first needed
+        self._input_words = words
+        self._prepared_words = None
+
+    @property
+    def _words(self):
+        """Words to be analyzed, prepared the first time they are needed.
+
+        Returns
+        -------
+        pandas.DataFrame
+            Normalized text of the words to be analyzed and, if the engine is
+            "word", the word objects that have been created.
+        """
+
+        self._prepare_words_if_needed()
+
+        return self._prepared_words
+
+    def _prepare_words_if_needed(self):
+        """Prepare the words if they have not been prepared yet.
+
+        Returns
+        -------
+        None
+        """
+
+        if self._prepared_words is None:
+            self._prepared_words = self._prepare_words()
+
+    @_measured("prepare_words")
+    def _prepare_words(self):
+        """Normalize and validate the input words and add them to the results.
+
+        Word objects are not created yet, since the features of some words
+        may be computed in other processes or looked up instead.
+
+        Returns
+        -------
+        words : pandas.DataFrame
+            Normalized text of the words to be analyzed.
+        """
+
+        self._add_texts_to_results(self._input_words)
+
+        if self._deduplicate:
+            words = self._create_unique_words()
+        elif self._engine == "word":
+            # the word objects are added to the words, not to the results
+            words = pd.DataFrame({"text": self._results["text"]})
+        else:
+            words = self._results
+        self._input_words = None
+
+        return words
+
+    def add_words(self, words):
+        """Add words to the analyzer.
+
+        Only the new words are analyzed, and only with the analyses that
+        have already been run. The results of the existing words are kept
+        as they are.
+
+        Parameters
+        ----------
+        words : iterable, list-like object
+            Contains the words to be added.
+
+        Returns
+        -------
+        None
+        """
+
+        if self._prepared_words is None:
+            self._input_words = chain(self._input_words, words)
+            return
+
+        new_analyzer = Analyzer(
+            words,
+            engine=self._engine,
+            deduplicate=self._deduplicate,
+            jobs=self._jobs,
+            executor=self._executor,
+            errors=self._errors,
+            stats=self._stats,
+            index=self._index,
+            cache=self._cache,
+            compact=self._compact,
+            weights=self._weights,
+        )
+        analyses = [analysis for analysis in ANALYSES if analysis in self._results]
+        new_analyzer._prepare_words_if_needed()
+        new_analyzer.run_analyses(analyses)
+
+        new_invalid_words = new_analyzer.invalid_words
+        new_invalid_words["position"] += self._n_input_words
+        self._invalid_words = self._concat_invalid_words(new_invalid_words)
+        self._n_input_words += new_analyzer._n_input_words
+
+        self._results = pd.concat(
+            [self._results, new_analyzer._results], ignore_index=True
+        )
+        if self._compact:
+            # categories are merged and features may need a wider dtype
+            for column in self._results:
+                self._results[column] = self._compact_column(
+                    column, self._results[column]
+                )
+        if self._deduplicate or self._engine == "word":
+            words = pd.concat([self._words, new_analyzer._words], ignore_index=True)
+        else:
+            words = self._results
+        self._update_words(words)
+
+    def remove_words(self, words):
+        """Remove all the occurrences of the words from the analyzer.
+
+        Parameters
+        ----------
+        words : iterable, list-like object
+            Contains the words to be removed. They are normalized like the
+            words that are analyzed.
+
+        Returns
+        -------
+        None
+        """
+
+        texts = vectorized.normalize_texts(words)
+        is_kept = ~self._results_text().isin(texts).to_numpy()
+
+        self._results = self._results[is_kept].reset_index(drop=True)
+        if self._deduplicate:
+            words = self._words[~self._words["text"].isin(texts)]
+        elif self._engine == "word":
+            words = self._words[is_kept]
+        else:
+            words = self._results
+        self._update_words(words.reset_index(drop=True))
+
+    def _results_text(self):
+        """Get the normalized text of all words in the results.
+
+        Returns
+        -------
+        pandas.Series
+            Text of each word.
+        """
+
+        self._prepare_words_if_needed()
+
+        return self._results["text"]
+
+    def _update_words(self, words):
+        """Replace the words after some of them were added or removed.
+
+        Parameters
+        ----------
+        words : pandas.DataFrame
+            Words to be analyzed. If the analyzer deduplicates the words, the
+            texts do not need to be distinct; only the first occurrence of
+            each one is kept.
+
+        Returns
+        -------
+        None
+        """
 
+        if self._deduplicate:
+            words = words.drop_duplicates(subset="text", ignore_index=True)
+            text_positions = pd.Index(words["text"])
+            self._codes = text_positions.get_indexer(self._results["text"])
+        self._prepared_words = words
+        self._formatted_results = None
+        self._feature_matrix = None
+        self._index_positions = None
+
+    @_measured(
+        "create_word_objs", count_rows=lambda analyzer, word_objs: len(word_objs)
+    )
     def _create_word_objs(self, text_for_words):
         """Create a word object for each text.
 
@@ -44,13 +618,49 @@ class Analyzer(object):
 
         return word_objs
 
-    def _get_property_from_words(self, word_property):
+    def _get_word_objs(self, words):
+        """Get the word objects of some words, creating the missing ones.
+
+        Word objects are only created for the words whose features are
+        computed with the "word" engine in this process, and are kept for
+        the other analyses.
+
+        Parameters
+        ----------
+        words : pandas.DataFrame
+            Some of the words to be analyzed, with their index.
+
+        Returns
+        -------
+        word_objs : pandas.Series
+            Word object of each word.
+        """
+
+        prepared_words = self._words
+        if "word_objs" not in prepared_words:
+            prepared_words["word_objs"] = pd.Series(
+                None, index=prepared_words.index, dtype=object
+            )
+        is_missing = prepared_words.loc[words.index, "word_objs"].isna().to_numpy()
+        if is_missing.any():
+            missing_texts = words["text"][is_missing]
+            prepared_words.loc[missing_texts.index, "word_objs"] = pd.Series(
+                self._create_word_objs(missing_texts),
+                index=missing_texts.index,
+                dtype=object,
+            )
+
+        return prepared_words.loc[words.index, "word_objs"]
+
+    def _get_property_from_words(self, word_property, words=None):
         """Get property of all words.
 
         Parameters
         ----------
         word_property : str
             Property to be extracted from word.
+        words : pandas.DataFrame, optional
+            Words whose property is extracted. All words by default.
 
         Returns
         -------
@@ -58,23 +668,425 @@ class Analyzer(object):
             The property of all words.
         """
 
-        word_objs = self._results["word_objs"]
+        if words is None:
+            words = self._words
+        word_objs = self._get_word_objs(words)
         function_for_extracting_property = lambda w: getattr(w, word_property)
         word_properties = word_objs.apply(function_for_extracting_property)
 
         return word_properties
 
-    def _add_words_text_to_results(self):
-        """Add the word's text to the results object.
+    def _add_texts_to_results(self, texts):
+        """Normalize, validate and add the texts to the results object.
+
+        All texts are normalized and validated at once. Invalid texts are
+        handled as specified by the errors option.
+
+        Parameters
+        ----------
+        texts : iterable, list-like object
+            Text of the words to be analyzed.
+
+        Returns
+        -------
+        None
+        """
+
+        input_texts = vectorized.as_series(texts)
+        texts = vectorized.normalize_texts(input_texts)
+
+        if self._errors == "raise":
+            vectorized.validate_texts(texts)
+        else:
+            is_invalid = vectorized.find_invalid_texts(texts)
+            if is_invalid.any():
+                if self._errors == "collect":
+                    self._collect_invalid_words(input_texts, texts, is_invalid)
+                texts = texts[~is_invalid].reset_index(drop=True)
+
+        self._n_input_words += len(input_texts)
+        self._add_to_results("text", texts)
+
+    def _collect_invalid_words(self, input_texts, texts, is_invalid):
+        """Record the invalid words and why they are invalid.
+
+        Parameters
+        ----------
+        input_texts : pandas.Series
+            Text of all words as they were given.
+        texts : pandas.Series
+            Normalized text of all words.
+        is_invalid : pandas.Series
+            Whether each text is invalid.
 
         Returns
         -------
         None
         """
 
-        word_text = self._get_property_from_words(word_property="text")
-        self._results["text"] = word_text
+        invalid_texts = texts[is_invalid]
+        invalid_words = pd.DataFrame(
+            {
+                "position": invalid_texts.index + self._n_input_words,
+                "word": input_texts[is_invalid].to_numpy(),
+                "reason": invalid_texts.map(vectorized.describe_invalid_text),
+            }
+        )
+        self._invalid_words = self._concat_invalid_words(invalid_words)
+
+    def _concat_invalid_words(self, invalid_words):
+        """Add invalid words to the ones already recorded.
+
+        Parameters
+        ----------
+        invalid_words : pandas.DataFrame
+            New invalid words.
+
+        Returns
+        -------
+        pandas.DataFrame
+            All invalid words.
+        """
+
+        if self._invalid_words.empty:
+            return invalid_words.reset_index(drop=True)
+        if invalid_words.empty:
+            return self._invalid_words
+
+        return pd.concat([self._invalid_words, invalid_words], ignore_index=True)
+
+    def _create_unique_words(self):
+        """Create the words to be analyzed from the distinct texts.
+
+        The position of each text in the distinct texts is stored so the
+        results of the analyses can be broadcast back to every occurrence.
+
+        Returns
+        -------
+        words : pandas.DataFrame
+            Distinct texts.
+        """
+
+        codes, unique_texts = pd.factorize(self._results["text"])
+        self._codes = codes
+
+        return pd.DataFrame({"text": unique_texts})
+
+    def _broadcast(self, features):
+        """Broadcast features of the distinct words to every occurrence.
+
+        Parameters
+        ----------
+        features : pandas.Series
+            Feature of each word that was analyzed.
+
+        Returns
+        -------
+        pandas.Series
+            Feature of each word in the original order. It is the same
+            features object if the words were not deduplicated.
+        """
+
+        if self._codes is None:
+            return features
+
+        return pd.Series(features.to_numpy()[self._codes])
+
+    def _get_feature(self, feature):
+        """Get a feature of all words using the selected engine.
+
+        Parameters
+        ----------
+        feature : str
+            Feature to be determined.
+
+        Returns
+        -------
+        features : pandas.Series
+            The feature of all words.
+        """
+
+        if feature in self._precomputed_features:
+            features = self._precomputed_features.pop(feature)
+        else:
+            features = self._determine_features([feature])[feature]
+
+        return self._broadcast(features)
+
+    def _determine_features(self, features):
+        """Determine some features of all words.
+
+        Parameters
+        ----------
+        features : list of str
+            Features to be determined.
+
+        Returns
+        -------
+        dict
+            pandas.Series with each feature of all words.
+        """
+
+        if self._index is not None or self._cache is not None:
+            return self._look_up_features(features)
+
+        return self._compute_features(features, self._words)
 
+    @_measured("features")
+    def _precompute_features(self, features):
+        """Compute features of all words at once.
+
+        The numpy engine encodes the texts once for all the features, so
+        they are computed together and kept until the analyses that need
+        them are run.
+
+        Parameters
+        ----------
+        features : list of str
+            Features to be computed.
+
+        Returns
+        -------
+        None
+        """
+
+        self._precomputed_features.update(self._determine_features(features))
+
+    def _compute_features(self, features, words):
+        """Compute features of some words using the selected engine.
+
+        Parameters
+        ----------
+        features : list of str
+            Features to be determined.
+        words : pandas.DataFrame
+            Words whose features are computed.
+
+        Returns
+        -------
+        dict
+            pandas.Series with each feature of the words, with their index.
+        """
+
+        if self._engine == "word":
+            return {
+                feature: self._get_property_from_words(feature, words)
+                for feature in features
+            }
+
+        engine = _ENGINES[self._engine]
+        return engine.compute_features(words["text"], features)
+
+    def _look_up_features(self, features):
+        """Look up features of all words in the index and the cache.
+
+        The features of the words that are in neither of them are computed
+        at once, and added to the cache.
+
+        Parameters
+        ----------
+        features : list of str
+            Features to be determined.
+
+        Returns
+        -------
+        dict
+            pandas.Series with each feature of all words.
+        """
+
+        texts = self._words["text"]
+        found_features = {}
+        for feature in features:
+            values = np.full(len(texts), -1, dtype=np.int64)
+            if self._index is not None:
+                if self._index_positions is None:
+                    self._index_positions = self._index.find(texts)
+                positions = self._index_positions
+                is_found = positions >= 0
+                index_values = self._index.features[feature]
+                values[is_found] = index_values[positions[is_found]]
+
+            is_unknown = values < 0
+            if self._cache is not None and is_unknown.any():
+                values[is_unknown] = self._cache.get(texts[is_unknown], feature)
+            found_features[feature] = values
+
+        # the words missing any feature are analyzed together
+        is_unknown = np.zeros(len(texts), dtype=bool)
+        for values in found_features.values():
+            is_unknown |= values < 0
+        if is_unknown.any():
+            unknown_words = self._words[is_unknown]
+            unknown_features = self._compute_features(features, unknown_words)
+            for feature, values in found_features.items():
+                values[is_unknown] = unknown_features[feature].to_numpy()
+                if self._cache is not None:
+                    self._cache.put(unknown_words["text"], feature, values[is_unknown])
+
+        return {
+            feature: pd.Series(values) for feature, values in found_features.items()
+        }
+
+    @_measured("parallel_features")
+    def _precompute_features_in_parallel(self, features, jobs, executor):
+        """Compute features of all words in several processes.
+
+        The texts are split in one shard per process. The features of all
+        shards are put back together in the order of the words and kept
+        until the analyses that need them are run.
+
+        Parameters
+        ----------
+        features : list of str
+            Features to be computed.
+        jobs : int
+            Number of shards. -1 uses the number of CPU cores.
+        executor : concurrent.futures.Executor or None
+            Executor used to analyze the shards. A ProcessPoolExecutor is
+            created if None.
+
+        Returns
+        -------
+        None
+        """
+
+        texts = self._words["text"].to_list()
+        if not texts:
+            return
+        if jobs == -1:
+            jobs = os.cpu_count()
+        shard_size = -(-len(texts) // jobs)
+        shards = ["\n".join(shard) for shard in _chunk(texts, shard_size)]
+        n_shards = len(shards)
+        args = ([self._engine] * n_shards, [features] * n_shards)
+
+        if executor is None:
+            with futures.ProcessPoolExecutor(max_workers=jobs) as executor:
+                shards_features = list(executor.map(_analyze_shard, shards, *args))
+        else:
+            shards_features = list(executor.map(_analyze_shard, shards, *args))
+
+        for feature in features:
+            feature_values = [
+                shard_features[feature] for shard_features in shards_features
+            ]
+            self._precomputed_features[feature] = pd.Series(
+                np.concatenate(feature_values)
+            )
+
+    def _get_feature_matrix(self):
+        """Get the matrix of the features that have been determined.
+
+        The matrix is kept until the results change, so any number of
+        weightings can be computed without building it again.
+
+        Returns
+        -------
+        features : list of str
+            Features that have been determined, in the order of FEATURES.
+        feature_matrix : numpy.ndarray
+            Features of each word, with a row per feature and a column per
+            word.
+        """
+
+        if self._feature_matrix is None:
+            features = [feature for feature in FEATURES if feature in self._results]
+            feature_matrix = np.empty((len(features), len(self._results)))
+            for row, feature in enumerate(features):
+                feature_matrix[row] = self._results[feature].to_numpy()
+            self._feature_matrix = (features, feature_matrix)
+
+        return self._feature_matrix
+
+    def _weigh_features(self, weights):
+        """Weigh the features that have been determined for all words.
+
+        All the weightings are computed with a single matrix product.
+
+        Parameters
+        ----------
+        weights : pandas.DataFrame
+            A row per weighting and a column per feature. The features that
+            are missing weigh 1.
+
+        Returns
+        -------
+        difficulties : numpy.ndarray
+            Weighted difficulty of each word, with a row per weighting and a
+            column per word. It is int64 if all the weights are integers.
+
+        Raises
+        ------
+        ValueError
+            If none of the analyses has been run, or if a feature that has
+            not been determined has a weight other than 0.
+        """
+
+        features, feature_matrix = self._get_feature_matrix()
+        if not features:
+            raise ValueError(
+                "total_dificulty cannot be calculated because no analysis "
+                "has been conducted"
+            )
+        missing_features = [
+            feature
+            for feature in weights.columns
+            if feature not in features and (weights[feature] != 0).any()
+        ]
+        if missing_features:
+            raise ValueError(
+                f"{missing_features} must be analyzed before they are weighed"
+            )
+
+        weight_matrix = weights.reindex(columns=features, fill_value=1)
+        weight_matrix = weight_matrix.to_numpy(dtype=np.float64)
+        difficulties = weight_matrix @ feature_matrix
+        if np.array_equal(weight_matrix, np.round(weight_matrix)):
+            difficulties = np.round(difficulties).astype(np.int64)
+
+        return difficulties
+
+    def weighted_difficulty(self, weights):
+        """Compute the total difficulty of the words with other weightings.
+
+        The features are weighed with a single matrix product, so many
+        weightings (e.g., a grid of weights) can be compared without running
+        any analysis again. Only the analyses that have been run are
+        weighed.
+
+        Parameters
+        ----------
+        weights : dict or pandas.DataFrame
+            Weight of each feature (length, silent_letters and
+            shared_phonemes), or a DataFrame with a row per weighting and a
+            column per feature. The features that are not given weigh 1.
+
+        Returns
+        -------
+        pandas.Series or pandas.DataFrame
+            Weighted difficulty of each word. If weights is a DataFrame,
+            there is a column per weighting, named like its row.
+
+        Raises
+        ------
+        ValueError
+            If none of the analyses has been run, if a weight is given for
+            something that is not a feature, or if a feature that has not
+            been determined has a weight other than 0.
+        """
+
+        weightings = _as_weightings(weights)
+        self._prepare_words_if_needed()
+        difficulties = self._weigh_features(weightings)
+
+        if isinstance(weights, pd.DataFrame):
+            # the transposed rows are the columns of the frame, so they are
+            # not copied
+            return pd.DataFrame(difficulties.T, columns=weightings.index, copy=False)
+
+        return pd.Series(difficulties[0], name="total_difficulty")
+
+    @_measured("length")
     def check_length_difficulty(self):
         """Determine the difficulty of each word associated with its length.
 
@@ -85,75 +1097,139 @@ class Analyzer(object):
         None
         """
 
-        word_lengths = self._get_property_from_words(word_property="length")
-        self._results["length"] = word_lengths
+        word_lengths = self._get_feature("length")
+        self._add_to_results("length", word_lengths)
 
-    @docstrings.with_indent(8)
+    @_measured("silent_letters")
     def check_silent_letter_difficulty(self):
         """Determine the difficulty of each word associated with silent letters.
 
-        %(silent_letters.summary_ext)s
+        Silent letters are graphemes that do not have a phonemic representation.
+        In Spanish, silent letters are *h*s and *u*s that meet certain criteria.
 
         Rules
         -----
-        %(silent_letters.rules)s
+        *u*: when preceded by an *g* or *q* and followed by a *i* or *e*.
+             These follow the pattern *gui*, *gue*, *que*, *qui*.
+        *h*: when is not preceded by a letter *c*.
 
         Returns
         -------
         None
         """
 
-        word_silent_letters = self._get_property_from_words(
-            word_property="silent_letters"
-        )
-        self._results["silent_letters"] = word_silent_letters
+        word_silent_letters = self._get_feature("silent_letters")
+        self._add_to_results("silent_letters", word_silent_letters)
 
-    @docstrings.with_indent(8)
+    @_measured("shared_phonemes")
     def check_shared_phonemes_difficulty(self):
         """Determine the difficulty of each word associated with shared phonemes.
 
-        %(shared_phonemes.summary_ext)s
+        Graphemes that share phonemes with other graphemes are
+        letters or combination of letters that represent the same sound
+        as other letters or combination of letters.
 
         Rules
         -----
-        %(shared_phonemes.rules)s
+        *z*: Any letter *z*
+        *s*: Any letter *s*
+        *c*: when followed by an *i* or *e*
+        *b*: Any letter *b*
+        *v*: Any letter *v*
+        *l*: If it is next to another letter *l* (i.e., *ll*)
+        *y*: Any letter *y* that is not at the end of the word
+        *j*: Any letter *j*
+        *g*: when followed by an *e* or *i*
+        *k*: Any letter *k*
+        *q*: Any letter *q*
+        *c*: when followed by an *a*, *o* or *u*
 
         Returns
         -------
         None
         """
 
-        word_shared_phonemes = self._get_property_from_words(
-            word_property="shared_phonemes"
-        )
-        self._results["shared_phonemes"] = word_shared_phonemes
+        word_shared_phonemes = self._get_feature("shared_phonemes")
+        self._add_to_results("shared_phonemes", word_shared_phonemes)
 
-    @docstrings.with_indent(8)
+    @_measured("total_difficulty")
     def determine_total_difficulty(self):
         """Determine each word's total difficulty.
 
-        %(total_difficulty.summary_ext)s
+        This is the sum of all other characteristics, weighed with the
+        weights of the analyzer. It is interpreted as how difficult is to
+        spell the word. This information can be particularly useful if this
+        *difficulty index* is compared to the index of other words.
+
+        Only the characteristics that have been determined are used.
 
         Raises
         ------
-        %(total_difficulty.raises)s
+        ValueError
+            If none of the analyses has been run (are None).
 
         Returns
         -------
         None
         """
 
-        word_total_difficulty = self._get_property_from_words(
-            word_property="total_difficulty"
-        )
-        self._results["total_difficulty"] = word_total_difficulty
-        # valid_cols = self._results.iloc[:, 2:]
-        # print(valid_cols)
-        # # total_difficulty = valid_cols.sum()
-        # self._results["total_difficulty"] = valid_cols.sum()
+        weights = _as_weightings(self._weights)
+        word_total_difficulty = pd.Series(self._weigh_features(weights)[0])
+        self._add_to_results("total_difficulty", word_total_difficulty)
+
+    def _add_to_results(self, column, values):
+        """Add a column to the results.
+
+        The formatted results are invalidated, so they are built again the
+        next time they are requested.
+
+        Parameters
+        ----------
+        column : str
+            Name of the column.
+        values : pandas.Series
+            Values of the column, in the order of the words.
+
+        Returns
+        -------
+        None
+        """
+
+        if self._compact:
+            values = self._compact_column(column, values)
+        self._results[column] = values
+        self._formatted_results = None
+        self._feature_matrix = None
+
+    def _compact_column(self, column, values):
+        """Convert a column of the results to its most compact dtype.
+
+        The total difficulty is stored with a signed dtype if the weights
+        can make it negative.
+
+        Parameters
+        ----------
+        column : str
+            Name of the column.
+        values : pandas.Series
+            Values of the column.
+
+        Returns
+        -------
+        pandas.Series
+            Values with the compact dtype.
+        """
+
+        signed = column == "total_difficulty" and _has_negative_weights(self._weights)
+
+        return _compact_column(column, values, signed)
 
     def _format_results(self):
-        """Format the results before making them public.
+        """Format the results before using them.
+
+        The results only hold public columns (the word objects are stored
+        separately), so they are used as they are, without copying them.
+        They must not be modified.
 
         Returns
         -------
@@ -161,19 +1237,34 @@ class Analyzer(object):
             Formatted results
         """
 
-        results = self._results.copy()
-        results_formatted = results.drop(columns="word_objs")
+        self._prepare_words_if_needed()
 
-        return results_formatted
+        return self._results
 
-    def save_results(self, filename="results"):
-        """Save the results to a CSV file.
+    @_measured("save_results")
+    def save_results(
+        self, filename="results", append=False, format="csv"  # noqa: A002
+    ):
+        """Save the results to a file.
 
         Parameters
         ----------
         filename : str, default="results"
             Filename. If a complete path is provided, it will be saved
-            in the specific path. It must not include the file's extension.
+            in the specific path. It must not include the file's extension,
+            which is added based on the format.
+        append : bool, default=False
+            Whether to add the results to the end of the file, without a
+            header, instead of overwriting it. Only CSV and SQLite files can
+            be appended to.
+        format : {"csv", "csv.gz", "csv.zst", "parquet", "feather", "arrow", "sqlite"}
+            Format of the file. "csv.gz" and "csv.zst" are CSV files
+            compressed with gzip and zstd. "parquet", "feather" and "arrow"
+            (Arrow IPC, the same as feather) are columnar formats that store
+            the features with compact integer dtypes; they require pyarrow.
+            "sqlite" stores the results in the "results" table of a SQLite
+            database, keyed by their position and indexed by text and total
+            difficulty.
 
         Returns
         -------
@@ -181,33 +1272,470 @@ class Analyzer(object):
         """
 
         results_formatted = self._format_results()
-        filename = f"{filename}.csv"
-        results_formatted.to_csv(filename, index=False)
+        dtypes = {"total_difficulty": _total_difficulty_dtype(self._weights)}
+        writers.write_results(results_formatted, filename, format, append, dtypes)
+
+    def run_analyses(self, analyses, jobs=None, executor=None):
+        """Run the selected analyses.
+
+        The analyses are run in the order needed to compute them (i.e.,
+        total_difficulty is always run last), regardless of the order in
+        which they are given.
+
+        Parameters
+        ----------
+        analyses : iterable of str
+            Names of the analyses to run. Valid names are the keys of
+            ANALYSES: length, silent_letters, shared_phonemes and
+            total_difficulty.
+        jobs : int, optional
+            Number of processes used to run the analyses. Overrides the
+            jobs given when the analyzer was created.
+        executor : concurrent.futures.Executor, optional
+            Executor used to run parallel analyses. Overrides the executor
+            given when the analyzer was created.
+
+        Returns
+        -------
+        None
+
+        Raises
+        ------
+        ValueError
+            If an analysis is not valid, or if jobs is not -1 or a positive
+            integer.
+        """
 
-    def run_all_analyses(self):
+        analyses = set(analyses)
+        invalid_analyses = analyses.difference(ANALYSES)
+        if invalid_analyses:
+            raise ValueError(f"{sorted(invalid_analyses)} are not valid analyses")
+        _check_jobs(jobs)
+
+        jobs = jobs or self._jobs
+        executor = executor or self._executor
+        parallel = (jobs is not None and jobs != 1) or executor is not None
+        features = [
+            analysis
+            for analysis in ANALYSES
+            if analysis in analyses and analysis != "total_difficulty"
+        ]
+        # total_difficulty alone is computed from the features already there
+        if parallel and features and self._index is None and self._cache is None:
+            self._precompute_features_in_parallel(features, jobs or -1, executor)
+        elif self._engine == "numpy" and len(features) > 1:
+            self._precompute_features(features)
+
+        for analysis, method in ANALYSES.items():
+            if analysis in analyses:
+                getattr(self, method)()
+
+    def run_all_analyses(self, jobs=None, executor=None):
         """Run all analyses.
 
         This is a convenient function to run all analyses and simplify
         the process for the user.
 
+        Parameters
+        ----------
+        jobs : int, optional
+            Number of processes used to run the analyses. Overrides the
+            jobs given when the analyzer was created.
+        executor : concurrent.futures.Executor, optional
+            Executor used to run parallel analyses. Overrides the executor
+            given when the analyzer was created.
+
         Returns
         -------
         None
         """
 
-        self.check_length_difficulty()
-        self.check_silent_letter_difficulty()
-        self.check_shared_phonemes_difficulty()
-        self.determine_total_difficulty()
+        self.run_analyses(ANALYSES, jobs, executor)
+
+    @classmethod
+    def stream(
+        cls, words, chunksize=10000, analyses=None, on_invalid_words=None, **options
+    ):
+        """Analyze the words in chunks, yielding the results of each chunk.
+
+        Only one chunk of words is held in memory at a time, so any number
+        of words can be analyzed (e.g., the lines of a large file).
+
+        Parameters
+        ----------
+        words : iterable
+            Contains the words to be analyzed. It is consumed lazily.
+        chunksize : int, default=10000
+            Number of words analyzed at a time.
+        analyses : iterable of str, optional
+            Names of the analyses to run. All analyses are run by default.
+        on_invalid_words : callable, optional
+            Function called with the invalid words of each chunk that has
+            any when errors is "collect" (see invalid_words). Their
+            position is the position of the word in the stream.
+        **options
+            Other arguments used to create the Analyzer for each chunk
+            (e.g., engine). If jobs is given without an executor, a single
+            pool of processes is used for all chunks. An index or a cache
+            given as a path is also opened once for all chunks.
+
+        Yields
+        ------
+        results : pandas.DataFrame
+            Formatted results of the next chunk. The index continues the
+            index of the previous chunk.
+
+        Raises
+        ------
+        ValueError
+            If chunksize is not a positive integer.
+        """
+
+        offset = 0
+        chunks = cls._stream_analyzers(
+            words, chunksize, analyses, options, on_invalid_words
+        )
+        # the analyzers of the chunks are discarded, so their results are
+        # used without copying them
+        for analyzer in chunks:
+            results = analyzer._format_results()
+            results.index += offset
+            offset += len(results)
+            yield results
+
+    @classmethod
+    def save_stream(
+        cls,
+        words,
+        filename="results",
+        chunksize=10000,
+        analyses=None,
+        format="csv",  # noqa: A002
+        resume=False,
+        on_invalid_words=None,
+        **options,
+    ):
+        """Analyze the words in chunks, saving the results to a file.
+
+        The results of each chunk are written to the file as soon as they
+        are available (as a row group in parquet files, or a transaction in
+        SQLite files), so memory use does not grow with the number of words.
+
+        Parameters
+        ----------
+        words : iterable
+            Contains the words to be analyzed. It is consumed lazily.
+        filename : str, default="results"
+            Filename. If a complete path is provided, it will be saved
+            in the specific path. It must not include the file's extension.
+        chunksize : int, default=10000
+            Number of words analyzed at a time.
+        analyses : iterable of str, optional
+            Names of the analyses to run. All analyses are run by default.
+        format : {"csv", "csv.gz", "csv.zst", "parquet", "feather", "arrow", "sqlite"}
+            Format of the file. See save_results.
+        resume : bool, default=False
+            Whether to resume a previous run that was interrupted, skipping
+            the words whose results are already in the file instead of
+            overwriting it. Only SQLite files can be resumed, and since the
+            skipped words are not analyzed, invalid words must raise an
+            error (i.e., errors="raise").
+        on_invalid_words : callable, optional
+            Function called with the invalid words of each chunk that has
+            any when errors is "collect" (see invalid_words). Their
+            position is the position of the word in the stream.
+        **options
+            Other arguments used to create the Analyzer for each chunk
+            (e.g., engine).
+
+        Returns
+        -------
+        n_words : int
+            Number of words analyzed.
+
+        Raises
+        ------
+        ValueError
+            If resume is used with a format other than "sqlite" or with
+            errors other than "raise".
+        """
+
+        if resume:
+            if format != "sqlite":
+                raise ValueError("only sqlite files can be resumed")
+            if options.get("errors", "raise") != "raise":
+                raise ValueError("resuming requires errors='raise'")
+
+        n_words = 0
+        weights = options.get("weights") or {}
+        dtypes = {"total_difficulty": _total_difficulty_dtype(weights)}
+        with writers.ResultsWriter(
+            filename, format, append=resume, dtypes=dtypes
+        ) as writer:
+            # every word has a result, so the next result is the next word
+            offset = writer.next_position() if resume else 0
+            words = islice(words, offset, None)
+            chunks = cls._stream_analyzers(
+                words, chunksize, analyses, options, on_invalid_words
+            )
+            for analyzer in chunks:
+                results = analyzer._format_results()
+                results.index += offset
+                offset += len(results)
+                writer.write(results)
+                n_words += len(analyzer._results)
+
+        return n_words
+
+    @classmethod
+    def top_k(
+        cls,
+        words,
+        k=10,
+        by="total_difficulty",
+        largest=True,
+        distinct=True,
+        chunksize=10000,
+        on_invalid_words=None,
+        **options,
+    ):
+        """Find the k hardest (or easiest) words in a stream of words.
+
+        The words are analyzed in chunks and only the best k are kept in a
+        heap, so memory use does not grow with the number of words. Ties
+        are broken by the position of the words: the first one wins.
+
+        Parameters
+        ----------
+        words : iterable
+            Contains the words to be analyzed. It is consumed lazily.
+        k : int, default=10
+            Number of words to find.
+        by : {"total_difficulty", "length", "silent_letters", "shared_phonemes"}
+            Analysis used to rank the words.
+        largest : bool, default=True
+            Whether to find the words with the largest values (the hardest)
+            instead of the smallest ones (the easiest).
+        distinct : bool, default=True
+            Whether to keep only the first occurrence of repeated words.
+        chunksize : int, default=10000
+            Number of words analyzed at a time.
+        on_invalid_words : callable, optional
+            Function called with the invalid words of each chunk that has
+            any when errors is "collect" (see invalid_words). Their
+            position is the position of the word in the stream.
+        **options
+            Other arguments used to create the Analyzer for each chunk
+            (e.g., engine).
+
+        Returns
+        -------
+        top_words : pandas.DataFrame
+            Results of the best k words, from the best to the worst. The
+            index is the position of each word in the results of the stream.
+
+        Raises
+        ------
+        ValueError
+            If k is negative, by is not a valid analysis or chunksize is
+            not a positive integer.
+        """
+
+        if k < 0:
+            raise ValueError("k must not be negative")
+        if by not in ANALYSES:
+            raise ValueError(f"'{by}' is not a valid analysis")
+
+        # min-heap of the best words with the worst one first. A word is
+        # worse if it has a worse value or the same value and comes later
+        heap = []
+        heap_texts = set()
+        sign = 1 if largest else -1
+        columns = ["text", *ANALYSES]
+        offset = 0
+        chunks = cls._stream_analyzers(
+            words, chunksize, ANALYSES, options, on_invalid_words
+        )
+        for analyzer in chunks:
+            results = analyzer._format_results()
+            columns = list(results.columns)
+            column_values = [results[column].to_numpy() for column in columns]
+            texts = results["text"].to_numpy()
+            scores = sign * results[by].to_numpy(dtype=np.float64)
+            rows = np.arange(len(results))
+
+            # words of the chunk come after the ones in the heap, so they
+            # need a better value to replace the worst one
+            if k and len(heap) == k:
+                rows = rows[scores > heap[0][0]]
+            # the best words first, so the first occurrence of each text is
+            # found before the others and the loop ends at the first word
+            # that is not better than the worst one in the heap
+            rows = rows[np.lexsort((rows, -scores[rows]))]
+            if not distinct:
+                rows = rows[:k]
+            for row in rows:
+                if distinct and texts[row] in heap_texts:
+                    continue
+                position = offset + row
+                values = tuple(values[row] for values in column_values)
+                entry = (scores[row], -position, position, values)
+                if len(heap) < k:
+                    heapq.heappush(heap, entry)
+                elif k and entry > heap[0]:
+                    removed_entry = heapq.heapreplace(heap, entry)
+                    heap_texts.discard(removed_entry[3][0])
+                else:
+                    break
+                heap_texts.add(texts[row])
+            offset += len(results)
+
+        heap.sort(reverse=True)
+        top_words = pd.DataFrame(
+            [entry[3] for entry in heap],
+            index=pd.Index([entry[2] for entry in heap], dtype="int64"),
+            columns=columns,
+        )
+
+        return top_words
+
+    @classmethod
+    def _stream_analyzers(
+        cls, words, chunksize, analyses, options, on_invalid_words=None
+    ):
+        """Create an analyzer for each chunk of words and run the analyses.
+
+        Parameters
+        ----------
+        words : iterable
+            Contains the words to be analyzed. It is consumed lazily.
+        chunksize : int
+            Number of words analyzed at a time.
+        analyses : iterable of str or None
+            Names of the analyses to run. All analyses are run if None.
+        options : dict
+            Other arguments used to create the Analyzer for each chunk.
+        on_invalid_words : callable, optional
+            Function called with the invalid words of each chunk that has
+            any, with their position in the stream.
+
+        Yields
+        ------
+        analyzer : Analyzer
+            Analyzer of the next chunk, with the analyses already run.
+
+        Raises
+        ------
+        ValueError
+            If chunksize is not a positive integer.
+        """
+
+        if chunksize < 1:
+            raise ValueError("chunksize must be a positive integer")
+        if analyses is None:
+            analyses = ANALYSES
+
+        # the index and the cache given as paths are opened once for all
+        # chunks, like the pool of processes
+        index = options.get("index")
+        if index is not None and not isinstance(index, lexicon.LexiconIndex):
+            options = {**options, "index": lexicon.LexiconIndex(index)}
+        cache = options.get("cache")
+        if cache is not None and not isinstance(cache, result_cache.ResultCache):
+            with result_cache.ResultCache(cache) as cache:
+                options = {**options, "cache": cache}
+                yield from cls._stream_analyzers(
+                    words, chunksize, analyses, options, on_invalid_words
+                )
+            return
+
+        jobs = options.get("jobs")
+        if jobs not in (None, 1) and options.get("executor") is None:
+            # a single pool of processes is reused for all chunks
+            _check_jobs(jobs)
+            max_workers = None if jobs == -1 else jobs
+            with futures.ProcessPoolExecutor(max_workers) as executor:
+                options = {**options, "executor": executor}
+                yield from cls._stream_analyzers(
+                    words, chunksize, analyses, options, on_invalid_words
+                )
+            return
+
+        n_input_words = 0
+        for chunk in _chunk(words, chunksize):
+            analyzer = cls(chunk, **options)
+            analyzer.run_analyses(analyses)
+            if on_invalid_words is not None and not analyzer._invalid_words.empty:
+                invalid_words = analyzer.invalid_words
+                invalid_words["position"] += n_input_words
+                on_invalid_words(invalid_words)
+            n_input_words += len(chunk)
+            yield analyzer
 
     @property
     def results(self):
         """Return the results.
 
+        The results are copied when they change, and the same copy is
+        returned until a new analysis is run, so reading them is cheap.
+        Modifying the copy does not change the results of the analyzer
+        (e.g., the ones saved by save_results).
+
         Returns
         -------
         results : pandas.DataFrame
             Formatted results
         """
 
-        return self._format_results()
+        if self._formatted_results is None:
+            self._formatted_results = self._format_results().copy()
+
+        return self._formatted_results
+
+    @property
+    def stats(self):
+        """Return the stats of the stages run by the analyzer.
+
+        Returns
+        -------
+        Stats or None
+            Records of the stages, which can be exported with to_dict or
+            to_json. None if the analyzer was created without stats.
+        """
+
+        return self._stats
+
+    @property
+    def invalid_words(self):
+        """Return the invalid words found when the errors option is "collect".
+
+        Returns
+        -------
+        invalid_words : pandas.DataFrame
+            Position of each invalid word among all the words given to the
+            analyzer, the word as it was given and why it is invalid.
+        """
+
+        self._prepare_words_if_needed()
+
+        return self._invalid_words.copy()
+
+    @property
+    def collapsed_results(self):
+        """Return the results with a single row for each distinct word.
+
+        The words are in the order in which they first appear.
+
+        Returns
+        -------
+        collapsed_results : pandas.DataFrame
+            Formatted results with a "count" column with the number of
+            times each word appears.
+        """
+
+        results = self._format_results()
+        counts = results["text"].value_counts(sort=False)
+        collapsed_results = results.drop_duplicates(subset="text", ignore_index=True)
+        collapsed_results["count"] = collapsed_results["text"].map(counts).to_numpy()
+
+        return collapsed_results
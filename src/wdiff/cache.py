@@ -0,0 +1,276 @@
+"""Module that defines the persistent cache of the features of words.
+
+The features are stored in a SQLite database, keyed by the normalized text
+of the words and the fingerprint of the rules that computed them, so the
+features computed with other rules are never used. The cache can be limited
+to a number of words, evicting the ones used least recently.
+"""
+
+import sqlite3
+import time
+from itertools import islice
+
+from ._lazy import lazy_import
+from .lexicon import rules_fingerprint
+
+np = lazy_import("numpy")
+pd = lazy_import("pandas")
+
+FEATURES = ("length", "silent_letters", "shared_phonemes")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS features (
+    fingerprint TEXT NOT NULL,
+    text TEXT NOT NULL,
+    length INTEGER,
+    silent_letters INTEGER,
+    shared_phonemes INTEGER,
+    last_used INTEGER NOT NULL,
+    PRIMARY KEY (fingerprint, text)
+);
+CREATE INDEX IF NOT EXISTS features_last_used ON features (last_used);
+"""
+
+
+class ResultCache(object):
+    """Persistent cache of the features of words.
+
+    Each feature is cached separately, so analyses that were not run are
+    simply missing. The cache can be shared by several analyzers (e.g., the
+    chunks of Analyzer.stream) but not by several threads.
+    """
+
+    def __init__(self, path, max_entries=None, batch_size=10000):
+        """
+        Parameters
+        ----------
+        path : str or path-like
+            SQLite database file. It is created if it does not exist.
+        max_entries : int, optional
+            Maximum number of words kept in the cache. The words used least
+            recently are evicted when it is exceeded. Unlimited by default.
+        batch_size : int, default=10000
+            Number of words written with each statement.
+        """
+
+        self.path = path
+        self.max_entries = max_entries
+        self._batch_size = batch_size
+        self._fingerprint = rules_fingerprint()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        # words are marked as used when the cache is opened, so each word
+        # is only marked the first time it is used
+        self._session = time.time_ns()
+        self._connection = sqlite3.connect(path)
+        self._connection.execute("PRAGMA journal_mode = WAL")
+        self._connection.execute("PRAGMA synchronous = NORMAL")
+        self._connection.executescript(_SCHEMA)
+
+    def _check_feature(self, feature):
+        """Check that the feature can be cached.
+
+        Parameters
+        ----------
+        feature : str
+            Feature to be checked.
+
+        Returns
+        -------
+        None
+
+        Raises
+        ------
+        ValueError
+            If the feature is not one of FEATURES.
+        """
+
+        if feature not in FEATURES:
+            raise ValueError(f"'{feature}' can't be cached")
+
+    def get(self, texts, feature):
+        """Get the cached feature of the texts.
+
+        Parameters
+        ----------
+        texts : pandas.Series
+            Normalized words' text
+        feature : str
+            Feature to be looked up.
+
+        Returns
+        -------
+        features : numpy.ndarray
+            Feature of each text, or -1 if it is not cached.
+
+        Raises
+        ------
+        ValueError
+            If the feature can't be cached.
+        """
+
+        self._check_feature(feature)
+        codes, unique_texts = pd.factorize(texts)
+        features = np.full(len(unique_texts), -1, dtype=np.int64)
+
+        with self._connection:
+            self._connection.execute(
+                "CREATE TEMP TABLE IF NOT EXISTS lookup "
+                "(position INTEGER PRIMARY KEY, text TEXT)"
+            )
+            self._connection.execute("DELETE FROM temp.lookup")
+            self._connection.executemany(
+                "INSERT INTO temp.lookup VALUES (?, ?)", enumerate(unique_texts)
+            )
+            rows = self._connection.execute(
+                f"SELECT lookup.position, features.{feature} FROM temp.lookup "
+                "JOIN features ON features.fingerprint = ? "
+                "AND features.text = lookup.text "
+                f"WHERE features.{feature} IS NOT NULL",
+                (self._fingerprint,),
+            ).fetchall()
+            self._connection.execute(
+                "UPDATE features SET last_used = ? WHERE fingerprint = ? "
+                "AND last_used < ? AND text IN (SELECT text FROM temp.lookup)",
+                (self._session, self._fingerprint, self._session),
+            )
+
+        if rows:
+            positions, values = zip(*rows)
+            features[list(positions)] = values
+        self._hits += len(rows)
+        self._misses += len(unique_texts) - len(rows)
+
+        return features[codes]
+
+    def put(self, texts, feature, values):
+        """Cache the feature of the texts.
+
+        The words are written in batches in a single transaction, and then
+        the least recently used words are evicted if the cache is full.
+
+        Parameters
+        ----------
+        texts : pandas.Series
+            Normalized words' text
+        feature : str
+            Feature to be cached.
+        values : array-like
+            Feature of each text.
+
+        Returns
+        -------
+        None
+
+        Raises
+        ------
+        ValueError
+            If the feature can't be cached.
+        """
+
+        self._check_feature(feature)
+        # repeated texts are written once
+        text_values = dict(zip(texts, np.asarray(values).tolist()))
+        rows = (
+            (self._fingerprint, text, value, self._session)
+            for text, value in text_values.items()
+        )
+        statement = (
+            f"INSERT INTO features (fingerprint, text, {feature}, last_used) "
+            "VALUES (?, ?, ?, ?) ON CONFLICT (fingerprint, text) DO UPDATE SET "
+            f"{feature} = excluded.{feature}, last_used = excluded.last_used"
+        )
+        with self._connection:
+            batch = list(islice(rows, self._batch_size))
+            while batch:
+                self._connection.executemany(statement, batch)
+                batch = list(islice(rows, self._batch_size))
+
+        if self.max_entries is not None:
+            self.evict(self.max_entries)
+
+    def evict(self, max_entries=0):
+        """Evict words until at most max_entries are cached.
+
+        The words cached with other rules are evicted first, and then the
+        ones used least recently.
+
+        Parameters
+        ----------
+        max_entries : int, default=0
+            Number of words to keep.
+
+        Returns
+        -------
+        None
+        """
+
+        with self._connection:
+            n_words = len(self)
+            if n_words <= max_entries:
+                return
+            cursor = self._connection.execute(
+                "DELETE FROM features WHERE fingerprint != ?", (self._fingerprint,)
+            )
+            n_evictions = cursor.rowcount
+            n_excess = n_words - n_evictions - max_entries
+            if n_excess > 0:
+                cursor = self._connection.execute(
+                    "DELETE FROM features WHERE rowid IN "
+                    "(SELECT rowid FROM features ORDER BY last_used LIMIT ?)",
+                    (n_excess,),
+                )
+                n_evictions += cursor.rowcount
+        self._evictions += n_evictions
+
+    def clear(self):
+        """Remove all the cached words.
+
+        Returns
+        -------
+        None
+        """
+
+        with self._connection:
+            self._connection.execute("DELETE FROM features")
+
+    def info(self):
+        """Get the statistics of the cache.
+
+        Returns
+        -------
+        dict
+            Number of hits, misses and evictions since the cache was
+            opened, and its current size and capacity.
+        """
+
+        return {
+            "hits": self._hits,
+            "misses": self._misses,
+            "evictions": self._evictions,
+            "size": len(self),
+            "capacity": self.max_entries,
+        }
+
+    def close(self):
+        """Close the database.
+
+        Returns
+        -------
+        None
+        """
+
+        self._connection.close()
+
+    def __len__(self):
+        (n_words,) = self._connection.execute(
+            "SELECT COUNT(*) FROM features"
+        ).fetchone()
+        return n_words
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
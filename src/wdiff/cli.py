@@ -1,18 +1,291 @@
 """Console script for wdiff."""
+from contextlib import nullcontext
+from typing import IO, Any, Iterator, Optional, Tuple
+
 import click
 
 from wdiff import __version__
+from wdiff._lazy import lazy_import
+from wdiff.analyzer import ANALYSES, ENGINES, Analyzer
+from wdiff.cache import ResultCache
+from wdiff.lexicon import LexiconIndex, build_index
+
+futures = lazy_import("concurrent.futures")
+pd = lazy_import("pandas")
 
 
-@click.command()
+@click.group(invoke_without_command=True)
 @click.version_option(version=__version__)
-def main() -> int:
+@click.pass_context
+def main(ctx: click.Context) -> int:
     """Console script for wdiff."""
-    click.echo("This is the cli for the wdiff project")
-    click_url = "https://click.palletsprojects.com/"
-    click.echo(f"See the click docs at {click_url} for more details")
+    if ctx.invoked_subcommand is None:
+        click.echo(ctx.get_help())
     return 0
 
 
+def _validate_jobs(ctx: click.Context, param: click.Parameter, value: int) -> int:
+    """Check that the number of processes is -1 or a positive integer."""
+    if value != -1 and value < 1:
+        raise click.BadParameter("must be -1 or a positive integer.")
+    return value
+
+
+def _read_words(input_file: IO, column: Optional[str], chunksize: int) -> Iterator[str]:
+    """Read the words lazily from a newline-delimited file or a CSV column.
+
+    Blank lines of newline-delimited files are skipped.
+    """
+    if column is None:
+        for line in input_file:
+            if line.strip():
+                yield line.rstrip("\r\n")
+    else:
+        reader = pd.read_csv(input_file, usecols=[column], chunksize=chunksize)
+        for chunk in reader:
+            yield from chunk[column]
+
+
+@main.command()
+@click.argument("input_file", metavar="INPUT", type=click.File("r"))
+@click.option(
+    "-o",
+    "--output",
+    type=click.File("w"),
+    default="-",
+    show_default=True,
+    help="CSV file where the results are written. Defaults to stdout.",
+)
+@click.option(
+    "-a",
+    "--analyses",
+    type=click.Choice(list(ANALYSES)),
+    multiple=True,
+    help="Analysis to run. Can be repeated. All analyses are run by default.",
+)
+@click.option(
+    "-c",
+    "--column",
+    default=None,
+    help="Read the words from this column of a CSV file instead of one per line.",
+)
+@click.option(
+    "--chunksize",
+    type=click.IntRange(min=1),
+    default=10000,
+    show_default=True,
+    help="Number of words analyzed at a time.",
+)
+@click.option(
+    "--engine",
+    type=click.Choice(ENGINES),
+    default="numpy",
+    show_default=True,
+    help="Engine used to run the analyses.",
+)
+@click.option(
+    "-j",
+    "--jobs",
+    type=int,
+    default=1,
+    show_default=True,
+    callback=_validate_jobs,
+    help="Number of processes used to analyze each chunk. -1 uses all cores.",
+)
+@click.option(
+    "--deduplicate/--no-deduplicate",
+    default=False,
+    show_default=True,
+    help="Analyze each distinct word of a chunk only once.",
+)
+@click.option(
+    "--index",
+    "index_path",
+    type=click.Path(file_okay=False),
+    default=None,
+    help="Look up the words in a lexicon index built with 'wdiff index'.",
+)
+@click.option(
+    "--cache",
+    "cache_path",
+    type=click.Path(dir_okay=False),
+    default=None,
+    help="SQLite file where the features are cached across runs.",
+)
+@click.option(
+    "--invalid",
+    "invalid_output",
+    type=click.File("w"),
+    default=None,
+    help="Skip the invalid words and write them to this CSV file with their "
+    "position and why they are invalid, instead of failing.",
+)
+def analyze(
+    input_file: IO,
+    output: IO,
+    analyses: Tuple[str, ...],
+    column: Optional[str],
+    chunksize: int,
+    engine: str,
+    jobs: int,
+    deduplicate: bool,
+    index_path: Optional[str],
+    cache_path: Optional[str],
+    invalid_output: Optional[IO],
+) -> None:
+    """Analyze the words in INPUT and write the results as CSV.
+
+    INPUT is a file with one word per line, or a CSV file if --column is
+    given. Use - to read from stdin. The words are streamed in chunks, so
+    files of any size can be analyzed.
+    """
+    def write_invalid_words(invalid_words: Any) -> None:
+        invalid_words.to_csv(invalid_output, index=False, header=False)
+
+    errors = "collect" if invalid_output is not None else "raise"
+    on_invalid_words = write_invalid_words if invalid_output is not None else None
+    if invalid_output is not None:
+        # the header is written even if no word is invalid
+        invalid_output.write("position,word,reason\n")
+
+    try:
+        index = LexiconIndex(index_path) if index_path else None
+    except ValueError as error:
+        raise click.ClickException(str(error))
+    cache = ResultCache(cache_path) if cache_path else None
+    words = _read_words(input_file, column, chunksize)
+    # a single pool of processes is reused for all chunks
+    max_workers = None if jobs == -1 else jobs
+    pool = futures.ProcessPoolExecutor(max_workers) if jobs != 1 else nullcontext()
+    with pool as executor, cache if cache is not None else nullcontext():
+        chunks = Analyzer.stream(
+            words,
+            chunksize=chunksize,
+            analyses=analyses or None,
+            engine=engine,
+            deduplicate=deduplicate,
+            jobs=jobs,
+            executor=executor,
+            index=index,
+            cache=cache,
+            errors=errors,
+            on_invalid_words=on_invalid_words,
+        )
+        try:
+            for n_chunk, results in enumerate(chunks):
+                results.to_csv(output, index=False, header=n_chunk == 0)
+        except ValueError as error:
+            raise click.ClickException(str(error))
+
+
+@main.command()
+@click.argument("input_file", metavar="INPUT", type=click.File("r"))
+@click.option(
+    "-k",
+    type=click.IntRange(min=0),
+    default=10,
+    show_default=True,
+    help="Number of words to find.",
+)
+@click.option(
+    "--by",
+    type=click.Choice(list(ANALYSES)),
+    default="total_difficulty",
+    show_default=True,
+    help="Analysis used to rank the words.",
+)
+@click.option(
+    "--hardest/--easiest",
+    default=True,
+    show_default=True,
+    help="Find the words with the largest or the smallest values.",
+)
+@click.option(
+    "--distinct/--all-occurrences",
+    default=True,
+    show_default=True,
+    help="Keep only the first occurrence of repeated words.",
+)
+@click.option(
+    "-o",
+    "--output",
+    type=click.File("w"),
+    default="-",
+    show_default=True,
+    help="CSV file where the words are written. Defaults to stdout.",
+)
+@click.option(
+    "-c",
+    "--column",
+    default=None,
+    help="Read the words from this column of a CSV file instead of one per line.",
+)
+@click.option(
+    "--chunksize",
+    type=click.IntRange(min=1),
+    default=10000,
+    show_default=True,
+    help="Number of words analyzed at a time.",
+)
+@click.option(
+    "--engine",
+    type=click.Choice(ENGINES),
+    default="numpy",
+    show_default=True,
+    help="Engine used to run the analyses.",
+)
+def top(
+    input_file: IO,
+    k: int,
+    by: str,
+    hardest: bool,
+    distinct: bool,
+    output: IO,
+    column: Optional[str],
+    chunksize: int,
+    engine: str,
+) -> None:
+    """Find the K hardest (or easiest) words in INPUT and write them as CSV.
+
+    INPUT is read like in 'wdiff analyze', and only K words are kept in
+    memory. Ties are broken by the position of the words. The words are
+    written from the best to the worst.
+    """
+    words = _read_words(input_file, column, chunksize)
+    try:
+        top_words = Analyzer.top_k(
+            words,
+            k,
+            by=by,
+            largest=hardest,
+            distinct=distinct,
+            chunksize=chunksize,
+            engine=engine,
+        )
+    except ValueError as error:
+        raise click.ClickException(str(error))
+    top_words.to_csv(output, index=False)
+
+
+@main.command("index")
+@click.argument("input_file", metavar="LEXICON", type=click.File("r"))
+@click.argument("output", type=click.Path(file_okay=False))
+@click.option(
+    "-c",
+    "--column",
+    default=None,
+    help="Read the words from this column of a CSV file instead of one per line.",
+)
+def index_(input_file: IO, output: str, column: Optional[str]) -> None:
+    """Build an index with the features of the words in LEXICON.
+
+    LEXICON is a file with one word per line, or a CSV file if --column is
+    given. The index is saved in the OUTPUT directory and is used with
+    'wdiff analyze --index'. Invalid words are left out.
+    """
+    lexicon_index = build_index(_read_words(input_file, column, 100000), output)
+    click.echo(f"{len(lexicon_index)} words indexed in {output}")
+
+
 if __name__ == "__main__":
     main()  # pragma: no cover
@@ -1,9 +0,0 @@
-from docrep import DocstringProcessor
-
-
-class CustomDoctringProcessor(DocstringProcessor):
-    param_like_sections = ["Rules"] + DocstringProcessor.param_like_sections
-
-
-docstrings = CustomDoctringProcessor()
-_COMMON_SECTIONS = ["Rules"]  # sections to be extracted from most docstrings
@@ -0,0 +1,350 @@
+"""Module that defines the numpy analysis engine.
+
+The words' text is encoded as a padded matrix of character codes, with
+one row per word and one column per character position. Every rule of the
+Word class is then computed as vectorized comparisons between the matrix
+and copies of it shifted one column to the left or to the right.
+"""
+
+import numpy as np
+import pandas as pd
+
+ALPHABET = "aábcdeéfghiíjklmnñoópqrstuúüvwxyz "
+PADDING = 0
+
+# all characters of the alphabet are in latin-1, so their code point fits
+# in a byte and is used as their code. Code 0 is left for the padding
+_CODES = {char: ord(char) for char in ALPHABET}
+# UTF-8 encodes the non-ASCII characters of the alphabet as this byte
+# followed by their code point minus _UTF8_OFFSET
+_UTF8_LEAD_BYTE = 0xC3
+_UTF8_OFFSET = 0x40
+# the texts are analyzed in blocks of rows, so the matrices fit in the cache
+_BLOCK_SIZE = 2**16
+
+
+def _codes(chars):
+    """Get the codes of the characters.
+
+    Parameters
+    ----------
+    chars : str
+        Characters from the alphabet
+
+    Returns
+    -------
+    list of int
+        Code of each character.
+    """
+
+    return [_CODES[char] for char in chars]
+
+
+def _read_utf8_codes(array):
+    """Read the codes of the characters of texts stored in an Arrow array.
+
+    The UTF-8 bytes of the texts are read from the buffers of the array
+    without converting them to Python strings.
+
+    Parameters
+    ----------
+    array : pyarrow.Array or pyarrow.ChunkedArray
+        Normalized and validated words' text
+
+    Returns
+    -------
+    codes : numpy.ndarray
+        Code of each character of all texts, one text after another.
+    lengths : numpy.ndarray
+        Number of characters of each text.
+    """
+
+    import pyarrow.compute as pc
+
+    if hasattr(array, "combine_chunks"):
+        array = array.combine_chunks()
+    offset_dtype = np.int64 if "large" in str(array.type) else np.int32
+    _, offsets_buffer, data_buffer = array.buffers()
+    offsets = np.frombuffer(offsets_buffer, dtype=offset_dtype)
+    start, end = offsets[array.offset], offsets[array.offset + len(array)]
+    data = np.frombuffer(data_buffer, dtype=np.uint8)[start:end]
+
+    codes = data[data != _UTF8_LEAD_BYTE]
+    codes[codes >= 0x80] += _UTF8_OFFSET
+    lengths = pc.utf8_length(array).to_numpy().astype(np.int64)
+
+    return codes, lengths
+
+
+def encode(texts):
+    """Encode the texts as a padded matrix of character codes.
+
+    Parameters
+    ----------
+    texts : pandas.Series
+        Normalized and validated words' text
+
+    Returns
+    -------
+    matrix : numpy.ndarray
+        Matrix of shape (number of texts, length of the longest text) with
+        the code of each character. Positions after the end of a text are
+        filled with PADDING.
+    lengths : numpy.ndarray
+        Number of characters of each text.
+    """
+
+    if len(texts) == 0:
+        return np.zeros((0, 0), dtype=np.uint8), np.zeros(0, dtype=np.int64)
+
+    if texts.dtype != object and hasattr(texts.array, "__arrow_array__"):
+        # pyarrow is installed if the texts are stored in Arrow arrays
+        import pyarrow as pa
+
+        codes, lengths = _read_utf8_codes(pa.array(texts.array))
+    else:
+        texts = texts.to_list()
+        codes = np.frombuffer("".join(texts).encode("latin-1"), dtype=np.uint8)
+        lengths = np.fromiter(map(len, texts), dtype=np.int64, count=len(texts))
+
+    # the codes of each text fill the first positions of its row
+    width = lengths.max()
+    matrix = np.full((len(lengths), width), PADDING, dtype=np.uint8)
+    matrix[np.arange(width) < lengths[:, np.newaxis]] = codes
+
+    return matrix, lengths
+
+
+def _shift(matrix, offset):
+    """Shift the columns of the matrix filling the gaps with PADDING.
+
+    Parameters
+    ----------
+    matrix : numpy.ndarray
+        Encoded texts
+    offset : int
+        Number of columns to shift. Positive values get the characters
+        that follow each position and negative values the ones that
+        precede it.
+
+    Returns
+    -------
+    shifted : numpy.ndarray
+        Shifted matrix with the same shape as matrix.
+    """
+
+    shifted = np.full_like(matrix, PADDING)
+    if offset > 0:
+        shifted[:, :-offset] = matrix[:, offset:]
+    else:
+        shifted[:, -offset:] = matrix[:, :offset]
+
+    return shifted
+
+
+def _is_any(matrix, chars):
+    """Check which positions of the matrix hold any of the characters.
+
+    Parameters
+    ----------
+    matrix : numpy.ndarray
+        Encoded texts
+    chars : str
+        Characters from the alphabet
+
+    Returns
+    -------
+    numpy.ndarray
+        Boolean matrix with the same shape as matrix.
+    """
+
+    matches = np.zeros(matrix.shape, dtype=bool)
+    for code in _codes(chars):
+        matches |= matrix == code
+
+    return matches
+
+
+def _count_rows(matches):
+    """Count the matches in each row.
+
+    Parameters
+    ----------
+    matches : numpy.ndarray
+        Boolean matrix
+
+    Returns
+    -------
+    numpy.ndarray
+        Number of matches in each row.
+    """
+
+    return np.count_nonzero(matches, axis=1).astype(np.int64)
+
+
+def _count_ll(matrix):
+    """Count the non-overlapping occurrences of *ll* in each row.
+
+    The columns are walked from left to right pairing each *l* with the
+    following one, which is how str.count pairs them.
+
+    Parameters
+    ----------
+    matrix : numpy.ndarray
+        Encoded texts
+
+    Returns
+    -------
+    numpy.ndarray
+        Number of *ll* in each row.
+    """
+
+    # transposed so each column is contiguous in memory
+    columns_is_l = np.ascontiguousarray((matrix == _CODES["l"]).T)
+    ll_count = np.zeros(len(matrix), dtype=np.int64)
+    l_unpaired = np.zeros(len(matrix), dtype=bool)
+    for column_is_l in columns_is_l:
+        ll_count += column_is_l & l_unpaired
+        l_unpaired = column_is_l & ~l_unpaired
+
+    return ll_count
+
+
+def count_silent_letters(matrix, lengths):
+    """Count the number of silent letters in each encoded text.
+
+    Parameters
+    ----------
+    matrix : numpy.ndarray
+        Encoded texts
+    lengths : numpy.ndarray
+        Number of characters of each text.
+
+    Returns
+    -------
+    silent_letter_count : numpy.ndarray
+        Number of silent letters in each text.
+    """
+
+    previous = _shift(matrix, -1)
+    following = _shift(matrix, 1)
+
+    silent_u = (
+        (matrix == _CODES["u"]) & _is_any(previous, "gq") & _is_any(following, "ei")
+    )
+    silent_h = (matrix == _CODES["h"]) & (previous != _CODES["c"])
+    silent_letter_count = _count_rows(silent_u | silent_h)
+
+    return silent_letter_count
+
+
+def count_shared_phonemes(matrix, lengths):
+    """Count the number of shared phonemes in each encoded text.
+
+    Parameters
+    ----------
+    matrix : numpy.ndarray
+        Encoded texts
+    lengths : numpy.ndarray
+        Number of characters of each text.
+
+    Returns
+    -------
+    shared_phoneme_count : numpy.ndarray
+        Number of shared phonemes in each text.
+    """
+
+    following = _shift(matrix, 1)
+    is_c = matrix == _CODES["c"]
+    is_g = matrix == _CODES["g"]
+
+    # s: z, s, ci, ce; b: b, v; y: y; j: j, ge, gi; k: k, q, ca, co, cu
+    unigrams = _is_any(matrix, "zsbvyjkq")
+    c_bigrams = is_c & _is_any(following, "ieaou")
+    g_bigrams = is_g & _is_any(following, "ei")
+    candidates_count = _count_rows(unigrams | c_bigrams | g_bigrams)
+
+    last_chars = matrix[np.arange(len(matrix)), np.maximum(lengths - 1, 0)]
+    final_y_count = (last_chars == _CODES["y"]).astype(np.int64)
+
+    shared_phoneme_count = candidates_count + _count_ll(matrix) - final_y_count
+
+    return shared_phoneme_count
+
+
+def count_length(matrix, lengths):
+    """Count the number of letters in each encoded text.
+
+    Parameters
+    ----------
+    matrix : numpy.ndarray
+        Encoded texts
+    lengths : numpy.ndarray
+        Number of characters of each text.
+
+    Returns
+    -------
+    numpy.ndarray
+        Number of letters in each text.
+    """
+
+    return lengths
+
+
+FEATURES = {
+    "length": count_length,
+    "silent_letters": count_silent_letters,
+    "shared_phonemes": count_shared_phonemes,
+}
+
+
+def compute_features(texts, features):
+    """Compute several features for all texts.
+
+    The texts are encoded once for all the features, in blocks of
+    _BLOCK_SIZE texts.
+
+    Parameters
+    ----------
+    texts : pandas.Series
+        Normalized and validated words' text
+    features : iterable of str
+        Features to be computed. Any of: length, silent_letters or
+        shared_phonemes.
+
+    Returns
+    -------
+    dict
+        pandas.Series with each feature of all texts.
+    """
+
+    blocks = {feature: [np.zeros(0, dtype=np.int64)] for feature in features}
+    for start in range(0, len(texts), _BLOCK_SIZE):
+        matrix, lengths = encode(texts.iloc[start : start + _BLOCK_SIZE])
+        for feature, feature_blocks in blocks.items():
+            feature_blocks.append(FEATURES[feature](matrix, lengths))
+
+    return {
+        feature: pd.Series(np.concatenate(feature_blocks), index=texts.index)
+        for feature, feature_blocks in blocks.items()
+    }
+
+
+def compute_feature(texts, feature):
+    """Compute a feature for all texts.
+
+    Parameters
+    ----------
+    texts : pandas.Series
+        Normalized and validated words' text
+    feature : str
+        Feature to be computed. One of: length, silent_letters or
+        shared_phonemes.
+
+    Returns
+    -------
+    pandas.Series
+        The feature of all texts.
+    """
+
+    return compute_features(texts, [feature])[feature]
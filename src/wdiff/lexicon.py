@@ -0,0 +1,278 @@
+"""Module that defines the precomputed feature index of a lexicon.
+
+The features of every word in a lexicon are computed once and stored in a
+directory with the sorted texts and one fixed-width column per feature.
+The files are memory-mapped when the index is loaded, so loading it is
+instant and the operating system only reads the pages that are looked up.
+Texts are found with a binary search.
+
+The index records a fingerprint of the source code of the rules, so an
+index built with other rules is detected and can be built again.
+"""
+
+import hashlib
+import json
+from functools import lru_cache
+from pathlib import Path
+
+from ._lazy import lazy_import
+from .word import Word
+
+np = lazy_import("numpy")
+pd = lazy_import("pandas")
+kernel = lazy_import("wdiff.kernel")
+vectorized = lazy_import("wdiff.vectorized")
+writers = lazy_import("wdiff.writers")
+
+FEATURES = ("length", "silent_letters", "shared_phonemes")
+# bumped when the files of the index change
+FORMAT_VERSION = 1
+# modules whose code determines the features
+_RULE_MODULES = ("scanner", "word", "kernel", "vectorized")
+_METADATA_FILE = "metadata.json"
+_TEXTS_FILE = "texts.npy"
+
+
+@lru_cache(maxsize=None)
+def rules_fingerprint():
+    """Compute the fingerprint of the rules used to determine the features.
+
+    Returns
+    -------
+    str
+        Hash of the format of the index and the source code of the modules
+        that implement the rules. It changes whenever any of them changes.
+    """
+
+    digest = hashlib.sha256(f"format {FORMAT_VERSION}".encode())
+    package_dir = Path(__file__).parent
+    for module in _RULE_MODULES:
+        digest.update((package_dir / f"{module}.py").read_bytes())
+
+    return digest.hexdigest()
+
+
+def _encode(texts):
+    """Encode the texts as UTF-8 bytes, which sort like the texts.
+
+    Parameters
+    ----------
+    texts : pandas.Series
+        Normalized words' text
+
+    Returns
+    -------
+    pandas.Series
+        Encoded texts.
+    """
+
+    return texts.str.encode("utf-8")
+
+
+def build_index(lexicon, path):
+    """Compute the features of a lexicon and save them as an index.
+
+    Invalid words are left out and repeated words are stored once.
+
+    Parameters
+    ----------
+    lexicon : iterable, list-like object
+        Contains the words of the lexicon.
+    path : str or path-like
+        Directory where the index is saved. It is created if it does not
+        exist, and an index already in it is replaced.
+
+    Returns
+    -------
+    LexiconIndex
+        The index, loaded from path.
+
+    Raises
+    ------
+    ValueError
+        If a feature does not fit in its compact dtype.
+    """
+
+    texts = vectorized.normalize_texts(lexicon)
+    texts = texts[~vectorized.find_invalid_texts(texts).to_numpy()]
+    keys, first_positions = np.unique(
+        np.array(_encode(texts).to_list(), dtype=bytes), return_index=True
+    )
+    texts = texts.iloc[first_positions].reset_index(drop=True)
+    features = pd.DataFrame(kernel.compute_features(texts, FEATURES))
+    features = writers.compact_dtypes(features)
+
+    path = Path(path)
+    path.mkdir(parents=True, exist_ok=True)
+    # the metadata is written last, so an incomplete index is never loaded
+    (path / _METADATA_FILE).unlink(missing_ok=True)
+    np.save(path / _TEXTS_FILE, keys)
+    for feature in FEATURES:
+        np.save(path / f"{feature}.npy", features[feature].to_numpy())
+    metadata = {
+        "format_version": FORMAT_VERSION,
+        "fingerprint": rules_fingerprint(),
+        "size": len(keys),
+    }
+    (path / _METADATA_FILE).write_text(json.dumps(metadata))
+
+    return LexiconIndex(path)
+
+
+def load_index(path, lexicon=None):
+    """Load an index, building it first if it is missing or outdated.
+
+    Parameters
+    ----------
+    path : str or path-like
+        Directory of the index.
+    lexicon : iterable, list-like object, optional
+        Contains the words of the lexicon. It is used to build the index
+        again if it does not exist or was built with other rules.
+
+    Returns
+    -------
+    LexiconIndex
+        The index.
+
+    Raises
+    ------
+    ValueError
+        If the index does not exist or is outdated and lexicon is None.
+    """
+
+    try:
+        return LexiconIndex(path)
+    except ValueError:
+        if lexicon is None:
+            raise
+
+    return build_index(lexicon, path)
+
+
+class LexiconIndex(object):
+    """Precomputed features of the words of a lexicon.
+
+    The texts and features are memory-mapped, so the index can be shared
+    by many analyzers without copying it.
+    """
+
+    def __init__(self, path):
+        """
+        Parameters
+        ----------
+        path : str or path-like
+            Directory of the index, created with build_index.
+
+        Raises
+        ------
+        ValueError
+            If the index does not exist or was built with other rules.
+        """
+
+        self.path = Path(path)
+        try:
+            metadata = json.loads((self.path / _METADATA_FILE).read_text())
+        except FileNotFoundError:
+            raise ValueError(f"'{self.path}' is not a lexicon index")
+        if metadata["fingerprint"] != rules_fingerprint():
+            raise ValueError(
+                f"'{self.path}' was built with other rules and must be built again"
+            )
+
+        self._texts = np.load(self.path / _TEXTS_FILE, mmap_mode="r")
+        self.features = {
+            feature: np.load(self.path / f"{feature}.npy", mmap_mode="r")
+            for feature in FEATURES
+        }
+
+    def find(self, texts):
+        """Find the position of the texts in the index.
+
+        Parameters
+        ----------
+        texts : pandas.Series
+            Normalized words' text
+
+        Returns
+        -------
+        positions : numpy.ndarray
+            Position of each text in the index, or -1 if it is not in it.
+        """
+
+        positions = np.full(len(texts), -1, dtype=np.int64)
+        if not len(self._texts) or not len(texts):
+            return positions
+
+        keys = np.array(_encode(texts).to_list(), dtype=bytes)
+        # texts longer than the widest text in the index can't be in it, and
+        # would be truncated when converted to its dtype
+        fits = True
+        if keys.itemsize > self._texts.itemsize:
+            fits = np.char.str_len(keys) <= self._texts.itemsize
+            keys = keys.astype(self._texts.dtype)
+        found_positions = np.searchsorted(self._texts, keys)
+        found_positions = np.minimum(found_positions, len(self._texts) - 1)
+        is_found = fits & (self._texts[found_positions] == keys)
+        positions[is_found] = found_positions[is_found]
+
+        return positions
+
+    def lookup(self, texts):
+        """Look up the features of the texts.
+
+        Parameters
+        ----------
+        texts : iterable, list-like object
+            Contains the texts. They are normalized like the words that are
+            analyzed.
+
+        Returns
+        -------
+        pandas.DataFrame
+            Text and features of each text, which are missing (pandas.NA)
+            for the texts that are not in the index.
+        """
+
+        texts = vectorized.normalize_texts(texts)
+        positions = self.find(texts)
+        is_found = positions >= 0
+        lookups = pd.DataFrame({"text": texts})
+        for feature in FEATURES:
+            values = pd.Series(pd.NA, index=texts.index, dtype="UInt16")
+            values[is_found] = self.features[feature][positions[is_found]]
+            lookups[feature] = values
+
+        return lookups
+
+    def word(self, text):
+        """Create a word with the features stored in the index.
+
+        The features of words that are not in the index are computed when
+        they are first requested, as usual.
+
+        Parameters
+        ----------
+        text : str
+            Text to use for creating the Word object.
+
+        Returns
+        -------
+        Word
+            Word for the text.
+        """
+
+        word = Word(text)
+        position = self.find(pd.Series([word.text]))[0]
+        if position >= 0:
+            word._length = int(self.features["length"][position])
+            word._silent_letters = int(self.features["silent_letters"][position])
+            word._shared_phonemes = int(self.features["shared_phonemes"][position])
+
+        return word
+
+    def __len__(self):
+        return len(self._texts)
+
+    def __contains__(self, text):
+        return self.find(vectorized.normalize_texts([text]))[0] >= 0
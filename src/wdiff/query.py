@@ -0,0 +1,186 @@
+"""Module that defines how words are selected by their difficulty.
+
+The results are sorted by their features and grouped in buckets of words
+with the same features. Since the features are small integers, there are
+few buckets, so selecting the ones in a range of features is almost
+instant regardless of the number of words, and words can be sampled from
+them without building the list of all the words that match.
+"""
+
+from ._lazy import lazy_import
+
+np = lazy_import("numpy")
+
+FEATURES = ("length", "silent_letters", "shared_phonemes", "total_difficulty")
+
+
+class DifficultyIndex(object):
+    """Selects words from results by ranges of their features.
+
+    Ranges are given as keyword arguments with the name of a feature, and
+    are either a value or a (low, high) tuple of inclusive bounds, where
+    None leaves the bound open. For example,
+    ``index.sample(20, length=(6, 8), total_difficulty=(5, 7))`` samples 20
+    words with 6 to 8 letters and a total difficulty of 5 to 7.
+
+    Build it from the collapsed results of an analyzer to select each
+    distinct word at most once.
+    """
+
+    def __init__(self, results, random_state=None):
+        """
+        Parameters
+        ----------
+        results : pandas.DataFrame
+            Formatted results (e.g., Analyzer.results). The features in the
+            results are indexed.
+        random_state : int or numpy.random.Generator, optional
+            Seed or generator used to sample the words.
+
+        Raises
+        ------
+        ValueError
+            If the results have no features.
+        """
+
+        self._features = [feature for feature in FEATURES if feature in results]
+        if not self._features:
+            raise ValueError("the results have no features to index")
+
+        self._results = results
+        values = results[self._features].to_numpy()
+        # positions of the results sorted by the first feature, then by the
+        # second one and so on
+        self._order = np.lexsort(values.T[::-1])
+        sorted_values = values[self._order]
+        is_start = np.ones(len(sorted_values), dtype=bool)
+        is_start[1:] = (sorted_values[1:] != sorted_values[:-1]).any(axis=1)
+        self._starts = np.flatnonzero(is_start)
+        self._counts = np.diff(np.append(self._starts, len(sorted_values)))
+        self._bucket_values = {
+            feature: sorted_values[self._starts, column]
+            for column, feature in enumerate(self._features)
+        }
+        self._random_generator = np.random.default_rng(random_state)
+
+    def _select_buckets(self, ranges):
+        """Select the buckets whose features are in the ranges.
+
+        Parameters
+        ----------
+        ranges : dict
+            Value or (low, high) bounds of each feature.
+
+        Returns
+        -------
+        numpy.ndarray
+            Positions of the selected buckets.
+
+        Raises
+        ------
+        ValueError
+            If a feature is not indexed.
+        """
+
+        is_selected = np.ones(len(self._starts), dtype=bool)
+        for feature, bounds in ranges.items():
+            if feature not in self._bucket_values:
+                raise ValueError(f"'{feature}' is not indexed")
+            if isinstance(bounds, tuple):
+                low, high = bounds
+            else:
+                low = high = bounds
+            values = self._bucket_values[feature]
+            if low is not None:
+                is_selected &= values >= low
+            if high is not None:
+                is_selected &= values <= high
+
+        return np.flatnonzero(is_selected)
+
+    def count(self, **ranges):
+        """Count the words whose features are in the ranges.
+
+        Parameters
+        ----------
+        **ranges
+            Value or (low, high) bounds of each feature.
+
+        Returns
+        -------
+        int
+            Number of words.
+        """
+
+        buckets = self._select_buckets(ranges)
+
+        return int(self._counts[buckets].sum())
+
+    def select(self, **ranges):
+        """Select all the words whose features are in the ranges.
+
+        Parameters
+        ----------
+        **ranges
+            Value or (low, high) bounds of each feature.
+
+        Returns
+        -------
+        pandas.DataFrame
+            Results of the words, in their original order.
+        """
+
+        buckets = self._select_buckets(ranges)
+        positions = [
+            self._order[start : start + count]
+            for start, count in zip(self._starts[buckets], self._counts[buckets])
+        ]
+        positions = np.sort(np.concatenate(positions)) if positions else []
+
+        return self._results.iloc[positions]
+
+    def sample(self, n, random_state=None, **ranges):
+        """Sample words whose features are in the ranges without replacement.
+
+        Parameters
+        ----------
+        n : int
+            Number of words.
+        random_state : int or numpy.random.Generator, optional
+            Seed or generator used for this sample. The generator of the
+            index is used by default.
+        **ranges
+            Value or (low, high) bounds of each feature.
+
+        Returns
+        -------
+        pandas.DataFrame
+            Results of the words, in random order.
+
+        Raises
+        ------
+        ValueError
+            If fewer than n words are in the ranges.
+        """
+
+        buckets = self._select_buckets(ranges)
+        counts = self._counts[buckets]
+        n_words = int(counts.sum())
+        if n > n_words:
+            raise ValueError(f"can't sample {n} words from {n_words} words")
+
+        if random_state is None:
+            random_generator = self._random_generator
+        else:
+            random_generator = np.random.default_rng(random_state)
+        # the words of the selected buckets are numbered consecutively
+        picks = random_generator.choice(n_words, size=n, replace=False)
+        ends = np.cumsum(counts)
+        picked_buckets = np.searchsorted(ends, picks, side="right")
+        offsets = picks - (ends - counts)[picked_buckets]
+        positions = self._order[self._starts[buckets][picked_buckets] + offsets]
+
+        return self._results.iloc[positions]
+
+    def __len__(self):
+        return len(self._order)
@@ -0,0 +1,101 @@
+"""Module that defines the fused rule scanner.
+
+The scanner walks a word's text a single time and counts the matches of
+every rule used by the Word class at once, instead of scanning the text
+once per rule.
+"""
+
+RULES = (
+    "silent_u",
+    "silent_h",
+    "shared_s",
+    "shared_b",
+    "shared_y",
+    "shared_j",
+    "shared_k",
+)
+
+_SILENT_U_PRECEDING = frozenset("gq")
+_SILENT_U_FOLLOWING = frozenset("ei")
+_C_WITH_S_FOLLOWING = frozenset("ei")
+_C_WITH_K_FOLLOWING = frozenset("aou")
+_G_WITH_J_FOLLOWING = frozenset("ei")
+
+
+def scan(text):
+    """Count the matches of every rule in a single pass over the text.
+
+    The counts are the same as the ones obtained by counting the
+    (non-overlapping) occurrences of each rule's pattern separately.
+
+    Parameters
+    ----------
+    text : str
+        Normalized word's text
+
+    Returns
+    -------
+    rule_counts : dict
+        Number of matches of each rule. The keys are the names in RULES.
+    """
+
+    silent_u = silent_h = 0
+    shared_s = shared_b = shared_y = shared_j = shared_k = 0
+    before_previous = previous = ""
+    l_unpaired = False
+
+    for char in text:
+        # unigram rules
+        if char == "h":
+            if previous != "c":
+                silent_h += 1
+        elif char == "s" or char == "z":
+            shared_s += 1
+        elif char == "b" or char == "v":
+            shared_b += 1
+        elif char == "k" or char == "q":
+            shared_k += 1
+        elif char == "j":
+            shared_j += 1
+        elif char == "y":
+            shared_y += 1
+
+        # ll is counted without overlapping, like str.count does
+        if char == "l":
+            if l_unpaired:
+                shared_y += 1
+            l_unpaired = not l_unpaired
+        else:
+            l_unpaired = False
+
+        # bigram and trigram rules ending in the current character
+        if previous == "c":
+            if char in _C_WITH_S_FOLLOWING:
+                shared_s += 1
+            elif char in _C_WITH_K_FOLLOWING:
+                shared_k += 1
+        elif previous == "g":
+            if char in _G_WITH_J_FOLLOWING:
+                shared_j += 1
+        elif previous == "u":
+            if char in _SILENT_U_FOLLOWING and before_previous in _SILENT_U_PRECEDING:
+                silent_u += 1
+
+        before_previous = previous
+        previous = char
+
+    # the y at the end of the word is not counted
+    if previous == "y":
+        shared_y -= 1
+
+    rule_counts = {
+        "silent_u": silent_u,
+        "silent_h": silent_h,
+        "shared_s": shared_s,
+        "shared_b": shared_b,
+        "shared_y": shared_y,
+        "shared_j": shared_j,
+        "shared_k": shared_k,
+    }
+
+    return rule_counts
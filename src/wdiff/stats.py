@@ -0,0 +1,214 @@
+"""Module that defines how the stages of the analyses are measured.
+
+Each stage (e.g., preparing the words, an analysis or saving the results)
+is recorded with its wall time, the number of rows it processed and the
+peak memory it allocated. The records can be exported as a dict or JSON to
+be sent to other metrics systems.
+"""
+
+import json
+import time
+import tracemalloc
+from contextlib import contextmanager
+
+
+class Stats(object):
+    """Collects the time, rows and peak memory of the stages of analyses.
+
+    Stages can be nested (e.g., the words are prepared during the first
+    analysis that needs them). The time and memory of a stage include the
+    stages nested in it, whose records are stored before the record of the
+    stage and reference it as their parent.
+
+    The same stats can be shared by several analyzers (e.g., the chunks of
+    Analyzer.stream) to collect the records of all of them. Measuring the
+    stages is not thread-safe.
+    """
+
+    def __init__(self, callback=None, track_memory=True):
+        """
+        Parameters
+        ----------
+        callback : callable, optional
+            Function called with the record of each stage when it ends.
+        track_memory : bool, default=True
+            Whether to measure the peak memory allocated by each stage with
+            tracemalloc. Tracing the allocations slows the stages down, so
+            times are more accurate without it.
+        """
+
+        self.records = []
+        self._callback = callback
+        self._track_memory = track_memory
+        # the stages being measured, with their memory when they started
+        # and the largest memory seen since
+        self._running_stages = []
+        self._started_tracing = False
+
+    @contextmanager
+    def measure(self, stage):
+        """Measure a stage.
+
+        Parameters
+        ----------
+        stage : str
+            Name of the stage.
+
+        Yields
+        ------
+        record : dict
+            Record of the stage. Its number of rows must be set before the
+            stage ends.
+        """
+
+        parent = self._running_stages[-1]["stage"] if self._running_stages else None
+        record = {"stage": stage, "parent": parent, "rows": 0}
+        running_stage = {"stage": stage, "start_memory": 0, "peak_memory": 0}
+        if self._track_memory:
+            self._start_tracking_memory(running_stage)
+        self._running_stages.append(running_stage)
+
+        start = time.perf_counter()
+        try:
+            yield record
+            seconds = time.perf_counter() - start
+        finally:
+            self._running_stages.pop()
+            if self._track_memory:
+                self._stop_tracking_memory(running_stage)
+
+        record["seconds"] = seconds
+        record["rows_per_second"] = record["rows"] / seconds if seconds else None
+        if self._track_memory:
+            peak_memory = running_stage["peak_memory"] - running_stage["start_memory"]
+            record["peak_memory"] = peak_memory
+        self.records.append(record)
+        if self._callback is not None:
+            self._callback(record)
+
+    def _start_tracking_memory(self, running_stage):
+        """Start tracking the memory allocated by a stage.
+
+        The peak memory traced so far is kept by the stage that encloses
+        this one before the peak is reset.
+
+        Parameters
+        ----------
+        running_stage : dict
+            Stage that is starting.
+
+        Returns
+        -------
+        None
+        """
+
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracing = True
+        current_memory, peak_memory = tracemalloc.get_traced_memory()
+        if self._running_stages:
+            parent_stage = self._running_stages[-1]
+            parent_stage["peak_memory"] = max(parent_stage["peak_memory"], peak_memory)
+        # reset_peak is not available before python 3.9
+        if hasattr(tracemalloc, "reset_peak"):
+            tracemalloc.reset_peak()
+        running_stage["start_memory"] = current_memory
+        running_stage["peak_memory"] = current_memory
+
+    def _stop_tracking_memory(self, running_stage):
+        """Stop tracking the memory allocated by a stage.
+
+        Its peak memory is passed on to the stage that encloses it.
+
+        Parameters
+        ----------
+        running_stage : dict
+            Stage that is ending.
+
+        Returns
+        -------
+        None
+        """
+
+        _, peak_memory = tracemalloc.get_traced_memory()
+        running_stage["peak_memory"] = max(running_stage["peak_memory"], peak_memory)
+        if self._running_stages:
+            parent_stage = self._running_stages[-1]
+            parent_stage["peak_memory"] = max(
+                parent_stage["peak_memory"], running_stage["peak_memory"]
+            )
+        elif self._started_tracing:
+            tracemalloc.stop()
+            self._started_tracing = False
+
+    def summary(self):
+        """Summarize the records of each stage.
+
+        Returns
+        -------
+        summary : dict
+            Number of calls, total rows, total seconds, rows per second
+            and, if memory is tracked, the largest peak memory of each
+            stage, in the order the stages first ended.
+        """
+
+        summary = {}
+        for record in self.records:
+            stage_summary = summary.setdefault(
+                record["stage"], {"calls": 0, "rows": 0, "seconds": 0.0}
+            )
+            stage_summary["calls"] += 1
+            stage_summary["rows"] += record["rows"]
+            stage_summary["seconds"] += record["seconds"]
+            if "peak_memory" in record:
+                stage_summary["peak_memory"] = max(
+                    stage_summary.get("peak_memory", 0), record["peak_memory"]
+                )
+
+        for stage_summary in summary.values():
+            seconds = stage_summary["seconds"]
+            rows_per_second = stage_summary["rows"] / seconds if seconds else None
+            stage_summary["rows_per_second"] = rows_per_second
+
+        return summary
+
+    def to_dict(self):
+        """Export the records and their summary.
+
+        Returns
+        -------
+        dict
+            Records of all stages under "records" and the summary of each
+            stage under "summary".
+        """
+
+        return {
+            "records": [dict(record) for record in self.records],
+            "summary": self.summary(),
+        }
+
+    def to_json(self, **kwargs):
+        """Export the records and their summary as JSON.
+
+        Parameters
+        ----------
+        **kwargs
+            Arguments passed to json.dumps (e.g., indent).
+
+        Returns
+        -------
+        str
+            JSON document with the same content as to_dict.
+        """
+
+        return json.dumps(self.to_dict(), **kwargs)
+
+    def clear(self):
+        """Remove all the records.
+
+        Returns
+        -------
+        None
+        """
+
+        self.records.clear()
@@ -0,0 +1,251 @@
+"""Module that defines the vectorized analysis engine.
+
+The functions in this module implement the same rules as the Word class,
+but they operate on a whole column of text at once using pandas string
+methods instead of creating a Word object for each text.
+"""
+
+import pandas as pd
+
+VALID_CHARACTERS = "aábcdeéfghiíjklmnñoópqrstuúüvwxyz "
+
+###########################################################################
+# Patterns                                                                #
+###########################################################################
+# Each pattern joins the rules of a feature in a single alternation.      #
+# None of the alternatives share characters in a way that allows them to  #
+# overlap, so counting the matches of the joined pattern is equivalent to #
+# adding the str.count of each rule like the Word class does.             #
+###########################################################################
+
+# silent u: que, qui, gue, gui; any h (the ch are substracted afterwards)
+_SILENT_LETTERS_PATTERN = "[gq]u[ei]|h"
+# s: z, s, ci, ce; b: b, v; y: ll, y; j: j, ge, gi; k: k, q, ca, co, cu
+# the y at the end of the word is substracted afterwards
+_SHARED_PHONEMES_PATTERN = "[zsbvjkq]|c[ieaou]|ll|g[ei]|y"
+_VALID_TEXT_PATTERN = f"[{VALID_CHARACTERS}]+"
+
+
+def as_series(texts):
+    """Put the texts in a pandas.Series with a RangeIndex.
+
+    Parameters
+    ----------
+    texts : iterable, list-like object
+        Words' text
+
+    Returns
+    -------
+    pandas.Series
+        Words' text
+    """
+
+    if isinstance(texts, pd.Series):
+        return texts.reset_index(drop=True)
+
+    texts = list(texts)
+    # without texts pandas 1.x would infer float64, which has no string
+    # methods. Otherwise the dtype is inferred, so pandas 3 stores strings
+    # in Arrow arrays
+    return pd.Series(texts, dtype=None if texts else object)
+
+
+def normalize_texts(texts):
+    """Normalize all texts so they are properly formatted.
+
+    Parameters
+    ----------
+    texts : iterable, list-like object
+        Words' text
+
+    Returns
+    -------
+    texts_normalized : pandas.Series
+        Words' text normalized, with a RangeIndex.
+    """
+
+    texts = as_series(texts)
+    texts_normalized = texts.str.strip().str.lower()
+
+    return texts_normalized
+
+
+def find_invalid_texts(texts):
+    """Find the texts that do not meet minimal requirements.
+
+    All texts are checked at once with a single compiled regular expression
+    instead of checking each character of each text.
+
+    Parameters
+    ----------
+    texts : pandas.Series
+        Normalized words' text
+
+    Returns
+    -------
+    is_invalid : pandas.Series
+        True for the texts that are empty, contain invalid characters or are
+        not text at all; False otherwise.
+    """
+
+    is_valid = texts.str.fullmatch(_VALID_TEXT_PATTERN)
+    is_invalid = ~is_valid.fillna(False).astype(bool)
+
+    return is_invalid
+
+
+def describe_invalid_text(text):
+    """Describe why a text is invalid for creating a word.
+
+    Parameters
+    ----------
+    text : object
+        Normalized word's text
+
+    Returns
+    -------
+    str
+        Reason why the text is invalid.
+    """
+
+    if not isinstance(text, str):
+        return "not text"
+    if len(text) == 0:
+        return "empty"
+
+    invalid_characters = sorted(set(text).difference(VALID_CHARACTERS))
+
+    return f"invalid characters: {''.join(invalid_characters)}"
+
+
+def validate_texts(texts):
+    """Validate that all texts meet minimal requirements.
+
+    Parameters
+    ----------
+    texts : pandas.Series
+        Normalized words' text
+
+    Returns
+    -------
+    None
+
+    Raises
+    ------
+    ValueError
+        If any text is empty or contains invalid characters.
+    """
+
+    is_invalid = find_invalid_texts(texts)
+
+    if is_invalid.any():
+        text = texts[is_invalid].iloc[0]
+        raise ValueError(f"'{text}' is invalid for creating word")
+
+
+def count_length(texts):
+    """Count the number of letters in each text.
+
+    Parameters
+    ----------
+    texts : pandas.Series
+        Normalized words' text
+
+    Returns
+    -------
+    length : pandas.Series
+        Number of letters in each text.
+    """
+
+    length = texts.str.len()
+
+    return length
+
+
+def count_silent_letters(texts):
+    """Count the number of silent letters in each text.
+
+    Parameters
+    ----------
+    texts : pandas.Series
+        Normalized words' text
+
+    Returns
+    -------
+    silent_letter_count : pandas.Series
+        Number of silent letters in each text.
+    """
+
+    candidates_count = texts.str.count(_SILENT_LETTERS_PATTERN)
+    ch_count = texts.str.count("ch")
+    silent_letter_count = candidates_count - ch_count
+
+    return silent_letter_count
+
+
+def count_shared_phonemes(texts):
+    """Count the number of shared phonemes in each text.
+
+    Parameters
+    ----------
+    texts : pandas.Series
+        Normalized words' text
+
+    Returns
+    -------
+    shared_phoneme_count : pandas.Series
+        Number of shared phonemes in each text.
+    """
+
+    candidates_count = texts.str.count(_SHARED_PHONEMES_PATTERN)
+    final_y_count = texts.str.endswith("y").astype(int)
+    shared_phoneme_count = candidates_count - final_y_count
+
+    return shared_phoneme_count
+
+
+FEATURES = {
+    "length": count_length,
+    "silent_letters": count_silent_letters,
+    "shared_phonemes": count_shared_phonemes,
+}
+
+
+def compute_feature(texts, feature):
+    """Compute a feature for all texts.
+
+    Parameters
+    ----------
+    texts : pandas.Series
+        Normalized words' text
+    feature : str
+        Feature to be computed. One of: length, silent_letters or
+        shared_phonemes.
+
+    Returns
+    -------
+    pandas.Series
+        The feature of all texts.
+    """
+
+    return FEATURES[feature](texts)
+
+
+def compute_features(texts, features):
+    """Compute several features for all texts.
+
+    Parameters
+    ----------
+    texts : pandas.Series
+        Normalized words' text
+    features : iterable of str
+        Features to be computed. Any of: length, silent_letters or
+        shared_phonemes.
+
+    Returns
+    -------
+    dict
+        pandas.Series with each feature of all texts.
+    """
+
+    return {feature: compute_feature(texts, feature) for feature in features}
@@ -1,20 +1,12 @@
 """Module that defines the Word class."""
 
-from .docsprocessor import _COMMON_SECTIONS, docstrings
-
-###########################################################################
-# Note                                                                    #
-###########################################################################
-# The order of the methods is important for the docstrings to be build    #
-# correctly. This is because docrep reads and builds docstrings as they   #
-# are evaluated by python and the docstrings from which the text is       #
-# taken have to be evaluated before they can be used in other strings.    #
-#                                                                         #
-# There is an alternative, but it is too messy.                           #
-#                                                                         #
-# The same applies to methods that are properties. The docstrings have to #
-# build before the method can be converted into properties.               #
-###########################################################################
+import threading
+from collections import OrderedDict
+
+from .scanner import RULES, scan
+
+_RULE_POSITIONS = {rule: position for position, rule in enumerate(RULES)}
+_VALID_CHARACTERS = frozenset("aábcdeéfghiíjklmnñoópqrstuúüvwxyz ")
 
 
 class Word(object):
@@ -32,6 +24,15 @@ class Word(object):
     - total difficulty
     """
 
+    __slots__ = (
+        "_text",
+        "_length",
+        "_silent_letters",
+        "_shared_phonemes",
+        "_total_difficulty",
+        "_rule_counts",
+    )
+
     def __init__(self, text):
         """
         Parameters
@@ -47,6 +48,28 @@ class Word(object):
         self._silent_letters = None
         self._shared_phonemes = None
         self._total_difficulty = None
+        self._rule_counts = None
+
+    @classmethod
+    def of(cls, text):
+        """Get a shared, fully analyzed and immutable word for the text.
+
+        The words are taken from a process-wide LRU cache (word_cache), so
+        creating the same word many times only normalizes, validates and
+        analyzes its text once.
+
+        Parameters
+        ----------
+        text: str
+            Text to use for creating the Word object.
+
+        Returns
+        -------
+        FrozenWord
+            Analyzed word for the text.
+        """
+
+        return word_cache.get(text)
 
     def _normalize_text(self, text):
         """Normalize text so it is properly formatted.
@@ -120,13 +143,31 @@ class Word(object):
             True if the text contains invalid characters; False otherwise
         """
 
-        valid_characters = "aábcdeéfghiíjklmnñoópqrstuúüvwxyz "
-        for char in text:
-            if char not in valid_characters:
-                return True
-        return False
+        return not _VALID_CHARACTERS.issuperset(text)
+
+    def _get_rule_count(self, rule):
+        """Get the number of matches of a rule.
+
+        All rules are counted in a single pass over the word's text the
+        first time this method is called. The counts are cached as a tuple
+        so the text is not scanned again.
+
+        Parameters
+        ----------
+        rule : str
+            Name of the rule, as in scanner.RULES.
+
+        Returns
+        -------
+        int
+            Number of matches of the rule.
+        """
+
+        if self._rule_counts is None:
+            self._rule_counts = tuple(scan(self._text).values())
+
+        return self._rule_counts[_RULE_POSITIONS[rule]]
 
-    @docstrings.get_sections(base="silent_u", sections=_COMMON_SECTIONS)
     def _check_silent_u(self):
         """Count the number of silent letters *u*.
 
@@ -141,16 +182,10 @@ class Word(object):
             Number of silent letters *u* in the word
         """
 
-        silent_u_count = (
-            self._text.count("que")
-            + self._text.count("qui")
-            + self._text.count("gue")
-            + self._text.count("gui")
-        )
+        silent_u_count = self._get_rule_count("silent_u")
 
         return silent_u_count
 
-    @docstrings.get_sections(base="silent_h", sections=_COMMON_SECTIONS)
     def _check_silent_h(self):
         """Count the number of silent letters *h*.
 
@@ -164,16 +199,10 @@ class Word(object):
             Number of silent letters *h* in the word
         """
 
-        h_count = self._text.count("h")
-        h_noncomplian_count = self._text.count("ch")
-
-        silent_h_count = h_count - h_noncomplian_count
+        silent_h_count = self._get_rule_count("silent_h")
 
         return silent_h_count
 
-    @docstrings.get_sections(base="silent_letters", sections=["Rules", "Returns"])
-    @docstrings.get_extended_summary(base="silent_letters")
-    @docstrings.with_indent(8)
     def _check_silent_letters(self):
         """Count the number of silent letters.
 
@@ -182,8 +211,9 @@ class Word(object):
 
         Rules
         -----
-        %(silent_u.rules)s
-        %(silent_h.rules)s
+        *u*: when preceded by an *g* or *q* and followed by a *i* or *e*.
+             These follow the pattern *gui*, *gue*, *que*, *qui*.
+        *h*: when is not preceded by a letter *c*.
 
         Returns
         -------
@@ -198,7 +228,6 @@ class Word(object):
 
         return silent_letter_count
 
-    @docstrings.get_sections(base="shared_s", sections=_COMMON_SECTIONS)
     def _check_shared_phoneme_s(self):
         """Count the number of graphemes that represent the /s/ phoneme.
 
@@ -214,14 +243,10 @@ class Word(object):
             Number of graphemes that represent the /s/ phoneme
         """
 
-        z_count = self._text.count("z")
-        s_count = self._text.count("s")
-        c_with_s_sound_count = self._text.count("ci") + self._text.count("ce")
-        shared_phoneme_s_count = z_count + s_count + c_with_s_sound_count
+        shared_phoneme_s_count = self._get_rule_count("shared_s")
 
         return shared_phoneme_s_count
 
-    @docstrings.get_sections(base="shared_b", sections=_COMMON_SECTIONS)
     def _check_shared_phoneme_b(self):
         """Count the number of graphemes that represent the /b/ phoneme.
 
@@ -236,13 +261,10 @@ class Word(object):
             Number of graphemes that represent the /b/ phoneme.
         """
 
-        b_count = self._text.count("b")
-        v_count = self._text.count("v")
-        shared_phoneme_b_count = b_count + v_count
+        shared_phoneme_b_count = self._get_rule_count("shared_b")
 
         return shared_phoneme_b_count
 
-    @docstrings.get_sections(base="shared_y", sections=_COMMON_SECTIONS)
     def _check_shared_phoneme_y(self):
         """Count the number of graphemes that represent the /y/ phoneme.
 
@@ -257,17 +279,10 @@ class Word(object):
             Number of graphemes that represent the /y/ phoneme.
         """
 
-        ll_count = self._text.count("ll")
-
-        y_count = self._text.count("y")  # TODO improve algorithm
-        if self._text[-1] == "y":
-            y_count -= 1
-
-        shared_phoneme_y_count = ll_count + y_count
+        shared_phoneme_y_count = self._get_rule_count("shared_y")
 
         return shared_phoneme_y_count
 
-    @docstrings.get_sections(base="shared_j", sections=_COMMON_SECTIONS)
     def _check_shared_phoneme_j(self):
         """Count the number of graphemes that represent the /j/ phoneme.
 
@@ -282,13 +297,10 @@ class Word(object):
             Number of graphemes that represent the /j/ phoneme.
         """
 
-        j_count = self._text.count("j")
-        g_compliant_count = self._text.count("ge") + self._text.count("gi")
-        shared_phoneme_j_count = j_count + g_compliant_count
+        shared_phoneme_j_count = self._get_rule_count("shared_j")
 
         return shared_phoneme_j_count
 
-    @docstrings.get_sections(base="shared_k", sections=_COMMON_SECTIONS)
     def _check_shared_phoneme_k(self):
         """Count the number of graphemes that represent the /k/ phoneme.
 
@@ -304,18 +316,10 @@ class Word(object):
             Number of graphemes that represent the /k/ phoneme.
         """
 
-        k_count = self._text.count("k")
-        q_count = self._text.count("q")
-        c_compliant_count = (
-            self._text.count("ca") + self._text.count("co") + self._text.count("cu")
-        )
-        shared_phoneme_k_count = k_count + q_count + c_compliant_count
+        shared_phoneme_k_count = self._get_rule_count("shared_k")
 
         return shared_phoneme_k_count
 
-    @docstrings.get_sections(base="shared_phonemes", sections=["Rules", "Returns"])
-    @docstrings.get_extended_summary(base="shared_phonemes")
-    @docstrings.with_indent(8)
     def _check_shared_phonemes(self):
         """Count the number of graphemes that share phonemes with other graphemes.
 
@@ -325,11 +329,18 @@ class Word(object):
 
         Rules
         -----
-        %(shared_s.rules)s
-        %(shared_b.rules)s
-        %(shared_y.rules)s
-        %(shared_j.rules)s
-        %(shared_k.rules)s
+        *z*: Any letter *z*
+        *s*: Any letter *s*
+        *c*: when followed by an *i* or *e*
+        *b*: Any letter *b*
+        *v*: Any letter *v*
+        *l*: If it is next to another letter *l* (i.e., *ll*)
+        *y*: Any letter *y* that is not at the end of the word
+        *j*: Any letter *j*
+        *g*: when followed by an *e* or *i*
+        *k*: Any letter *k*
+        *q*: Any letter *q*
+        *c*: when followed by an *a*, *o* or *u*
 
         Returns
         -------
@@ -353,8 +364,6 @@ class Word(object):
 
         return shared_phoneme_count
 
-    @docstrings.get_sections(base="total_difficulty", sections=["Returns", "Raises"])
-    @docstrings.get_extended_summary(base="total_difficulty")
     def _calculate_total_difficulty(self):
         """Calculate the total difficulty for the word.
 
@@ -409,19 +418,22 @@ class Word(object):
         return self._length
 
     @property
-    @docstrings.with_indent(8)
     def silent_letters(self):
         """Returns the number of silent letters in the word.
 
-        %(silent_letters.summary_ext)s
+        Silent letters are graphemes that do not have a phonemic representation.
+        In Spanish, silent letters are *h*s and *u*s that meet certain criteria.
 
         Rules
         -----
-        %(silent_letters.rules)s
+        *u*: when preceded by an *g* or *q* and followed by a *i* or *e*.
+             These follow the pattern *gui*, *gue*, *que*, *qui*.
+        *h*: when is not preceded by a letter *c*.
 
         Returns
         -----
-        %(silent_letters.returns)s
+        silent_letter_count : int
+            Number of silent letters.
         """
 
         if self._silent_letters is None:
@@ -430,19 +442,32 @@ class Word(object):
         return self._silent_letters
 
     @property
-    @docstrings.with_indent(8)
     def shared_phonemes(self):
         """Returns the number of shared phonemes in the word.
 
-        %(shared_phonemes.summary_ext)s
+        Graphemes that share phonemes with other graphemes are
+        letters or combination of letters that represent the same sound
+        as other letters or combination of letters.
 
         Rules
         -----
-        %(shared_phonemes.rules)s
+        *z*: Any letter *z*
+        *s*: Any letter *s*
+        *c*: when followed by an *i* or *e*
+        *b*: Any letter *b*
+        *v*: Any letter *v*
+        *l*: If it is next to another letter *l* (i.e., *ll*)
+        *y*: Any letter *y* that is not at the end of the word
+        *j*: Any letter *j*
+        *g*: when followed by an *e* or *i*
+        *k*: Any letter *k*
+        *q*: Any letter *q*
+        *c*: when followed by an *a*, *o* or *u*
 
         Returns
         -------
-        %(shared_phonemes.returns)s
+        shared_phoneme_count : int
+            Number of shared phonemes.
         """
 
         if self._shared_phonemes is None:
@@ -451,22 +476,188 @@ class Word(object):
         return self._shared_phonemes
 
     @property
-    @docstrings.with_indent(8)
     def total_difficulty(self):
         """Returns the word's total difficulty.
 
-        %(total_difficulty.summary_ext)s
+        This is the sum of all other characteristics. It is interpreted as
+        how difficult is to spell the word. This information can be particularly
+        useful if this *difficulty index* is compared to the index of
+        other words.
+
+        Only the characteristics that have a valid value (int) are used.
 
         Returns
         -------
-        %(total_difficulty.returns)s
+        int
+            Total difficulty for the word
 
         Raises
         ------
-        %(total_difficulty.raises)s
+        ValueError
+            If none of the analyses has been run (are None).
         """
 
         if self._total_difficulty is None:
             self._total_difficulty = self._calculate_total_difficulty()
 
         return self._total_difficulty
+
+
+class FrozenWord(Word):
+    """Word whose analyses are all run when it is created and that cannot be
+    modified afterwards, so it can be shared safely.
+    """
+
+    __slots__ = ("_frozen",)
+
+    def __init__(self, text):
+        """
+        Parameters
+        ----------
+        text: str
+            Text to use for creating the Word object.
+        """
+
+        super().__init__(text)
+        self.length
+        self.silent_letters
+        self.shared_phonemes
+        self.total_difficulty
+        self._frozen = True
+
+    def __setattr__(self, name, value):
+        """Prevent modifying the word once it has been created.
+
+        Parameters
+        ----------
+        name : str
+            Name of the attribute.
+        value : object
+            Value of the attribute.
+
+        Raises
+        ------
+        AttributeError
+            If the word has already been created.
+        """
+
+        if getattr(self, "_frozen", False):
+            raise AttributeError(f"'{type(self).__name__}' objects are immutable")
+        super().__setattr__(name, value)
+
+
+class WordCache(object):
+    """Size-bounded LRU cache of FrozenWord objects.
+
+    It keeps statistics of the hits, misses and evictions so its capacity
+    can be tuned.
+    """
+
+    def __init__(self, capacity=4096):
+        """
+        Parameters
+        ----------
+        capacity : int, default=4096
+            Maximum number of words kept in the cache.
+        """
+
+        self._words = OrderedDict()
+        self._lock = threading.Lock()
+        self._capacity = capacity
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, text):
+        """Get the word for the text, creating it if it is not cached.
+
+        Parameters
+        ----------
+        text : str
+            Text to use for creating the Word object.
+
+        Returns
+        -------
+        word : FrozenWord
+            Analyzed word for the text.
+        """
+
+        with self._lock:
+            word = self._words.get(text)
+            if word is not None:
+                self._words.move_to_end(text)
+                self.hits += 1
+                return word
+            self.misses += 1
+
+        word = FrozenWord(text)
+
+        with self._lock:
+            self._words[text] = word
+            self._evict()
+
+        return word
+
+    def _evict(self):
+        """Remove the least recently used words above the capacity.
+
+        Returns
+        -------
+        None
+        """
+
+        while len(self._words) > self._capacity:
+            self._words.popitem(last=False)
+            self.evictions += 1
+
+    @property
+    def capacity(self):
+        """Maximum number of words kept in the cache."""
+
+        return self._capacity
+
+    @capacity.setter
+    def capacity(self, capacity):
+        with self._lock:
+            self._capacity = capacity
+            self._evict()
+
+    def clear(self):
+        """Remove all words and reset the statistics.
+
+        Returns
+        -------
+        None
+        """
+
+        with self._lock:
+            self._words.clear()
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+
+    def info(self):
+        """Get the cache statistics.
+
+        Returns
+        -------
+        dict
+            Hits, misses, evictions, current size and capacity.
+        """
+
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "size": len(self._words),
+                "capacity": self._capacity,
+            }
+
+    def __len__(self):
+        """Number of words in the cache."""
+
+        return len(self._words)
+
+
+word_cache = WordCache()
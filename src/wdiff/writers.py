@@ -0,0 +1,400 @@
+"""Module that defines how the results are written to files.
+
+CSV files can be compressed with gzip or zstd. Parquet and Feather (Arrow
+IPC) files store each column separately with compact integer dtypes, so
+they are much smaller and faster to read, and readers can load only the
+columns they need. They require pyarrow. SQLite files store the results in
+a table that can be queried directly, where rows are upserted by their
+position so interrupted writes can be resumed.
+"""
+
+import sqlite3
+from itertools import islice
+
+import numpy as np
+
+# formats and the extension added to the filename
+FORMATS = {
+    "csv": ".csv",
+    "csv.gz": ".csv.gz",
+    "csv.zst": ".csv.zst",
+    "parquet": ".parquet",
+    "feather": ".feather",
+    "arrow": ".arrow",
+    "sqlite": ".sqlite",
+}
+_CSV_FORMATS = ("csv", "csv.gz", "csv.zst")
+# formats whose files can be appended to
+_APPENDABLE_FORMATS = _CSV_FORMATS + ("sqlite",)
+SQLITE_TABLE = "results"
+# columns of the SQLite table that are indexed
+SQLITE_INDEXES = ("text", "total_difficulty")
+
+# the features can't be larger than the number of letters (3 times for the
+# total difficulty), so uint16 fits any word shorter than 21845 letters
+COMPACT_DTYPES = {
+    "length": "uint16",
+    "silent_letters": "uint16",
+    "shared_phonemes": "uint16",
+    "total_difficulty": "uint16",
+}
+
+
+def compact_dtypes(results, dtypes=None):
+    """Convert the features to the compact dtypes.
+
+    The dtypes do not depend on the values, so all the chunks of a file
+    have the same dtypes.
+
+    Parameters
+    ----------
+    results : pandas.DataFrame
+        Formatted results
+    dtypes : dict, optional
+        Dtype of some features, which overrides the ones in COMPACT_DTYPES
+        (e.g., a signed or floating point dtype for a total difficulty with
+        negative or fractional weights).
+
+    Returns
+    -------
+    pandas.DataFrame
+        Results with the features converted.
+
+    Raises
+    ------
+    ValueError
+        If a feature does not fit in its compact dtype.
+    """
+
+    # floating point features are only converted to floating point dtypes
+    dtypes = {
+        column: dtype
+        for column, dtype in {**COMPACT_DTYPES, **(dtypes or {})}.items()
+        if column in results
+        and (results[column].dtype.kind != "f" or np.dtype(dtype).kind == "f")
+    }
+    for column, dtype in dtypes.items():
+        if not len(results) or np.dtype(dtype).kind == "f":
+            continue
+        dtype_info = np.iinfo(dtype)
+        if results[column].max() > dtype_info.max:
+            raise ValueError(f"'{column}' is too large to be stored as {dtype}")
+        if results[column].min() < dtype_info.min:
+            raise ValueError(f"'{column}' is too small to be stored as {dtype}")
+
+    return results.astype(dtypes)
+
+
+def _import_pyarrow():
+    """Import pyarrow, which is only needed for the columnar formats.
+
+    Returns
+    -------
+    module
+        pyarrow
+
+    Raises
+    ------
+    ImportError
+        If pyarrow is not installed.
+    """
+
+    try:
+        import pyarrow as pa
+    except ImportError as error:
+        raise ImportError(
+            "pyarrow is required to save the results as parquet, feather or "
+            "arrow. Install it with 'pip install wdiff[arrow]'."
+        ) from error
+
+    return pa
+
+
+class ResultsWriter(object):
+    """Writes results to a file in chunks.
+
+    Each chunk is appended to the file as soon as it is written, so results
+    of any size can be saved without holding all of them in memory. It is
+    meant to be used as a context manager.
+    """
+
+    def __init__(
+        self,
+        filename,
+        format="csv",  # noqa: A002
+        append=False,
+        batch_size=10000,
+        dtypes=None,
+    ):
+        """
+        Parameters
+        ----------
+        filename : str
+            Filename. It must not include the file's extension, which is
+            added based on the format.
+        format : {"csv", "csv.gz", "csv.zst", "parquet", "feather", "arrow", "sqlite"}
+            Format of the file. "feather" and "arrow" are both the Arrow IPC
+            file format. "sqlite" writes the results to the SQLITE_TABLE
+            table of a SQLite database, with the position of each result as
+            its primary key.
+        append : bool, default=False
+            Whether to add the results to an existing CSV file or SQLite
+            table instead of overwriting it. Results are upserted into
+            SQLite tables, so the rows with the same position are replaced.
+        batch_size : int, default=10000
+            Number of rows inserted with each statement in SQLite files.
+        dtypes : dict, optional
+            Dtype of some features in parquet and Arrow IPC files, which
+            overrides the ones in COMPACT_DTYPES.
+
+        Raises
+        ------
+        ValueError
+            If the format is not supported or if append is used with a
+            columnar format.
+        """
+
+        if format not in FORMATS:
+            raise ValueError(f"'{format}' is not a valid format")
+        if append and format not in _APPENDABLE_FORMATS:
+            raise ValueError(f"results can't be appended to {format} files")
+
+        self.path = f"{filename}{FORMATS[format]}"
+        self._format = format
+        self._append = append
+        self._batch_size = batch_size
+        self._dtypes = dtypes
+        self._writer = None
+        self._schema = None
+        self._connection = None
+
+    def write(self, results):
+        """Write a chunk of results.
+
+        Parameters
+        ----------
+        results : pandas.DataFrame
+            Formatted results. All chunks must have the same columns.
+
+        Returns
+        -------
+        None
+        """
+
+        if self._format in _CSV_FORMATS:
+            mode = "a" if self._append else "w"
+            results.to_csv(self.path, index=False, mode=mode, header=not self._append)
+            self._append = True
+        elif self._format == "sqlite":
+            self._write_sqlite(results)
+        else:
+            self._write_arrow(compact_dtypes(results, self._dtypes))
+
+    def _connect(self):
+        """Connect to the SQLite file, replacing its table unless appending.
+
+        Returns
+        -------
+        sqlite3.Connection
+            Connection to the file.
+        """
+
+        if self._connection is None:
+            self._connection = sqlite3.connect(self.path)
+            self._connection.execute("PRAGMA journal_mode = WAL")
+            self._connection.execute("PRAGMA synchronous = NORMAL")
+            if not self._append:
+                with self._connection:
+                    self._connection.execute(f"DROP TABLE IF EXISTS {SQLITE_TABLE}")
+
+        return self._connection
+
+    def next_position(self):
+        """Get the position that follows the last result in the SQLite table.
+
+        Each chunk is written in a single transaction, so the results of
+        an interrupted write are always the first ones.
+
+        Returns
+        -------
+        int
+            Position of the last result plus one, or 0 if the table does not
+            exist or is empty.
+        """
+
+        connection = self._connect()
+        try:
+            (last_position,) = connection.execute(
+                f"SELECT MAX(position) FROM {SQLITE_TABLE}"
+            ).fetchone()
+        except sqlite3.OperationalError:
+            return 0
+
+        return 0 if last_position is None else last_position + 1
+
+    def _write_sqlite(self, results):
+        """Upsert a chunk of results into the SQLite table.
+
+        The table is created when the first chunk is written, with a column
+        for each column of the results. The rows are inserted in batches in
+        a single transaction.
+
+        Parameters
+        ----------
+        results : pandas.DataFrame
+            Formatted results. Their index is the position of each result.
+
+        Returns
+        -------
+        None
+        """
+
+        connection = self._connect()
+        columns = list(results.columns)
+        definitions = [
+            f"{column} TEXT NOT NULL" if column == "text" else f"{column} INTEGER"
+            for column in columns
+        ]
+        updates = [f"{column} = excluded.{column}" for column in columns]
+        statement = (
+            f"INSERT INTO {SQLITE_TABLE} (position, {', '.join(columns)}) "
+            f"VALUES ({', '.join('?' * (len(columns) + 1))}) "
+            f"ON CONFLICT (position) DO UPDATE SET {', '.join(updates)}"
+        )
+        rows = zip(
+            results.index.tolist(), *(results[column].tolist() for column in columns)
+        )
+
+        with connection:
+            connection.execute(
+                f"CREATE TABLE IF NOT EXISTS {SQLITE_TABLE} "
+                f"(position INTEGER PRIMARY KEY, {', '.join(definitions)})"
+            )
+            batch = list(islice(rows, self._batch_size))
+            while batch:
+                connection.executemany(statement, batch)
+                batch = list(islice(rows, self._batch_size))
+
+    def _write_arrow(self, results):
+        """Write a chunk of results to a parquet or Arrow IPC file.
+
+        The file is opened when the first chunk is written, using its
+        schema for all chunks.
+
+        Categorical columns (e.g., the text of compact results) are stored
+        as plain values, since each chunk has its own categories and Arrow
+        IPC files only allow one dictionary per column.
+
+        Parameters
+        ----------
+        results : pandas.DataFrame
+            Results with compact dtypes.
+
+        Returns
+        -------
+        None
+        """
+
+        pa = _import_pyarrow()
+        categories_dtypes = {
+            column: results[column].cat.categories.dtype
+            for column in results
+            if results[column].dtype.name == "category"
+        }
+        results = results.astype(categories_dtypes)
+        table = pa.Table.from_pandas(results, schema=self._schema, preserve_index=False)
+
+        if self._writer is None:
+            self._schema = table.schema
+            if self._format == "parquet":
+                from pyarrow import parquet
+
+                self._writer = parquet.ParquetWriter(
+                    self.path, self._schema, compression="zstd"
+                )
+            else:
+                options = pa.ipc.IpcWriteOptions(compression="zstd")
+                self._writer = pa.ipc.new_file(self.path, self._schema, options=options)
+
+        self._writer.write_table(table)
+
+    def close(self):
+        """Close the file.
+
+        Returns
+        -------
+        None
+        """
+
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+        if self._connection is not None:
+            self._create_sqlite_indexes()
+            self._connection.close()
+            self._connection = None
+
+    def _create_sqlite_indexes(self):
+        """Index the columns of the SQLite table in SQLITE_INDEXES.
+
+        The indexes are created once all the results are written, which is
+        faster than updating them with every insert.
+
+        Returns
+        -------
+        None
+        """
+
+        with self._connection:
+            table_columns = [
+                column_info[1]
+                for column_info in self._connection.execute(
+                    f"PRAGMA table_info({SQLITE_TABLE})"
+                )
+            ]
+            for column in SQLITE_INDEXES:
+                if column in table_columns:
+                    self._connection.execute(
+                        f"CREATE INDEX IF NOT EXISTS {SQLITE_TABLE}_{column} "
+                        f"ON {SQLITE_TABLE} ({column})"
+                    )
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+def write_results(
+    results, filename, format="csv", append=False, dtypes=None  # noqa: A002
+):
+    """Write the results to a file.
+
+    Parameters
+    ----------
+    results : pandas.DataFrame
+        Formatted results
+    filename : str
+        Filename. It must not include the file's extension, which is added
+        based on the format.
+    format : {"csv", "csv.gz", "csv.zst", "parquet", "feather", "arrow", "sqlite"}
+        Format of the file.
+    append : bool, default=False
+        Whether to add the results to an existing CSV file or SQLite table
+        instead of overwriting it. The results appended to a SQLite table
+        are numbered after its last row.
+    dtypes : dict, optional
+        Dtype of some features in parquet and Arrow IPC files, which
+        overrides the ones in COMPACT_DTYPES.
+
+    Returns
+    -------
+    None
+    """
+
+    with ResultsWriter(filename, format, append, dtypes=dtypes) as writer:
+        if append and format == "sqlite":
+            offset = writer.next_position()
+            results = results.set_axis(results.index + offset)
+        writer.write(results)
@@ -20,6 +20,7 @@ COVERAGE_DIR = ROOT_DIR.joinpath("htmlcov")
 COVERAGE_REPORT = COVERAGE_DIR.joinpath("index.html")
 SOURCE_DIR = ROOT_DIR.joinpath("src/wdiff")
 TEST_DIR = ROOT_DIR.joinpath("tests")
+BENCHMARKS_DIR = ROOT_DIR.joinpath("benchmarks")
 PYTHON_TARGETS = [
     SOURCE_DIR,
     TEST_DIR,
@@ -144,6 +145,23 @@ def tests(c, verbose=False):
     _run(c, f"poetry run pytest {' '.join(pytest_options)} {TEST_DIR} {SOURCE_DIR}")
 
 
+@task(
+    help={
+        "sizes": "Number of words of each corpus, separated by commas.",
+        "compare": "JSON file with the results of a previous version to compare.",
+    }
+)
+def benchmarks(c, sizes="", compare=""):
+    # type: (Context, str, str) -> None
+    """Run the benchmark suite."""
+    options = []
+    if sizes:
+        options.append(f"--sizes {' '.join(sizes.split(','))}")
+    if compare:
+        options.append(f"--compare {compare}")
+    _run(c, f"poetry run python {BENCHMARKS_DIR}/suite.py {' '.join(options)}")
+
+
 @task(
     help={
         "fmt": "Build a local report: report, html, json, annotate, html, xml.",
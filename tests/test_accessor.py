@@ -0,0 +1,73 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+import wdiff.accessor  # noqa: F401
+from wdiff.analyzer import Analyzer
+
+TEXTS = ["huevo", "Guitarra", "calabaza", "gigante", "huevo", "chihuahua"]
+
+
+@pytest.mark.parametrize("engine", ["pandas", "numpy"])
+def test_features(engine):
+    """Test that the features are the same as the results of an Analyzer."""
+
+    words = pd.Series(TEXTS, index=list("abcdef"))
+    analyzer = Analyzer(TEXTS)
+    analyzer.run_all_analyses()
+
+    features = words.wdiff.features(engine=engine)
+
+    expected = analyzer.results.drop(columns="text").set_axis(words.index)
+    pd.testing.assert_frame_equal(features, expected, check_dtype=False)
+
+
+def test_features_selected_analyses():
+    """Test that only the selected analyses are run, in their order."""
+
+    words = pd.Series(TEXTS)
+
+    features = words.wdiff.features(["total_difficulty", "length"])
+
+    assert features.columns.to_list() == ["length", "total_difficulty"]
+    assert features["total_difficulty"].equals(features["length"])
+
+
+@pytest.mark.parametrize("analyses", [["length", "syllables"], ["total_difficulty"]])
+def test_features_invalid_analyses(analyses):
+    """Test that invalid analyses are rejected."""
+
+    with pytest.raises(ValueError):
+        pd.Series(TEXTS).wdiff.features(analyses)
+
+
+@pytest.mark.parametrize("words", [["huevo", "huevo8"], ["huevo", None]])
+def test_features_invalid_words(words):
+    """Test that invalid and missing words raise an error by default."""
+
+    with pytest.raises(ValueError):
+        pd.Series(words).wdiff.features()
+
+
+def test_features_skip():
+    """Test that the features of skipped words are missing."""
+
+    words = pd.Series(["huevo", "huevo8", None, "sol"])
+
+    features = words.wdiff.features(["length"], errors="skip")
+
+    assert features["length"].dtype == "Int64"
+    assert features["length"].to_list() == [5, pd.NA, pd.NA, 3]
+
+
+def test_analyze():
+    """Test that the features are added to the frame."""
+
+    frame = pd.DataFrame({"word": TEXTS, "frequency": range(len(TEXTS))})
+    frequencies = frame["frequency"]
+
+    frame.wdiff.analyze("word", ["length"])
+
+    assert frame.columns.to_list() == ["word", "frequency", "length"]
+    assert frame["length"].to_list() == [5, 8, 8, 7, 5, 9]
+    assert np.shares_memory(frame["frequency"].to_numpy(), frequencies.to_numpy())
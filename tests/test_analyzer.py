@@ -1,6 +1,13 @@
+import sqlite3
+from concurrent import futures
+from concurrent.futures import ThreadPoolExecutor
+
+import pandas as pd
 import pytest
 
+from wdiff import kernel
 from wdiff.analyzer import Analyzer
+from wdiff.stats import Stats
 from wdiff.word import Word
 
 
@@ -66,10 +73,807 @@ def test_calculate_total_difficulty(
     """
 
     analyzer = Analyzer(["ejemplo"])
-    word_obj = analyzer._results.word_objs[0]
+    word_obj = analyzer._get_word_objs(analyzer._words)[0]
     word_obj._length = difficulty_length
     word_obj._silent_letters = difficulty_silent
     word_obj._shared_phonemes = difficulty_shared_phonemes
     total_difficulty_obs = analyzer._get_property_from_words("total_difficulty")
 
     assert total_difficulty_obs.to_list()[0] == total_difficulty_exp
+
+
+@pytest.mark.parametrize("engine", ["word", "pandas", "numpy"])
+def test_run_all_analyses_engines(engine):
+    """Test that run_all_analyses gives the same results with every engine."""
+
+    text_list = ["huevo", "guitarra", "calabaza", "gigante"]
+    analyzer = Analyzer(text_list, engine=engine)
+
+    analyzer.run_all_analyses()
+    results = analyzer.results
+
+    assert results.columns.to_list() == [
+        "text",
+        "length",
+        "silent_letters",
+        "shared_phonemes",
+        "total_difficulty",
+    ]
+    assert results["text"].to_list() == text_list
+    assert results["length"].to_list() == [5, 8, 8, 7]
+    assert results["silent_letters"].to_list() == [1, 1, 0, 0]
+    assert results["shared_phonemes"].to_list() == [1, 0, 3, 1]
+    assert results["total_difficulty"].to_list() == [7, 9, 11, 8]
+
+
+def test_determine_total_difficulty_no_analyses_pandas():
+    """Test that the pandas engine raises if no analysis has been run."""
+
+    analyzer = Analyzer(["ejemplo"], engine="pandas")
+
+    with pytest.raises(ValueError):
+        analyzer.determine_total_difficulty()
+
+
+@pytest.mark.parametrize("cache", [False, True])
+def test_run_all_analyses_numpy_encodes_once(monkeypatch, tmp_path, cache):
+    """Test that the numpy engine encodes the texts once for all features."""
+
+    encoded_texts = []
+    encode = kernel.encode
+
+    def encode_texts(texts):
+        encoded_texts.append(texts.to_list())
+        return encode(texts)
+
+    monkeypatch.setattr(kernel, "encode", encode_texts)
+    analyzer = Analyzer(
+        ["huevo", "Guitarra", "huevo"],
+        engine="numpy",
+        cache=tmp_path / "cache.db" if cache else None,
+    )
+    analyzer.run_all_analyses()
+
+    assert encoded_texts == [["huevo", "guitarra", "huevo"]]
+    assert analyzer.results["total_difficulty"].to_list() == [7, 9, 7]
+
+
+@pytest.mark.parametrize("engine", ["word", "pandas", "numpy"])
+def test_run_all_analyses_empty(engine):
+    """Test that analyzing no words gives empty results."""
+
+    analyzer = Analyzer([], engine=engine)
+    analyzer.run_all_analyses()
+    analyzer.remove_words([])
+
+    assert analyzer.results.shape == (0, 5)
+
+
+def test_invalid_engine():
+    """Test that an unknown engine is rejected."""
+
+    with pytest.raises(ValueError):
+        Analyzer(["ejemplo"], engine="unknown")
+
+
+@pytest.mark.parametrize("engine", ["word", "pandas", "numpy"])
+def test_run_all_analyses_deduplicate(engine):
+    """Test that deduplicated analyses give the same results in the same order."""
+
+    text_list = ["huevo", "Gigante", "huevo", "calabaza", "gigante ", "huevo"]
+    analyzer = Analyzer(text_list, engine=engine)
+    analyzer.run_all_analyses()
+    analyzer_deduplicated = Analyzer(text_list, engine=engine, deduplicate=True)
+    analyzer_deduplicated.run_all_analyses()
+
+    pd.testing.assert_frame_equal(analyzer_deduplicated.results, analyzer.results)
+
+
+def test_collapsed_results():
+    """Test that collapsed_results has one row and a count for each word."""
+
+    text_list = ["huevo", "gigante", "huevo", "calabaza", "gigante", "huevo"]
+    analyzer = Analyzer(text_list, deduplicate=True)
+    analyzer.check_length_difficulty()
+
+    collapsed_results = analyzer.collapsed_results
+
+    assert collapsed_results["text"].to_list() == ["huevo", "gigante", "calabaza"]
+    assert collapsed_results["length"].to_list() == [5, 7, 8]
+    assert collapsed_results["count"].to_list() == [3, 2, 1]
+
+
+def test_run_analyses():
+    """Test that run_analyses runs only the selected analyses, in order."""
+
+    analyzer = Analyzer(["huevo", "guitarra"])
+
+    analyzer.run_analyses(["total_difficulty", "length"])
+
+    assert analyzer.results.columns.to_list() == ["text", "length", "total_difficulty"]
+    assert analyzer.results["total_difficulty"].to_list() == [5, 8]
+
+
+def test_run_analyses_invalid():
+    """Test that run_analyses rejects unknown analyses."""
+
+    analyzer = Analyzer(["huevo"])
+
+    with pytest.raises(ValueError):
+        analyzer.run_analyses(["length", "unknown"])
+
+
+@pytest.mark.parametrize("chunksize", [1, 2, 10])
+def test_stream(chunksize):
+    """Test that stream gives the same results as analyzing all words at once."""
+
+    text_list = ["huevo", "guitarra", "calabaza", "gigante", "perro"]
+    analyzer = Analyzer(text_list)
+    analyzer.run_all_analyses()
+
+    chunks = list(Analyzer.stream(iter(text_list), chunksize=chunksize))
+
+    assert all(len(chunk) <= chunksize for chunk in chunks)
+    pd.testing.assert_frame_equal(pd.concat(chunks), analyzer.results)
+
+
+def test_stream_jobs_single_pool(monkeypatch):
+    """Test that one pool of processes is used for all the chunks."""
+
+    pools = []
+
+    def create_pool(max_workers=None):
+        pools.append(max_workers)
+        return ThreadPoolExecutor(max_workers)
+
+    monkeypatch.setattr(futures, "ProcessPoolExecutor", create_pool)
+    text_list = ["huevo", "guitarra", "calabaza", "gigante", "perro"]
+
+    chunks = list(Analyzer.stream(text_list, chunksize=2, jobs=2))
+
+    assert pools == [2]
+    assert pd.concat(chunks)["length"].to_list() == [5, 8, 8, 7, 5]
+
+
+@pytest.mark.parametrize("jobs", [0, -2])
+def test_invalid_jobs(jobs):
+    """Test that numbers of processes other than -1 or positive are rejected."""
+
+    with pytest.raises(ValueError):
+        Analyzer(["huevo"], jobs=jobs)
+
+
+def test_stream_invalid_chunksize():
+    """Test that stream rejects chunk sizes lower than 1."""
+
+    with pytest.raises(ValueError):
+        list(Analyzer.stream(["huevo"], chunksize=0))
+
+
+def test_save_stream(tmp_path):
+    """Test that save_stream writes the results of all chunks to one file."""
+
+    text_list = ["huevo", "guitarra", "calabaza", "gigante", "perro"]
+    analyzer = Analyzer(text_list)
+    analyzer.run_analyses(["length"])
+    filename = tmp_path / "results"
+
+    n_words = Analyzer.save_stream(
+        text_list, filename, chunksize=2, analyses=["length"], engine="numpy"
+    )
+
+    assert n_words == 5
+    saved_results = pd.read_csv(f"{filename}.csv")
+    pd.testing.assert_frame_equal(saved_results, analyzer.results, check_dtype=False)
+
+
+@pytest.mark.parametrize("engine", ["word", "numpy"])
+@pytest.mark.parametrize("deduplicate", [False, True])
+def test_run_all_analyses_parallel(engine, deduplicate):
+    """Test that parallel analyses give the same results in the same order."""
+
+    text_list = ["huevo", "guitarra", "calabaza", "gigante", "huevo"] * 3
+    analyzer = Analyzer(text_list, engine=engine)
+    analyzer.run_all_analyses()
+    analyzer_parallel = Analyzer(
+        text_list, engine=engine, deduplicate=deduplicate, jobs=2
+    )
+
+    analyzer_parallel.run_all_analyses()
+
+    pd.testing.assert_frame_equal(analyzer_parallel.results, analyzer.results)
+
+
+def test_run_all_analyses_parallel_no_word_objs():
+    """Test that no word objects are created when the workers analyze them."""
+
+    analyzer = Analyzer(["huevo", "guitarra", "calabaza"], stats=True)
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        analyzer.run_all_analyses(jobs=2, executor=executor)
+
+    stages = [record["stage"] for record in analyzer.stats.records]
+    assert "create_word_objs" not in stages
+    assert "word_objs" not in analyzer._words
+    assert analyzer.results["length"].to_list() == [5, 8, 8]
+
+
+def test_run_analyses_executor():
+    """Test that run_analyses can reuse an executor."""
+
+    text_list = ["huevo", "guitarra", "calabaza", "gigante"]
+    analyzer = Analyzer(text_list)
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        analyzer.run_analyses(["length", "silent_letters"], jobs=3, executor=executor)
+
+    assert analyzer.results["length"].to_list() == [5, 8, 8, 7]
+    assert analyzer.results["silent_letters"].to_list() == [1, 1, 0, 0]
+
+
+def test_run_analyses_parallel_total_difficulty():
+    """Test that no texts are sent to the executor if no feature is needed."""
+
+    analyzer = Analyzer(["huevo", "guitarra"])
+    analyzer.run_analyses(["length", "silent_letters", "shared_phonemes"])
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        mapped_shards = []
+        map_shards = executor.map
+        executor.map = lambda *args: mapped_shards.append(args) or map_shards(*args)
+        analyzer.run_analyses(["total_difficulty"], executor=executor)
+
+    assert mapped_shards == []
+    assert analyzer.results["total_difficulty"].to_list() == [7, 9]
+
+
+def test_results_cached_until_new_analysis():
+    """Test that results is only rebuilt when a new analysis is run."""
+
+    analyzer = Analyzer(["huevo", "guitarra"])
+    analyzer.check_length_difficulty()
+
+    results = analyzer.results
+
+    assert analyzer.results is results
+    assert "word_objs" not in analyzer._results.columns
+    analyzer.check_silent_letter_difficulty()
+    assert analyzer.results is not results
+    assert analyzer.results.columns.to_list() == ["text", "length", "silent_letters"]
+
+
+def test_results_modified(tmp_path):
+    """Test that modifying the results does not change what is saved."""
+
+    analyzer = Analyzer(["huevo", "guitarra"], engine="numpy")
+    analyzer.run_all_analyses()
+
+    analyzer.results.loc[0, "length"] = 99
+    analyzer.save_results(tmp_path / "results")
+
+    saved_results = pd.read_csv(tmp_path / "results.csv")
+    assert saved_results["length"].to_list() == [5, 8]
+    assert analyzer._results["length"].to_list() == [5, 8]
+
+
+@pytest.mark.parametrize("engine", ["word", "numpy"])
+def test_words_prepared_lazily(engine):
+    """Test that the words are not read until they are needed."""
+
+    words = iter(["huevo", "perro8"])
+
+    analyzer = Analyzer(words, engine=engine)
+
+    assert next(words) == "huevo"
+    with pytest.raises(ValueError):
+        analyzer.check_length_difficulty()
+
+
+def test_results_before_analyses():
+    """Test that the results have the normalized text before any analysis."""
+
+    analyzer = Analyzer([" Huevo", "PERRO"], engine="pandas")
+
+    assert analyzer.results.columns.to_list() == ["text"]
+    assert analyzer.results["text"].to_list() == ["huevo", "perro"]
+
+
+@pytest.mark.parametrize("engine", ["word", "numpy"])
+@pytest.mark.parametrize("deduplicate", [False, True])
+def test_add_words(engine, deduplicate):
+    """Test that added words are analyzed with the analyses already run."""
+
+    analyzer = Analyzer(["huevo", "gigante"], engine=engine, deduplicate=deduplicate)
+    analyzer.run_analyses(["length", "total_difficulty"])
+    analyzer_expected = Analyzer(
+        ["huevo", "gigante", "guitarra", "Huevo", "sol"], engine=engine
+    )
+    analyzer_expected.run_analyses(["length", "total_difficulty"])
+
+    analyzer.add_words(["guitarra", "Huevo"])
+    analyzer.add_words(["sol"])
+
+    pd.testing.assert_frame_equal(analyzer.results, analyzer_expected.results)
+    analyzer.check_silent_letter_difficulty()
+    assert analyzer.results["silent_letters"].to_list() == [1, 0, 1, 1, 0]
+
+
+def test_add_words_before_preparing():
+    """Test that words added before any analysis are analyzed together."""
+
+    analyzer = Analyzer(["huevo"])
+
+    analyzer.add_words(iter(["gigante"]))
+    analyzer.check_length_difficulty()
+
+    assert analyzer.results["text"].to_list() == ["huevo", "gigante"]
+    assert analyzer.results["length"].to_list() == [5, 7]
+
+
+def test_add_words_without_analyses():
+    """Test adding words after the words were prepared but not analyzed."""
+
+    analyzer = Analyzer(["huevo"], engine="numpy")
+    analyzer.results
+
+    analyzer.add_words(["gigante"])
+
+    assert analyzer.results["text"].to_list() == ["huevo", "gigante"]
+
+
+@pytest.mark.parametrize("engine", ["word", "numpy"])
+@pytest.mark.parametrize("deduplicate", [False, True])
+def test_remove_words(engine, deduplicate):
+    """Test that all occurrences of the removed words are removed."""
+
+    text_list = ["huevo", "gigante", "huevo", "sol", "guitarra"]
+    analyzer = Analyzer(text_list, engine=engine, deduplicate=deduplicate)
+    analyzer.check_length_difficulty()
+
+    analyzer.remove_words(["HUEVO", "sol"])
+    analyzer.check_silent_letter_difficulty()
+
+    assert analyzer.results["text"].to_list() == ["gigante", "guitarra"]
+    assert analyzer.results["length"].to_list() == [7, 8]
+    assert analyzer.results["silent_letters"].to_list() == [0, 1]
+
+
+@pytest.mark.parametrize("file_format", ["csv.gz", "parquet"])
+def test_save_results_format(tmp_path, file_format):
+    """Test that save_results adds the extension of the format."""
+
+    if file_format == "parquet":
+        pytest.importorskip("pyarrow")
+    analyzer = Analyzer(["huevo", "guitarra"])
+    analyzer.run_all_analyses()
+
+    analyzer.save_results(tmp_path / "results", format=file_format)
+
+    assert (tmp_path / f"results.{file_format}").exists()
+
+
+def test_save_stream_parquet(tmp_path):
+    """Test that save_stream writes each chunk to a parquet file."""
+
+    pytest.importorskip("pyarrow")
+    text_list = ["huevo", "guitarra", "calabaza", "gigante", "perro"]
+    analyzer = Analyzer(text_list)
+    analyzer.run_all_analyses()
+
+    Analyzer.save_stream(
+        text_list, tmp_path / "results", chunksize=2, format="parquet", engine="numpy"
+    )
+
+    saved_results = pd.read_parquet(tmp_path / "results.parquet")
+    pd.testing.assert_frame_equal(saved_results, analyzer.results, check_dtype=False)
+
+
+@pytest.mark.parametrize("engine", ["word", "pandas", "numpy"])
+@pytest.mark.parametrize("deduplicate", [False, True])
+def test_compact(engine, deduplicate):
+    """Test that compact results have the same values with smaller dtypes."""
+
+    text_list = ["huevo", "guitarra", "calabaza", "gigante", "huevo"]
+    analyzer = Analyzer(text_list)
+    analyzer.run_all_analyses()
+    compact_analyzer = Analyzer(
+        text_list, engine=engine, deduplicate=deduplicate, compact=True
+    )
+    compact_analyzer.run_all_analyses()
+
+    results = compact_analyzer.results
+    assert results["text"].dtype == "category"
+    assert (results.dtypes.drop("text") == "uint8").all()
+    pd.testing.assert_frame_equal(
+        results, analyzer.results, check_dtype=False, check_categorical=False
+    )
+
+
+@pytest.mark.parametrize("file_format", ["parquet", "feather", "arrow"])
+def test_compact_save_stream(tmp_path, file_format):
+    """Test that compact chunks are streamed to columnar files."""
+
+    pytest.importorskip("pyarrow")
+    text_list = ["huevo", "guitarra", "calabaza", "gigante", "perro"]
+    analyzer = Analyzer(text_list)
+    analyzer.run_all_analyses()
+
+    Analyzer.save_stream(
+        text_list, tmp_path / "results", chunksize=2, format=file_format, compact=True
+    )
+
+    read = pd.read_parquet if file_format == "parquet" else pd.read_feather
+    saved_results = read(tmp_path / f"results.{file_format}")
+    pd.testing.assert_frame_equal(saved_results, analyzer.results, check_dtype=False)
+
+
+def test_compact_add_words():
+    """Test that added words keep the results compact."""
+
+    analyzer = Analyzer(["huevo", "gato"], compact=True)
+    analyzer.run_all_analyses()
+    analyzer.add_words(["guitarra", "huevo"])
+
+    results = analyzer.results
+    assert results["text"].dtype == "category"
+    assert results["text"].to_list() == ["huevo", "gato", "guitarra", "huevo"]
+    assert results["length"].dtype == "uint8"
+    assert results["length"].to_list() == [5, 4, 8, 5]
+
+
+def test_compact_top_k_easiest():
+    """Test that the easiest words are found in compact results."""
+
+    text_list = ["huevo", "guitarra", "sol", "gigante"]
+
+    top_words = Analyzer.top_k(text_list, k=1, largest=False, compact=True)
+
+    assert top_words["text"].to_list() == ["sol"]
+
+
+def test_weights():
+    """Test that the total difficulty weighs each feature."""
+
+    analyzer = Analyzer(["huevo", "guitarra"], weights={"length": 2})
+    analyzer.run_all_analyses()
+
+    results = analyzer.results
+    expected = 2 * results["length"] + results["silent_letters"]
+    expected += results["shared_phonemes"]
+    assert results["total_difficulty"].to_list() == expected.to_list()
+
+
+def test_weighted_difficulty():
+    """Test that many weightings are computed from the features."""
+
+    analyzer = Analyzer(["huevo", "guitarra", "calabaza"], engine="numpy")
+    analyzer.run_analyses(["length", "silent_letters"])
+    weights = pd.DataFrame(
+        {"length": [1, 0.5, 0], "silent_letters": [1, 2, 0], "shared_phonemes": 0},
+        index=["sum", "custom", "none"],
+    )
+
+    difficulties = analyzer.weighted_difficulty(weights)
+
+    results = analyzer.results
+    assert difficulties.columns.to_list() == ["sum", "custom", "none"]
+    assert (
+        difficulties["sum"].to_list()
+        == (results["length"] + results["silent_letters"]).to_list()
+    )
+    assert (
+        difficulties["custom"].to_list()
+        == (0.5 * results["length"] + 2 * results["silent_letters"]).to_list()
+    )
+    assert (difficulties["none"] == 0).all()
+
+
+def test_weighted_difficulty_default():
+    """Test that a single weighting gives the same total as the analyses."""
+
+    analyzer = Analyzer(["huevo", "guitarra", "calabaza"])
+    analyzer.run_all_analyses()
+
+    difficulties = analyzer.weighted_difficulty({})
+
+    pd.testing.assert_series_equal(
+        difficulties, analyzer.results["total_difficulty"], check_dtype=False
+    )
+
+
+@pytest.mark.parametrize(
+    ("weights", "dtype"),
+    [({}, "uint16"), ({"shared_phonemes": -3}, "int32"), ({"length": 0.5}, "float64")],
+)
+def test_weights_save_stream(tmp_path, weights, dtype):
+    """Test that the dtype of the total difficulty depends on the weights."""
+
+    pytest.importorskip("pyarrow")
+    text_list = ["a", "cosas", "guitarra"]
+    analyzer = Analyzer(text_list, weights=weights)
+    analyzer.run_all_analyses()
+
+    Analyzer.save_stream(
+        text_list,
+        tmp_path / "results",
+        chunksize=1,
+        format="parquet",
+        weights=weights,
+        compact=True,
+    )
+
+    saved_results = pd.read_parquet(tmp_path / "results.parquet")
+    assert saved_results["total_difficulty"].dtype == dtype
+    assert (
+        saved_results["total_difficulty"].to_list()
+        == analyzer.results["total_difficulty"].to_list()
+    )
+
+
+def test_weights_compact():
+    """Test that negative totals are stored with a signed compact dtype."""
+
+    analyzer = Analyzer(["a", "cosas"], weights={"shared_phonemes": -3}, compact=True)
+    analyzer.run_all_analyses()
+
+    total_difficulty = analyzer.results["total_difficulty"]
+    assert total_difficulty.dtype == "int8"
+    assert total_difficulty.to_list() == [1, -4]
+
+
+def test_weights_invalid():
+    """Test that weights are only accepted for features."""
+
+    with pytest.raises(ValueError):
+        Analyzer(["huevo"], weights={"syllables": 1})
+
+
+@pytest.mark.parametrize("weights", [{"syllables": 1}, {"shared_phonemes": 2}])
+def test_weighted_difficulty_invalid(weights):
+    """Test that only the features that were determined can be weighed."""
+
+    analyzer = Analyzer(["huevo", "guitarra"])
+    analyzer.run_analyses(["length"])
+
+    with pytest.raises(ValueError):
+        analyzer.weighted_difficulty(weights)
+
+
+def test_save_results_sqlite_append(tmp_path):
+    """Test that the results of another analyzer are appended to the table."""
+
+    filename = tmp_path / "results"
+    for text_list in [["perro", "gato"], ["casa", "luz"]]:
+        analyzer = Analyzer(text_list)
+        analyzer.run_analyses(["length"])
+        analyzer.save_results(filename, append=True, format="sqlite")
+
+    with sqlite3.connect(f"{filename}.sqlite") as connection:
+        saved_texts = connection.execute(
+            "SELECT text FROM results ORDER BY position"
+        ).fetchall()
+    assert [text for (text,) in saved_texts] == ["perro", "gato", "casa", "luz"]
+
+
+def test_save_stream_resume(tmp_path):
+    """Test that an interrupted stream is resumed without analyzing it again."""
+
+    text_list = ["huevo", "guitarra", "calabaza", "gigante", "perro"]
+    analyzer = Analyzer(text_list)
+    analyzer.run_all_analyses()
+    filename = tmp_path / "results"
+    Analyzer.save_stream(text_list[:2], filename, format="sqlite")
+
+    n_words = Analyzer.save_stream(
+        text_list, filename, chunksize=2, format="sqlite", resume=True
+    )
+
+    with sqlite3.connect(f"{filename}.sqlite") as connection:
+        saved_results = pd.read_sql(
+            "SELECT * FROM results ORDER BY position", connection, index_col="position"
+        )
+    assert n_words == 3
+    pd.testing.assert_frame_equal(
+        saved_results, analyzer.results, check_dtype=False, check_names=False
+    )
+
+
+@pytest.mark.parametrize(
+    ("file_format", "errors"), [("csv", "raise"), ("sqlite", "skip")]
+)
+def test_save_stream_resume_invalid(tmp_path, file_format, errors):
+    """Test that only sqlite files without skipped words can be resumed."""
+
+    with pytest.raises(ValueError):
+        Analyzer.save_stream(
+            ["huevo"],
+            tmp_path / "results",
+            format=file_format,
+            resume=True,
+            errors=errors,
+        )
+
+
+@pytest.mark.parametrize("engine", ["word", "pandas", "numpy"])
+def test_errors_skip(engine):
+    """Test that invalid words are left out of the results."""
+
+    analyzer = Analyzer(["huevo", "huevo8", " ", "sol"], engine=engine, errors="skip")
+    analyzer.check_length_difficulty()
+
+    assert analyzer.results["text"].to_list() == ["huevo", "sol"]
+    assert analyzer.results["length"].to_list() == [5, 3]
+    assert analyzer.invalid_words.empty
+
+
+def test_errors_collect():
+    """Test that invalid words are recorded with their position and reason."""
+
+    analyzer = Analyzer(["huevo", "Huevo8", " ", "sol"], errors="collect")
+    analyzer.check_length_difficulty()
+    analyzer.add_words(["perro", 5])
+
+    assert analyzer.results["text"].to_list() == ["huevo", "sol", "perro"]
+    invalid_words = analyzer.invalid_words
+    assert invalid_words["position"].to_list() == [1, 2, 5]
+    assert invalid_words["word"].to_list() == ["Huevo8", " ", 5]
+    assert invalid_words["reason"].to_list() == [
+        "invalid characters: 8",
+        "empty",
+        "not text",
+    ]
+
+
+@pytest.mark.parametrize("jobs", [None, 2])
+def test_stream_on_invalid_words(jobs):
+    """Test that the invalid words of each chunk are given with their position."""
+
+    words = ["huevo", "Huevo8", " ", "sol", "perro", 5]
+    chunks = []
+
+    results = pd.concat(
+        Analyzer.stream(
+            words,
+            chunksize=2,
+            analyses=["length"],
+            errors="collect",
+            jobs=jobs,
+            on_invalid_words=chunks.append,
+        )
+    )
+
+    assert results["text"].to_list() == ["huevo", "sol", "perro"]
+    assert [len(invalid_words) for invalid_words in chunks] == [1, 1, 1]
+    invalid_words = pd.concat(chunks, ignore_index=True)
+    assert invalid_words["position"].to_list() == [1, 2, 5]
+    assert invalid_words["word"].to_list() == ["Huevo8", " ", 5]
+
+
+def test_save_stream_and_top_k_on_invalid_words(tmp_path):
+    """Test that save_stream and top_k give the invalid words of the stream."""
+
+    words = ["huevo", "huevo8", "sol"]
+    saved_chunks = []
+    top_k_chunks = []
+
+    Analyzer.save_stream(
+        words,
+        tmp_path / "results",
+        chunksize=1,
+        errors="collect",
+        on_invalid_words=saved_chunks.append,
+    )
+    Analyzer.top_k(
+        words, chunksize=1, errors="collect", on_invalid_words=top_k_chunks.append
+    )
+
+    for chunks in (saved_chunks, top_k_chunks):
+        assert len(chunks) == 1
+        assert chunks[0]["position"].to_list() == [1]
+        assert chunks[0]["word"].to_list() == ["huevo8"]
+
+
+def test_invalid_errors():
+    """Test that an unknown errors option is rejected."""
+
+    with pytest.raises(ValueError):
+        Analyzer(["ejemplo"], errors="ignore")
+
+
+def test_stats_disabled_by_default():
+    """Test that stages are not measured unless stats are enabled."""
+
+    analyzer = Analyzer(["ejemplo"])
+    analyzer.run_all_analyses()
+
+    assert analyzer.stats is None
+
+
+def test_stats(tmp_path):
+    """Test that each stage is recorded with the rows it processed."""
+
+    analyzer = Analyzer(["huevo", "sol", "huevo"], deduplicate=True, stats=True)
+    analyzer.run_all_analyses()
+    analyzer.save_results(tmp_path / "results")
+
+    records = analyzer.stats.records
+    assert [record["stage"] for record in records] == [
+        "prepare_words",
+        "create_word_objs",
+        "length",
+        "silent_letters",
+        "shared_phonemes",
+        "total_difficulty",
+        "save_results",
+    ]
+    # the words are prepared and the word objects of the distinct words are
+    # created during the first analysis
+    assert records[0]["parent"] == records[1]["parent"] == "length"
+    assert records[1]["rows"] == 2
+    assert all(record["rows"] == 3 for record in records[:1] + records[2:])
+
+
+def test_stats_shared_by_stream():
+    """Test that stats given as an object collect the records of all chunks."""
+
+    received = []
+    stats = Stats(callback=received.append, track_memory=False)
+    list(
+        Analyzer.stream(
+            ["huevo", "sol", "perro"],
+            chunksize=2,
+            analyses=["length"],
+            engine="numpy",
+            stats=stats,
+        )
+    )
+
+    assert stats.summary()["length"]["calls"] == 2
+    assert stats.summary()["length"]["rows"] == 3
+    assert received == stats.records
+
+
+TOP_K_WORDS = ["sol", "guitarra", "huevo", "guitarra", "llave", "queso", "zapatos"]
+
+
+@pytest.mark.parametrize("chunksize", [1, 3, 100])
+@pytest.mark.parametrize("largest", [True, False])
+@pytest.mark.parametrize("distinct", [True, False])
+@pytest.mark.parametrize("k", [0, 1, 3, 10])
+def test_top_k(chunksize, largest, distinct, k):
+    """Test that top_k matches sorting all the results."""
+
+    analyzer = Analyzer(TOP_K_WORDS * 2)
+    analyzer.run_all_analyses()
+    expected = analyzer.results.sort_values(
+        "total_difficulty", ascending=not largest, kind="stable"
+    )
+    if distinct:
+        expected = expected.drop_duplicates("text")
+
+    top_words = Analyzer.top_k(
+        TOP_K_WORDS * 2,
+        k,
+        largest=largest,
+        distinct=distinct,
+        chunksize=chunksize,
+        engine="numpy",
+    )
+
+    pd.testing.assert_frame_equal(top_words, expected.head(k), check_dtype=False)
+
+
+def test_top_k_by_feature():
+    """Test ranking the words by a feature other than the total difficulty."""
+
+    top_words = Analyzer.top_k(TOP_K_WORDS, 2, by="length", largest=False)
+
+    assert top_words["text"].to_list() == ["sol", "huevo"]
+
+
+@pytest.mark.parametrize("options", [{"k": -1}, {"by": "difficulty"}])
+def test_top_k_invalid(options):
+    """Test that invalid options are rejected."""
+
+    with pytest.raises(ValueError):
+        Analyzer.top_k(TOP_K_WORDS, **options)
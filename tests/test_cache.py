@@ -0,0 +1,154 @@
+import sqlite3
+
+import pandas as pd
+import pytest
+
+from wdiff.analyzer import Analyzer
+from wdiff.cache import ResultCache
+
+TEXTS = pd.Series(["huevo", "sol", "huevo", "llave"])
+
+
+@pytest.fixture
+def cache(tmp_path):
+    with ResultCache(tmp_path / "cache.db") as cache:
+        yield cache
+
+
+def test_get_and_put(cache):
+    """Test that cached features are found and the others are missing."""
+
+    assert cache.get(TEXTS, "length").tolist() == [-1, -1, -1, -1]
+
+    cache.put(TEXTS, "length", [5, 3, 5, 5])
+
+    assert cache.get(TEXTS, "length").tolist() == [5, 3, 5, 5]
+    assert cache.get(TEXTS, "silent_letters").tolist() == [-1, -1, -1, -1]
+    assert len(cache) == 3
+    assert cache.info() == {
+        "hits": 3,
+        "misses": 6,
+        "evictions": 0,
+        "size": 3,
+        "capacity": None,
+    }
+
+
+def test_put_features_separately(cache):
+    """Test that the features of a word are added to the same entry."""
+
+    cache.put(TEXTS[:1], "length", [5])
+    cache.put(TEXTS[:1], "silent_letters", [1])
+
+    assert len(cache) == 1
+    assert cache.get(TEXTS[:1], "length").tolist() == [5]
+    assert cache.get(TEXTS[:1], "silent_letters").tolist() == [1]
+
+
+def test_persistence(tmp_path):
+    """Test that the features are kept when the cache is opened again."""
+
+    with ResultCache(tmp_path / "cache.db", batch_size=1) as cache:
+        cache.put(TEXTS, "length", [5, 3, 5, 5])
+    with ResultCache(tmp_path / "cache.db") as cache:
+        assert cache.get(TEXTS, "length").tolist() == [5, 3, 5, 5]
+
+
+def test_other_rules_are_ignored(tmp_path):
+    """Test that features cached with other rules are not used."""
+
+    path = tmp_path / "cache.db"
+    with ResultCache(path) as cache:
+        cache.put(TEXTS, "length", [5, 3, 5, 5])
+    with sqlite3.connect(path) as connection:
+        connection.execute("UPDATE features SET fingerprint = 'other'")
+
+    with ResultCache(path, max_entries=1) as cache:
+        assert cache.get(TEXTS, "length").tolist() == [-1, -1, -1, -1]
+        cache.put(TEXTS[:1], "length", [5])
+        assert len(cache) == 1
+        assert cache.info()["evictions"] == 3
+
+
+def test_eviction(tmp_path):
+    """Test that the words used least recently are evicted first."""
+
+    path = tmp_path / "cache.db"
+    with ResultCache(path) as cache:
+        cache.put(["huevo", "sol"], "length", [5, 3])
+    with ResultCache(path, max_entries=2) as cache:
+        cache.get(pd.Series(["huevo"]), "length")
+        cache.put(["llave"], "length", [5])
+
+        assert cache.get(TEXTS, "length").tolist() == [5, -1, 5, 5]
+        assert cache.info()["evictions"] == 1
+
+
+def test_clear(cache):
+    """Test removing all the cached words."""
+
+    cache.put(TEXTS, "length", [5, 3, 5, 5])
+    cache.clear()
+
+    assert len(cache) == 0
+
+
+def test_invalid_feature(cache):
+    """Test that only the features can be cached."""
+
+    with pytest.raises(ValueError):
+        cache.get(TEXTS, "total_difficulty")
+
+
+@pytest.mark.parametrize("engine", ["word", "pandas", "numpy"])
+@pytest.mark.parametrize("deduplicate", [False, True])
+def test_analyzer_with_cache(tmp_path, engine, deduplicate):
+    """Test that analyses with a cold and a warm cache match the ones without it."""
+
+    words = ["huevo", "perro", "llave", "perro", "guitarra"]
+    expected = Analyzer(words)
+    expected.run_all_analyses()
+
+    for _ in range(2):
+        analyzer = Analyzer(
+            words, engine=engine, deduplicate=deduplicate, cache=tmp_path / "cache.db"
+        )
+        analyzer.run_all_analyses()
+        assert analyzer.results.equals(expected.results)
+
+    assert analyzer._cache.info()["misses"] == 0
+
+
+def test_analyzer_with_warm_cache_creates_no_words(tmp_path):
+    """Test that no word objects are created for the cached words."""
+
+    words = ["huevo", "perro", "guitarra"]
+    Analyzer(words, cache=tmp_path / "cache.db").run_all_analyses()
+
+    analyzer = Analyzer(words, cache=tmp_path / "cache.db", stats=True)
+    analyzer.run_all_analyses()
+
+    stages = [record["stage"] for record in analyzer.stats.records]
+    assert "create_word_objs" not in stages
+    assert analyzer.results["length"].to_list() == [5, 5, 8]
+
+
+def test_stream_opens_cache_once(tmp_path, monkeypatch):
+    """Test that a cache given as a path is opened once and closed after a stream."""
+
+    caches = []
+    init = ResultCache.__init__
+
+    def open_cache(cache, *args, **kwargs):
+        caches.append(cache)
+        init(cache, *args, **kwargs)
+
+    monkeypatch.setattr(ResultCache, "__init__", open_cache)
+    words = ["huevo", "perro", "llave", "guitarra", "sol"]
+
+    chunks = Analyzer.stream(words, chunksize=2, cache=tmp_path / "cache.db")
+
+    assert pd.concat(chunks)["length"].to_list() == [5, 5, 5, 8, 3]
+    assert len(caches) == 1
+    with pytest.raises(sqlite3.ProgrammingError):
+        len(caches[0])
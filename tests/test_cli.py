@@ -1,4 +1,5 @@
 """Tests for `wdiff`.cli module."""
+from pathlib import Path
 from typing import List
 
 import pytest
@@ -22,3 +23,174 @@ def test_command_line_interface(options: List[str], expected: str) -> None:
     result = runner.invoke(cli.main, options)
     assert result.exit_code == 0
     assert expected in result.output
+
+
+def test_analyze_lines() -> None:
+    """Test analyzing newline-delimited words from stdin."""
+    runner = CliRunner()
+    result = runner.invoke(
+        cli.main, ["analyze", "-", "--chunksize", "2"], input="huevo\n\nGuitarra\nsol\n"
+    )
+    assert result.exit_code == 0
+    assert result.output.splitlines() == [
+        "text,length,silent_letters,shared_phonemes,total_difficulty",
+        "huevo,5,1,1,7",
+        "guitarra,8,1,0,9",
+        "sol,3,0,1,4",
+    ]
+
+
+def test_analyze_csv_column(tmp_path: Path) -> None:
+    """Test analyzing a CSV column and writing the results to a file."""
+    input_path = tmp_path / "words.csv"
+    input_path.write_text("id,word\n1,huevo\n2,sol\n")
+    output_path = tmp_path / "results.csv"
+    runner = CliRunner()
+    result = runner.invoke(
+        cli.main,
+        [
+            "analyze",
+            str(input_path),
+            "--column",
+            "word",
+            "-a",
+            "length",
+            "-o",
+            str(output_path),
+        ],
+    )
+    assert result.exit_code == 0
+    assert output_path.read_text().splitlines() == [
+        "text,length",
+        "huevo,5",
+        "sol,3",
+    ]
+
+
+def test_analyze_invalid_word() -> None:
+    """Test that invalid words are reported as errors."""
+    runner = CliRunner()
+    result = runner.invoke(cli.main, ["analyze", "-"], input="huevo\nhuevo8\n")
+    assert result.exit_code == 1
+    assert "huevo8" in result.output
+
+
+def test_analyze_invalid_output(tmp_path: Path) -> None:
+    """Test that invalid words are skipped and written to another file."""
+    invalid_path = tmp_path / "invalid.csv"
+    runner = CliRunner()
+    result = runner.invoke(
+        cli.main,
+        ["analyze", "-", "-a", "length", "--chunksize", "2"]
+        + ["--invalid", str(invalid_path)],
+        input="huevo\nhuevo8\nsol\nsol!\n",
+    )
+    assert result.exit_code == 0
+    assert result.output.splitlines() == ["text,length", "huevo,5", "sol,3"]
+    assert invalid_path.read_text().splitlines() == [
+        "position,word,reason",
+        "1,huevo8,invalid characters: 8",
+        "3,sol!,invalid characters: !",
+    ]
+
+
+def test_analyze_jobs() -> None:
+    """Test analyzing the words with several processes."""
+    runner = CliRunner()
+    result = runner.invoke(
+        cli.main, ["analyze", "-", "--jobs", "2", "-a", "length"], input="huevo\nsol\n"
+    )
+    assert result.exit_code == 0
+    assert result.output.splitlines() == ["text,length", "huevo,5", "sol,3"]
+
+
+@pytest.mark.parametrize("jobs", ["0", "-2"])
+def test_analyze_invalid_jobs(jobs: str) -> None:
+    """Test that numbers of processes other than -1 or positive are rejected."""
+    runner = CliRunner()
+    result = runner.invoke(cli.main, ["analyze", "-", "--jobs", jobs], input="sol\n")
+    assert result.exit_code == 2
+    assert "must be -1 or a positive integer" in result.output
+
+
+def test_index_and_analyze(tmp_path: Path) -> None:
+    """Test building a lexicon index and analyzing words with it."""
+    index_path = tmp_path / "index"
+    runner = CliRunner()
+    result = runner.invoke(
+        cli.main, ["index", "-", str(index_path)], input="huevo\nsol\nhuevo\n"
+    )
+    assert result.exit_code == 0
+    assert result.output == f"2 words indexed in {index_path}\n"
+
+    result = runner.invoke(
+        cli.main,
+        ["analyze", "-", "--index", str(index_path)],
+        input="huevo\nguitarra\n",
+    )
+    assert result.exit_code == 0
+    assert result.output.splitlines()[1:] == ["huevo,5,1,1,7", "guitarra,8,1,0,9"]
+
+
+def test_analyze_missing_index(tmp_path: Path) -> None:
+    """Test that a missing index is reported."""
+    runner = CliRunner()
+    result = runner.invoke(
+        cli.main, ["analyze", "-", "--index", str(tmp_path)], input="huevo\n"
+    )
+    assert result.exit_code == 1
+    assert "is not a lexicon index" in result.output
+
+
+def test_top() -> None:
+    """Test finding the hardest and easiest words."""
+    runner = CliRunner()
+    words = "sol\nguitarra\nhuevo\nguitarra\nzapatos\nave\n"
+    result = runner.invoke(cli.main, ["top", "-", "-k", "2"], input=words)
+    assert result.exit_code == 0
+    assert result.output.splitlines() == [
+        "text,length,silent_letters,shared_phonemes,total_difficulty",
+        "guitarra,8,1,0,9",
+        "zapatos,7,0,2,9",
+    ]
+
+    result = runner.invoke(
+        cli.main, ["top", "-", "-k", "2", "--easiest", "--by", "length"], input=words
+    )
+    assert result.exit_code == 0
+    assert [line.split(",")[0] for line in result.output.splitlines()] == [
+        "text",
+        "sol",
+        "ave",
+    ]
+
+
+def test_analyze_cache(tmp_path: Path) -> None:
+    """Test that the features are cached across runs."""
+    cache_path = tmp_path / "cache.db"
+    runner = CliRunner()
+    outputs = [
+        runner.invoke(
+            cli.main, ["analyze", "-", "--cache", str(cache_path)], input="huevo\n"
+        ).output
+        for _ in range(2)
+    ]
+    assert outputs[0] == outputs[1]
+    assert outputs[0].splitlines()[1] == "huevo,5,1,1,7"
+    assert cache_path.exists()
+
+
+def test_analyze_closes_empty_cache(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that a new cache, which is empty, is closed."""
+    closed_caches = []
+    monkeypatch.setattr(
+        cli.ResultCache, "close", lambda cache: closed_caches.append(cache)
+    )
+    runner = CliRunner()
+    result = runner.invoke(
+        cli.main, ["analyze", "-", "--cache", str(tmp_path / "cache.db")], input=""
+    )
+    assert result.exit_code == 0
+    assert len(closed_caches) == 1
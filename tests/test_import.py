@@ -0,0 +1,84 @@
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+import wdiff
+from wdiff._lazy import lazy_import
+
+# cumulative import time in microseconds that the modules must stay under.
+# The budget is much larger than the measured time so that it only fails
+# when a heavy dependency is imported eagerly again.
+IMPORT_TIME_BUDGET = 250_000
+HEAVY_MODULES = ("pandas", "numpy", "docrep", "pyarrow")
+
+
+def _import_times(module):
+    """Import the module in a new interpreter and get the import times.
+
+    Returns a dict with the cumulative import time of each imported module
+    in microseconds.
+    """
+
+    env = dict(os.environ)
+    src = str(Path(wdiff.__file__).parents[1])
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [src, env.get("PYTHONPATH")]))
+    process = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        env=env,
+        check=True,
+    )
+
+    import_times = {}
+    for line in process.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line.split("|")
+        import_times[name.strip()] = int(cumulative)
+
+    return import_times
+
+
+@pytest.mark.parametrize("module", ["wdiff.word", "wdiff.analyzer", "wdiff.cli"])
+def test_import_does_not_load_heavy_modules(module):
+    """Test that importing the module doesn't load heavy dependencies."""
+
+    import_times = _import_times(module)
+
+    for heavy_module in HEAVY_MODULES:
+        assert heavy_module not in import_times
+
+
+@pytest.mark.parametrize("module", ["wdiff.word", "wdiff.analyzer", "wdiff.cli"])
+def test_import_time_budget(module):
+    """Test that importing the module stays under the time budget."""
+
+    import_times = _import_times(module)
+
+    assert import_times[module] < IMPORT_TIME_BUDGET
+
+
+def test_lazy_import_already_imported():
+    """Test that modules already imported are returned as they are."""
+
+    assert lazy_import("os") is os
+
+
+def test_lazy_import_submodule():
+    """Test that lazily imported submodules are bound to their package."""
+
+    module = lazy_import("wdiff.kernel")
+
+    assert wdiff.kernel is module
+    assert module.encode
+
+
+def test_lazy_import_missing_module():
+    """Test that missing modules raise an error right away."""
+
+    with pytest.raises(ModuleNotFoundError):
+        lazy_import("wdiff.missing_module")
@@ -0,0 +1,81 @@
+import pandas as pd
+import pytest
+
+from wdiff import kernel
+from wdiff.word import Word
+
+TEXTS = [
+    "perro",
+    "huevo",
+    "chihuahua",
+    "hispanohablante",
+    "panqueque",
+    "quisquilloso",
+    "huelguista",
+    "contigua",
+    "adolescencia",
+    "calabaza",
+    "observatorio",
+    "lluvia",
+    "lll",
+    "llll",
+    "yoyo",
+    "rey",
+    "jengibre",
+    "juguete",
+    "kiosco",
+    "cosquillas",
+    "canción",
+    "güiro",
+    "y",
+    "hoy muy",
+]
+
+
+@pytest.mark.parametrize(
+    "feature",
+    ["length", "silent_letters", "shared_phonemes"],
+)
+def test_compute_feature_matches_word(feature):
+    """Test that compute_feature gives the same results as the Word class."""
+
+    texts = pd.Series(TEXTS)
+    expected = [getattr(Word(text), feature) for text in TEXTS]
+
+    observed = kernel.compute_feature(texts, feature)
+
+    assert observed.to_list() == expected
+
+
+@pytest.mark.parametrize("dtype", [object, "string"])
+def test_encode(dtype):
+    """Test that encode pads the code points of the texts and keeps their lengths."""
+
+    # the first text is sliced out, so the texts do not start the array
+    texts = pd.Series(["perro", "ab", "ñ"], dtype=dtype).iloc[1:]
+
+    matrix, lengths = kernel.encode(texts)
+
+    assert matrix.tolist() == [[ord("a"), ord("b")], [ord("ñ"), kernel.PADDING]]
+    assert lengths.tolist() == [2, 1]
+
+
+def test_encode_empty():
+    """Test that no texts are encoded as an empty matrix."""
+
+    matrix, lengths = kernel.encode(pd.Series([], dtype=object))
+
+    assert matrix.shape == (0, 0)
+    assert lengths.shape == (0,)
+
+
+def test_compute_features():
+    """Test that compute_features gives the same results as compute_feature."""
+
+    texts = pd.Series(TEXTS, index=range(10, 10 + len(TEXTS)))
+
+    features = kernel.compute_features(texts, ["shared_phonemes", "length"])
+
+    assert list(features) == ["shared_phonemes", "length"]
+    for feature, values in features.items():
+        pd.testing.assert_series_equal(values, kernel.compute_feature(texts, feature))
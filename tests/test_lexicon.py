@@ -0,0 +1,158 @@
+import json
+
+import numpy as np
+import pytest
+
+from wdiff import lexicon
+from wdiff.analyzer import Analyzer
+from wdiff.lexicon import LexiconIndex, build_index, load_index, rules_fingerprint
+from wdiff.word import Word
+
+LEXICON = ["Huevo", "guitarra", "huevo", "ñandú", "llave", "sol8", ""]
+
+
+@pytest.fixture
+def index(tmp_path):
+    return build_index(LEXICON, tmp_path / "index")
+
+
+def test_build_index(index):
+    """Test that the valid words are stored once, sorted and memory-mapped."""
+
+    assert len(index) == 4
+    assert [text.decode() for text in index._texts] == [
+        "guitarra",
+        "huevo",
+        "llave",
+        "ñandú",
+    ]
+    assert isinstance(index.features["length"], np.memmap)
+    assert index.features["length"].dtype == np.uint16
+
+
+def test_find(index):
+    """Test that texts are found, including ones longer than any in the index."""
+
+    texts = lexicon.vectorized.normalize_texts(["llave", "perro", "guitarras" * 3])
+
+    assert index.find(texts).tolist() == [2, -1, -1]
+
+
+@pytest.mark.parametrize("text", ["huevo", "guitarra", "ñandú", "llave"])
+def test_lookup_matches_word(index, text):
+    """Test that the stored features are the ones of Word."""
+
+    lookups = index.lookup([text.upper()])
+    word = Word(text)
+
+    assert lookups.loc[0, "length"] == word.length
+    assert lookups.loc[0, "silent_letters"] == word.silent_letters
+    assert lookups.loc[0, "shared_phonemes"] == word.shared_phonemes
+
+
+def test_lookup_unknown_word(index):
+    """Test that the features of unknown words are missing."""
+
+    lookups = index.lookup(["perro"])
+
+    assert lookups.loc[0, ["length", "silent_letters"]].isna().all()
+
+
+def test_contains(index):
+    """Test checking whether a word is in the index."""
+
+    assert "Huevo" in index
+    assert "hue" not in index
+
+
+def test_word(index):
+    """Test that words in the index are created with their features."""
+
+    word = index.word("huevo")
+
+    assert word._silent_letters == 1
+    assert word.total_difficulty == 7
+    assert index.word("perro")._length is None
+
+
+def test_empty_index(tmp_path):
+    """Test that an empty lexicon creates an index where nothing is found."""
+
+    index = build_index([], tmp_path / "index")
+
+    assert len(index) == 0
+    assert "huevo" not in index
+
+
+def test_outdated_index(index):
+    """Test that an index built with other rules is rejected and rebuilt."""
+
+    metadata_path = index.path / "metadata.json"
+    metadata = json.loads(metadata_path.read_text())
+    metadata_path.write_text(json.dumps({**metadata, "fingerprint": "other"}))
+
+    with pytest.raises(ValueError):
+        LexiconIndex(index.path)
+    assert len(load_index(index.path, ["perro"])) == 1
+    assert json.loads(metadata_path.read_text())["fingerprint"] == rules_fingerprint()
+
+
+def test_missing_index(tmp_path):
+    """Test that loading a missing index fails unless it can be built."""
+
+    with pytest.raises(ValueError):
+        load_index(tmp_path / "index")
+    assert len(load_index(tmp_path / "index", LEXICON)) == 4
+
+
+@pytest.mark.parametrize("engine", ["word", "pandas", "numpy"])
+@pytest.mark.parametrize("deduplicate", [False, True])
+def test_analyzer_with_index(index, engine, deduplicate):
+    """Test that analyses with an index match the ones without it."""
+
+    words = ["huevo", "perro", "llave", "perro", "guitarra"]
+    analyzer = Analyzer(words, engine=engine, deduplicate=deduplicate, index=index)
+    analyzer.run_all_analyses()
+    expected = Analyzer(words)
+    expected.run_all_analyses()
+
+    assert analyzer.results.equals(expected.results)
+
+
+def test_analyzer_with_index_creates_unknown_words(index):
+    """Test that word objects are only created for the words not indexed."""
+
+    analyzer = Analyzer(["huevo", "perro", "llave", "perro"], index=index)
+    analyzer.run_all_analyses()
+
+    word_objs = analyzer._words["word_objs"]
+    assert word_objs.isna().to_list() == [True, False, True, False]
+    assert analyzer.results["length"].to_list() == [5, 5, 5, 5]
+
+
+def test_analyzer_with_index_path(index):
+    """Test that the index can be given as its directory."""
+
+    analyzer = Analyzer(["huevo"], index=index.path)
+    analyzer.check_length_difficulty()
+    analyzer.add_words(["sol"])
+
+    assert analyzer.results["length"].to_list() == [5, 3]
+
+
+def test_stream_with_index_path(index, monkeypatch):
+    """Test that an index given as its directory is loaded once for a stream."""
+
+    indexes = []
+    init = LexiconIndex.__init__
+
+    def load(index, path):
+        indexes.append(path)
+        init(index, path)
+
+    monkeypatch.setattr(LexiconIndex, "__init__", load)
+
+    chunks = Analyzer.stream(["huevo", "sol", "llave"], chunksize=1, index=index.path)
+
+    assert [len(chunk) for chunk in chunks] == [1, 1, 1]
+    assert indexes == [index.path]
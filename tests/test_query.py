@@ -0,0 +1,118 @@
+import pandas as pd
+import pytest
+
+from wdiff.analyzer import Analyzer
+from wdiff.query import DifficultyIndex
+
+WORDS = ["huevo", "guitarra", "sol", "perro", "llave", "queso", "casa", "ave"]
+
+
+@pytest.fixture
+def results():
+    analyzer = Analyzer(WORDS, engine="numpy")
+    analyzer.run_all_analyses()
+    return analyzer.results
+
+
+def _filter(results, **ranges):
+    """Filter the results with pandas to compare with the index."""
+    is_selected = pd.Series(True, index=results.index)
+    for feature, (low, high) in ranges.items():
+        is_selected &= results[feature].between(low, high)
+    return results[is_selected]
+
+
+@pytest.mark.parametrize(
+    "ranges",
+    [
+        {},
+        {"length": (4, 5)},
+        {"length": (4, 8), "total_difficulty": (5, 7)},
+        {"silent_letters": (1, 1), "shared_phonemes": (0, 1)},
+        {"length": (20, 30)},
+    ],
+)
+def test_select(results, ranges):
+    """Test that the selected words are the ones in the ranges."""
+
+    index = DifficultyIndex(results)
+    expected = _filter(results, **ranges)
+
+    pd.testing.assert_frame_equal(index.select(**ranges), expected)
+    assert index.count(**ranges) == len(expected)
+
+
+def test_exact_and_open_ranges(results):
+    """Test ranges given as a value or with open bounds."""
+
+    index = DifficultyIndex(results)
+
+    assert index.select(length=5)["text"].to_list() == [
+        "huevo",
+        "perro",
+        "llave",
+        "queso",
+    ]
+    assert index.select(length=(None, 3))["text"].to_list() == ["sol", "ave"]
+    assert index.select(length=(8, None))["text"].to_list() == ["guitarra"]
+
+
+def test_sample(results):
+    """Test that words are sampled in the ranges without replacement."""
+
+    index = DifficultyIndex(results, random_state=0)
+    sample = index.sample(3, length=(4, 8))
+
+    assert len(sample) == 3
+    assert sample.index.is_unique
+    assert sample["length"].between(4, 8).all()
+    assert len(index.sample(6, length=(4, 8))) == 6
+
+
+def test_sample_random_state(results):
+    """Test that samples are reproducible with a random state."""
+
+    index = DifficultyIndex(results)
+    first = index.sample(4, random_state=1)
+    second = index.sample(4, random_state=1)
+
+    pd.testing.assert_frame_equal(first, second)
+
+
+def test_sample_too_many_words(results):
+    """Test that sampling more words than those in the ranges fails."""
+
+    index = DifficultyIndex(results)
+
+    with pytest.raises(ValueError):
+        index.sample(7, length=(4, 8))
+
+
+def test_partial_results():
+    """Test that only the features in the results are indexed."""
+
+    analyzer = Analyzer(WORDS)
+    analyzer.check_length_difficulty()
+    index = DifficultyIndex(analyzer.results)
+
+    assert index.count(length=(3, 4)) == 3
+    with pytest.raises(ValueError):
+        index.count(total_difficulty=(1, 5))
+
+
+def test_results_without_features():
+    """Test that results without features can't be indexed."""
+
+    with pytest.raises(ValueError):
+        DifficultyIndex(pd.DataFrame({"text": WORDS}))
+
+
+def test_empty_results(results):
+    """Test that an index of no words selects nothing."""
+
+    index = DifficultyIndex(results.iloc[:0])
+
+    assert len(index) == 0
+    assert index.count(length=(1, 5)) == 0
+    assert index.select(length=(1, 5)).empty
+    assert index.sample(0).empty
@@ -0,0 +1,53 @@
+import pytest
+
+from wdiff.scanner import RULES, scan
+
+
+def count_rules_separately(text):
+    """Count each rule with its own str.count, as a reference."""
+
+    return {
+        "silent_u": sum(text.count(p) for p in ["que", "qui", "gue", "gui"]),
+        "silent_h": text.count("h") - text.count("ch"),
+        "shared_s": sum(text.count(p) for p in ["z", "s", "ci", "ce"]),
+        "shared_b": text.count("b") + text.count("v"),
+        "shared_y": text.count("ll") + text.count("y") - (text[-1] == "y"),
+        "shared_j": sum(text.count(p) for p in ["j", "ge", "gi"]),
+        "shared_k": sum(text.count(p) for p in ["k", "q", "ca", "co", "cu"]),
+    }
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "perro",
+        "chihuahua",
+        "hispanohablante",
+        "panqueque",
+        "quisquilloso",
+        "huelguista",
+        "adolescencia",
+        "observatorio",
+        "lluvia",
+        "lll",
+        "llll",
+        "yoyo",
+        "rey",
+        "y",
+        "jengibre",
+        "kiosco",
+        "cosquillas",
+        "güiro",
+        "hoy muy",
+    ],
+)
+def test_scan_matches_separate_counts(text):
+    """Test that scan gives the same counts as counting each rule separately."""
+
+    assert scan(text) == count_rules_separately(text)
+
+
+def test_scan_returns_all_rules():
+    """Test that scan returns a count for every rule."""
+
+    assert tuple(scan("perro")) == RULES
@@ -0,0 +1,127 @@
+import json
+import tracemalloc
+
+import pytest
+
+from wdiff.stats import Stats
+
+
+def test_measure_records_stage():
+    """Test that a stage is recorded with its time, rows and memory."""
+
+    stats = Stats()
+    with stats.measure("stage") as record:
+        record["rows"] = 10
+        memory = [0] * 100_000
+
+    record = stats.records[0]
+    assert record["stage"] == "stage"
+    assert record["parent"] is None
+    assert record["rows"] == 10
+    assert record["seconds"] > 0
+    assert record["rows_per_second"] == pytest.approx(10 / record["seconds"])
+    assert record["peak_memory"] >= len(memory) * 8
+    assert not tracemalloc.is_tracing()
+
+
+def test_measure_nested_stages():
+    """Test that nested stages reference their parent and count in its memory."""
+
+    stats = Stats()
+    with stats.measure("outer"):
+        with stats.measure("inner"):
+            memory = [0] * 100_000
+        del memory
+
+    inner, outer = stats.records
+    assert inner["parent"] == "outer"
+    assert outer["parent"] is None
+    assert outer["peak_memory"] >= inner["peak_memory"] >= 800_000
+    assert outer["seconds"] >= inner["seconds"]
+
+
+def test_measure_without_memory():
+    """Test that memory is not tracked when track_memory is False."""
+
+    stats = Stats(track_memory=False)
+    with stats.measure("stage"):
+        pass
+
+    assert "peak_memory" not in stats.records[0]
+    assert not tracemalloc.is_tracing()
+
+
+def test_measure_keeps_tracing_started_by_user():
+    """Test that tracemalloc is not stopped if it was already tracing."""
+
+    tracemalloc.start()
+    try:
+        with Stats().measure("stage"):
+            pass
+        assert tracemalloc.is_tracing()
+    finally:
+        tracemalloc.stop()
+
+
+def test_measure_failed_stage():
+    """Test that stages that fail are not recorded."""
+
+    stats = Stats()
+    with pytest.raises(ValueError):
+        with stats.measure("stage"):
+            raise ValueError
+
+    assert stats.records == []
+    assert not tracemalloc.is_tracing()
+
+
+def test_callback():
+    """Test that the callback receives each record when its stage ends."""
+
+    records = []
+    stats = Stats(callback=records.append)
+    with stats.measure("stage"):
+        pass
+
+    assert records == stats.records
+
+
+def test_summary():
+    """Test that the records are summarized by stage."""
+
+    stats = Stats()
+    for rows in [1, 2]:
+        with stats.measure("stage") as record:
+            record["rows"] = rows
+
+    summary = stats.summary()["stage"]
+    assert summary["calls"] == 2
+    assert summary["rows"] == 3
+    assert summary["seconds"] == pytest.approx(
+        sum(record["seconds"] for record in stats.records)
+    )
+    assert summary["peak_memory"] == max(
+        record["peak_memory"] for record in stats.records
+    )
+
+
+def test_to_json():
+    """Test exporting the records and their summary as JSON."""
+
+    stats = Stats()
+    with stats.measure("stage"):
+        pass
+
+    assert json.loads(stats.to_json()) == stats.to_dict()
+    assert list(stats.to_dict()) == ["records", "summary"]
+
+
+def test_clear():
+    """Test removing the records."""
+
+    stats = Stats()
+    with stats.measure("stage"):
+        pass
+    stats.clear()
+
+    assert stats.to_dict() == {"records": [], "summary": {}}
@@ -0,0 +1,97 @@
+import pandas as pd
+import pytest
+
+from wdiff import vectorized
+from wdiff.word import Word
+
+TEXTS = [
+    "perro",
+    "huevo",
+    "chihuahua",
+    "hispanohablante",
+    "panqueque",
+    "quisquilloso",
+    "huelguista",
+    "contigua",
+    "adolescencia",
+    "calabaza",
+    "observatorio",
+    "lluvia",
+    "yoyo",
+    "rey",
+    "jengibre",
+    "juguete",
+    "kiosco",
+    "cosquillas",
+    "canción",
+    "güiro",
+    "y",
+    "hoy muy",
+]
+
+
+@pytest.mark.parametrize(
+    "feature",
+    ["length", "silent_letters", "shared_phonemes"],
+)
+def test_compute_feature_matches_word(feature):
+    """Test that compute_feature gives the same results as the Word class."""
+
+    texts = pd.Series(TEXTS)
+    expected = [getattr(Word(text), feature) for text in TEXTS]
+
+    observed = vectorized.compute_feature(texts, feature)
+
+    assert observed.to_list() == expected
+
+
+@pytest.mark.parametrize(
+    ("text_original", "text_expected"),
+    [
+        ("perro", "perro"),
+        ("PErrO", "perro"),
+        ("   perro   ", "perro"),
+        ("  PErrO", "perro"),
+    ],
+)
+def test_normalize_texts(text_original, text_expected):
+    """Test the normalize_texts with different cases."""
+
+    texts_observed = vectorized.normalize_texts([text_original])
+
+    assert texts_observed.to_list() == [text_expected]
+
+
+@pytest.mark.parametrize(
+    "texts",
+    [
+        ["perro", ""],
+        ["perro8", "gato"],
+        ["perro{"],
+    ],
+)
+def test_validate_texts_invalid(texts):
+    """Test that validate_texts raises when a text is invalid."""
+
+    texts = vectorized.normalize_texts(texts)
+
+    with pytest.raises(ValueError):
+        vectorized.validate_texts(texts)
+
+
+def test_validate_texts_valid():
+    """Test that validate_texts accepts valid texts."""
+
+    texts = vectorized.normalize_texts(["perro", "canción", "güiro", "hoy muy"])
+
+    vectorized.validate_texts(texts)
+
+
+def test_find_invalid_texts():
+    """Test that find_invalid_texts flags each invalid text."""
+
+    texts = vectorized.normalize_texts(["perro", "", "perro8", None, "canción"])
+
+    is_invalid = vectorized.find_invalid_texts(texts)
+
+    assert is_invalid.to_list() == [False, True, True, True, False]
@@ -1,6 +1,8 @@
+import sys
+
 import pytest
 
-from wdiff.word import Word
+from wdiff.word import Word, WordCache, word_cache
 
 
 @pytest.mark.parametrize(
@@ -305,3 +307,75 @@ def test_word_contains_invalid_character(text, expected):
 
     word = Word("ejemplo")
     assert word._word_contains_invalid_character(text) == expected
+
+
+def test_of_returns_shared_analyzed_word():
+    """Test that Word.of returns the same analyzed word for the same text."""
+
+    word_cache.clear()
+
+    word = Word.of("guitarra")
+
+    assert word is Word.of("guitarra")
+    assert isinstance(word, Word)
+    assert word._total_difficulty == 9
+    assert word_cache.info()["hits"] == 1
+    assert word_cache.info()["misses"] == 1
+
+
+def test_of_word_is_immutable():
+    """Test that the words returned by Word.of cannot be modified."""
+
+    word = Word.of("guitarra")
+
+    with pytest.raises(AttributeError):
+        word._length = 1
+
+
+def test_word_cache_evicts_least_recently_used():
+    """Test that WordCache evicts the least recently used words."""
+
+    cache = WordCache(capacity=2)
+    perro = cache.get("perro")
+    cache.get("gato")
+    cache.get("perro")
+    cache.get("oso")
+
+    assert cache.info() == {
+        "hits": 1,
+        "misses": 3,
+        "evictions": 1,
+        "size": 2,
+        "capacity": 2,
+    }
+    assert cache.get("perro") is perro
+
+    cache.capacity = 1
+
+    assert len(cache) == 1
+    assert cache.info()["evictions"] == 2
+
+
+def test_word_cache_invalid_word():
+    """Test that invalid words are not cached."""
+
+    cache = WordCache()
+
+    with pytest.raises(ValueError):
+        cache.get("perro8")
+    assert len(cache) == 0
+
+
+def test_word_size():
+    """Test that words are compact: no __dict__ and a small fixed size."""
+
+    word = Word("guitarra")
+    # the features are computed first, so their storage is included
+    assert word.length == 8
+    assert word.silent_letters == 1
+    assert word.shared_phonemes == 0
+    assert word.total_difficulty == 9
+
+    assert not hasattr(word, "__dict__")
+    assert sys.getsizeof(word) <= 96
+    assert sys.getsizeof(word) + sys.getsizeof(word._rule_counts) <= 200
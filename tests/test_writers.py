@@ -0,0 +1,173 @@
+import sqlite3
+
+import pandas as pd
+import pytest
+
+from wdiff.writers import ResultsWriter, compact_dtypes, write_results
+
+RESULTS = pd.DataFrame(
+    {
+        "text": ["huevo", "guitarra"],
+        "length": [5, 8],
+        "silent_letters": [1, 1],
+        "shared_phonemes": [1, 0],
+        "total_difficulty": [7, 9],
+    }
+)
+
+
+def test_compact_dtypes():
+    """Test that the features are converted to compact dtypes."""
+
+    results = compact_dtypes(RESULTS)
+
+    assert results["length"].dtype == "uint16"
+    assert results["total_difficulty"].dtype == "uint16"
+    assert results["length"].to_list() == [5, 8]
+
+
+def test_compact_dtypes_too_large():
+    """Test that features that don't fit in the compact dtype are rejected."""
+
+    results = RESULTS.assign(length=[5, 100000])
+
+    with pytest.raises(ValueError):
+        compact_dtypes(results)
+
+
+def test_compact_dtypes_override():
+    """Test that the dtype of a feature can be overridden."""
+
+    results = compact_dtypes(
+        RESULTS.assign(total_difficulty=[-7, 9]), {"total_difficulty": "int32"}
+    )
+
+    assert results["total_difficulty"].dtype == "int32"
+    assert results["total_difficulty"].to_list() == [-7, 9]
+
+
+def test_compact_dtypes_too_small():
+    """Test that negative features are rejected by unsigned dtypes."""
+
+    results = RESULTS.assign(total_difficulty=[-7, 9])
+
+    with pytest.raises(ValueError):
+        compact_dtypes(results)
+
+
+@pytest.mark.parametrize(
+    ("file_format", "read"),
+    [
+        ("csv", pd.read_csv),
+        ("csv.gz", pd.read_csv),
+        ("csv.zst", pd.read_csv),
+        ("parquet", pd.read_parquet),
+        ("feather", pd.read_feather),
+        ("arrow", pd.read_feather),
+    ],
+)
+def test_results_writer_chunks(tmp_path, file_format, read):
+    """Test that all chunks are written to the file in every format."""
+
+    if file_format in ("parquet", "feather", "arrow"):
+        pytest.importorskip("pyarrow")
+    if file_format == "csv.zst":
+        pytest.importorskip("zstandard")
+
+    with ResultsWriter(tmp_path / "results", file_format) as writer:
+        writer.write(RESULTS.iloc[:1])
+        writer.write(RESULTS.iloc[1:])
+
+    saved_results = read(writer.path)
+    pd.testing.assert_frame_equal(
+        saved_results, RESULTS, check_dtype=False, check_index_type=False
+    )
+
+
+def test_write_results_columns(tmp_path):
+    """Test that columns can be read separately from parquet files."""
+
+    pytest.importorskip("pyarrow")
+
+    write_results(RESULTS, tmp_path / "results", "parquet")
+    saved_results = pd.read_parquet(tmp_path / "results.parquet", columns=["length"])
+
+    assert saved_results["length"].dtype == "uint16"
+    assert saved_results["length"].to_list() == [5, 8]
+
+
+@pytest.mark.parametrize(
+    ("file_format", "append"),
+    [("xlsx", False), ("parquet", True)],
+)
+def test_results_writer_invalid(tmp_path, file_format, append):
+    """Test that invalid formats and appending to columnar files are rejected."""
+
+    with pytest.raises(ValueError):
+        ResultsWriter(tmp_path / "results", file_format, append)
+
+
+def read_sqlite(path):
+    """Read the results table of a SQLite file."""
+
+    with sqlite3.connect(path) as connection:
+        return pd.read_sql(
+            "SELECT * FROM results ORDER BY position", connection, index_col="position"
+        )
+
+
+def test_results_writer_sqlite(tmp_path):
+    """Test that the chunks are written to an indexed SQLite table."""
+
+    with ResultsWriter(tmp_path / "results", "sqlite", batch_size=1) as writer:
+        writer.write(RESULTS.iloc[:1])
+        writer.write(RESULTS.iloc[1:])
+
+    saved_results = read_sqlite(writer.path)
+    with sqlite3.connect(writer.path) as connection:
+        indexes = {row[1] for row in connection.execute("PRAGMA index_list(results)")}
+
+    pd.testing.assert_frame_equal(
+        saved_results, RESULTS, check_dtype=False, check_names=False
+    )
+    assert indexes == {"results_text", "results_total_difficulty"}
+
+
+def test_results_writer_sqlite_upsert(tmp_path):
+    """Test that appended rows replace the rows with the same position."""
+
+    write_results(RESULTS, tmp_path / "results", "sqlite")
+    new_results = RESULTS.assign(length=[6, 9]).set_axis([1, 2])
+
+    with ResultsWriter(tmp_path / "results", "sqlite", append=True) as writer:
+        assert writer.next_position() == 2
+        writer.write(new_results)
+
+    saved_results = read_sqlite(writer.path)
+
+    assert saved_results.index.to_list() == [0, 1, 2]
+    assert saved_results["length"].to_list() == [5, 6, 9]
+
+
+def test_results_writer_sqlite_overwrite(tmp_path):
+    """Test that the table is replaced unless the results are appended."""
+
+    write_results(RESULTS, tmp_path / "results", "sqlite")
+    write_results(RESULTS[["text", "length"]].iloc[:1], tmp_path / "results", "sqlite")
+
+    saved_results = read_sqlite(tmp_path / "results.sqlite")
+
+    assert saved_results.columns.to_list() == ["text", "length"]
+    assert len(saved_results) == 1
+
+
+def test_write_results_sqlite_append(tmp_path):
+    """Test that appended results are added after the rows of the table."""
+
+    write_results(RESULTS, tmp_path / "results", "sqlite")
+    write_results(RESULTS, tmp_path / "results", "sqlite", append=True)
+
+    saved_results = read_sqlite(tmp_path / "results.sqlite")
+
+    assert saved_results.index.to_list() == [0, 1, 2, 3]
+    assert saved_results["text"].to_list() == ["huevo", "guitarra"] * 2